@@ -0,0 +1,65 @@
+"""Store meal_type/feedback_type as SmallInteger codes (PostgreSQL only)
+
+meals.meal_type, guests.meal_type and meal_feedbacks.feedback_type held a
+handful of known values as VARCHAR. The models now map them through
+CodedString, the same 2-byte coded representation already used for
+Meal.status: narrower rows and indexes, integer comparisons on the
+grouping queries (e.g. meal_type_distribution). Codes follow the
+declaration order in app/models/user.py, starting at 1.
+
+Revision ID: coded_enum_columns
+Revises: updated_at_triggers
+Create Date: 2025-08-30 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'coded_enum_columns'
+down_revision = 'updated_at_triggers'
+branch_labels = None
+depends_on = None
+
+# (table, column, values in code order)
+CODED_COLUMNS = (
+    ('meals', 'meal_type', ('breakfast', 'lunch', 'dinner', 'snack')),
+    ('guests', 'meal_type', ('breakfast', 'lunch', 'dinner', 'all')),
+    ('meal_feedbacks', 'feedback_type', ('like', 'dislike', 'comment')),
+)
+
+
+def _case(column, values):
+    whens = ' '.join(
+        f"WHEN '{value}' THEN {code}"
+        for code, value in enumerate(values, start=1)
+    )
+    return f"(CASE {column} {whens} END)::smallint"
+
+
+def _reverse_case(column, values):
+    whens = ' '.join(
+        f"WHEN {code} THEN '{value}'"
+        for code, value in enumerate(values, start=1)
+    )
+    return f"(CASE {column} {whens} END)"
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        # SQLite development databases are rebuilt from the models
+        return
+    for table, column, values in CODED_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE smallint "
+            f"USING {_case(column, values)}"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, column, values in CODED_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar(50) "
+            f"USING {_reverse_case(column, values)}"
+        )
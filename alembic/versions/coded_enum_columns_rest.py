@@ -0,0 +1,74 @@
+"""Convert the remaining CodedString columns to SmallInteger codes (PostgreSQL only)
+
+The coded_enum_columns revision only covered meal_type/feedback_type;
+the preference_level, severity, stock priority and meal status columns
+were recoded on the models without a matching schema change, leaving
+them VARCHAR on PostgreSQL while the ORM binds integer codes. This
+applies the same ALTER ... TYPE smallint USING CASE conversion to the
+rest. Codes follow the declaration order in app/models/user.py,
+starting at 1.
+
+Revision ID: coded_enum_columns_rest
+Revises: stock_analytics_indexes
+Create Date: 2026-08-30 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'coded_enum_columns_rest'
+down_revision = 'stock_analytics_indexes'
+branch_labels = None
+depends_on = None
+
+# (table, column, values in code order)
+CODED_COLUMNS = (
+    ('user_cuisines', 'preference_level', ('mandatory', 'preferred', 'optional')),
+    ('user_meat_preferences', 'preference_level', ('love', 'like', 'neutral', 'dislike')),
+    ('user_meal_styles', 'preference_level', ('love', 'like', 'neutral', 'avoid')),
+    ('user_festival_preferences', 'preference_level', ('celebrate', 'observe', 'ignore')),
+    ('user_health_conditions', 'severity', ('mild', 'moderate', 'severe')),
+    ('user_vitamin_deficiencies', 'severity', ('mild', 'moderate', 'severe')),
+    ('user_special_needs', 'severity', ('mild', 'moderate', 'severe')),
+    ('stocks', 'priority_level',
+     ('luxury', 'nice_to_have', 'important', 'essential', 'urgent', 'critical')),
+    ('stock_alerts', 'priority', ('low', 'medium', 'high', 'critical')),
+    ('meals', 'status', ('planned', 'approved', 'cooking', 'completed', 'cancelled')),
+)
+
+
+def _case(column, values):
+    whens = ' '.join(
+        f"WHEN '{value}' THEN {code}"
+        for code, value in enumerate(values, start=1)
+    )
+    return f"(CASE {column} {whens} END)::smallint"
+
+
+def _reverse_case(column, values):
+    whens = ' '.join(
+        f"WHEN {code} THEN '{value}'"
+        for code, value in enumerate(values, start=1)
+    )
+    return f"(CASE {column} {whens} END)"
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        # SQLite development databases are rebuilt from the models
+        return
+    for table, column, values in CODED_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE smallint "
+            f"USING {_case(column, values)}"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, column, values in CODED_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar(50) "
+            f"USING {_reverse_case(column, values)}"
+        )
@@ -0,0 +1,44 @@
+"""Index the frequently-joined foreign key columns
+
+PostgreSQL does not index FK columns automatically, so member listings,
+stock/meal owner joins and parent-delete cascade scans were sequential.
+The composite indexes added earlier already cover guests.family_id,
+meal_feedbacks.meal_id/user_id and vacations.user_id/family_id as
+leading columns; this revision indexes the remaining hot FKs, matching
+the index=True flags now on the models.
+
+Revision ID: fk_indexes
+Revises: portion_ratio_check
+Create Date: 2025-08-30 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'fk_indexes'
+down_revision = 'portion_ratio_check'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ('ix_users_family_id', 'users', 'family_id'),
+    ('ix_family_memberships_user_id', 'family_memberships', 'user_id'),
+    ('ix_family_guest_preferences_family_id', 'family_guest_preferences', 'family_id'),
+    ('ix_pets_user_id', 'pets', 'user_id'),
+    ('ix_stocks_user_id', 'stocks', 'user_id'),
+    ('ix_stocks_family_id', 'stocks', 'family_id'),
+    ('ix_meals_user_id', 'meals', 'user_id'),
+    ('ix_meals_family_id', 'meals', 'family_id'),
+    ('ix_snacks_user_id', 'snacks', 'user_id'),
+    ('ix_snacks_family_id', 'snacks', 'family_id'),
+)
+
+
+def upgrade() -> None:
+    for name, table, column in INDEXES:
+        op.create_index(name, table, [column])
+
+
+def downgrade() -> None:
+    for name, table, _ in INDEXES:
+        op.drop_index(name)
@@ -0,0 +1,48 @@
+"""Convert guest/vacation JSON-string Text columns to native JSON
+
+guests.meal_preferences and vacations.external_meals stored JSON as
+Text, forcing json.loads/dumps in application code and full scans for
+any content filter. Native JSONB (PostgreSQL) parses in the driver and
+supports GIN containment indexes.
+
+Revision ID: json_columns_guest_vacation
+Revises: merge_family_membership
+Create Date: 2025-08-30 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'json_columns_guest_vacation'
+down_revision = 'merge_family_membership'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Switch the Text JSON-string columns to jsonb (PostgreSQL only)"""
+    if op.get_bind().dialect.name != 'postgresql':
+        # SQLite stores JSON as text already; the model type change suffices
+        return
+
+    op.execute(
+        "ALTER TABLE guests ALTER COLUMN meal_preferences TYPE jsonb "
+        "USING meal_preferences::jsonb"
+    )
+    op.execute(
+        "ALTER TABLE vacations ALTER COLUMN external_meals TYPE jsonb "
+        "USING external_meals::jsonb"
+    )
+    op.execute(
+        "CREATE INDEX ix_guest_meal_pref_gin ON guests USING gin (meal_preferences)"
+    )
+
+
+def downgrade() -> None:
+    """Revert to Text columns"""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("DROP INDEX ix_guest_meal_pref_gin")
+    op.execute("ALTER TABLE guests ALTER COLUMN meal_preferences TYPE text")
+    op.execute("ALTER TABLE vacations ALTER COLUMN external_meals TYPE text")
@@ -0,0 +1,57 @@
+"""Promote composite primary keys on the pure junction tables (PostgreSQL only)
+
+The junction models dropped their surrogate id and declare
+(user_id, <lookup>_id) as the primary key, but the tables were never
+altered: PostgreSQL still carried the old id PK and no uniqueness on
+the pair, so the identity the ORM relies on was unenforced. Dedupe any
+accumulated pairs (lowest id wins), drop the surrogate, and promote the
+composite key. family_member_priorities/family_meal_partitions need no
+treatment here - merge_family_membership already rebuilt them into
+family_memberships with the composite key.
+
+Revision ID: junction_composite_pks
+Revises: pack_office_chef_schedules
+Create Date: 2026-08-30 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'junction_composite_pks'
+down_revision = 'pack_office_chef_schedules'
+branch_labels = None
+depends_on = None
+
+# (table, composite key columns)
+JUNCTION_TABLES = (
+    ('user_addresses', ('user_id', 'address_id')),
+    ('user_cuisines', ('user_id', 'cuisine_id')),
+    ('user_meat_preferences', ('user_id', 'meat_type_id')),
+    ('user_meal_styles', ('user_id', 'meal_style_id')),
+    ('user_festival_preferences', ('user_id', 'festival_id')),
+    ('user_meal_criteria', ('user_id', 'criteria_id')),
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        # SQLite development databases are rebuilt from the models
+        return
+    for table, key in JUNCTION_TABLES:
+        match = ' AND '.join(f"a.{column} = b.{column}" for column in key)
+        op.execute(
+            f"DELETE FROM {table} a USING {table} b "
+            f"WHERE a.id > b.id AND {match}"
+        )
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT {table}_pkey")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN id")
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY ({', '.join(key)})")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, _ in JUNCTION_TABLES:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT {table}_pkey")
+        op.execute(f"ALTER TABLE {table} ADD COLUMN id serial")
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id)")
@@ -0,0 +1,93 @@
+"""Materialize the meal analytics aggregates
+
+The analytics endpoint re-runs a full GROUP BY over meals on every
+request. This view pre-aggregates everything the endpoint serves —
+totals, average rating, favorite/least-favorite names, nutritional sums
+and the meal-type distribution — per user and per family scope, so the
+no-date-range request becomes a single indexed row fetch. The unique
+index on (scope, scope_id) is what allows REFRESH ... CONCURRENTLY.
+
+meal_type is stored as its smallint code here; the endpoint decodes it
+back to the label.
+
+Revision ID: meal_analytics_mv
+Revises: fk_indexes
+Create Date: 2025-08-30 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'meal_analytics_mv'
+down_revision = 'fk_indexes'
+branch_labels = None
+depends_on = None
+
+CREATE_MV = """
+CREATE MATERIALIZED VIEW meal_analytics_mv AS
+WITH scoped AS (
+    SELECT 'user' AS scope, user_id AS scope_id, name, meal_type, rating,
+           total_calories, total_protein, total_carbs, total_fat
+    FROM meals
+    UNION ALL
+    SELECT 'family', family_id, name, meal_type, rating,
+           total_calories, total_protein, total_carbs, total_fat
+    FROM meals WHERE family_id IS NOT NULL
+),
+totals AS (
+    SELECT scope, scope_id,
+           count(*) AS total_meals,
+           coalesce(avg(rating), 0) AS average_rating,
+           sum(coalesce(total_calories, 0)) AS total_calories,
+           sum(coalesce(total_protein, 0)) AS total_protein,
+           sum(coalesce(total_carbs, 0)) AS total_carbs,
+           sum(coalesce(total_fat, 0)) AS total_fat
+    FROM scoped GROUP BY 1, 2
+),
+type_dist AS (
+    SELECT scope, scope_id,
+           jsonb_object_agg(meal_type::text, cnt) AS meal_type_distribution
+    FROM (
+        SELECT scope, scope_id, meal_type, count(*) AS cnt
+        FROM scoped GROUP BY 1, 2, 3
+    ) t GROUP BY 1, 2
+),
+name_ratings AS (
+    SELECT scope, scope_id, name, avg(rating) AS avg_rating
+    FROM scoped WHERE rating IS NOT NULL GROUP BY 1, 2, 3
+),
+favorites AS (
+    SELECT scope, scope_id,
+           jsonb_agg(name) FILTER (WHERE avg_rating >= 4) AS favorite_meals,
+           jsonb_agg(name) FILTER (WHERE avg_rating <= 2) AS least_favorite_meals
+    FROM name_ratings GROUP BY 1, 2
+)
+SELECT t.scope, t.scope_id, t.total_meals, t.average_rating,
+       t.total_calories, t.total_protein, t.total_carbs, t.total_fat,
+       d.meal_type_distribution,
+       coalesce(f.favorite_meals, '[]'::jsonb) AS favorite_meals,
+       coalesce(f.least_favorite_meals, '[]'::jsonb) AS least_favorite_meals
+FROM totals t
+JOIN type_dist d ON d.scope = t.scope AND d.scope_id = t.scope_id
+LEFT JOIN favorites f ON f.scope = t.scope AND f.scope_id = t.scope_id
+"""
+
+
+def upgrade() -> None:
+    # Materialized views are PostgreSQL-only; dev/test SQLite keeps the
+    # live aggregation path.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(CREATE_MV)
+    op.execute(
+        "CREATE UNIQUE INDEX ix_meal_analytics_mv_scope "
+        "ON meal_analytics_mv (scope, scope_id)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS meal_analytics_mv")
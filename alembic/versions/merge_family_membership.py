@@ -0,0 +1,80 @@
+"""Merge family_member_priorities and family_meal_partitions into family_memberships
+
+Both tables keyed on (family_id, user_id) and stored a single scalar
+each (priority_rank, portion_ratio). Meal-planning hot paths read both
+values for every family member, paying two joins where one suffices.
+
+Revision ID: merge_family_membership
+Revises: partition_time_series
+Create Date: 2025-08-30 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'merge_family_membership'
+down_revision = 'partition_time_series'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create family_memberships and fold both source tables into it"""
+
+    op.create_table(
+        'family_memberships',
+        sa.Column('family_id', sa.Integer(), sa.ForeignKey('families.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), primary_key=True),
+        sa.Column('priority_rank', sa.Integer(), nullable=True),
+        sa.Column('portion_ratio', sa.Float(), nullable=False, server_default='1.0'),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+
+    op.execute("""
+        INSERT INTO family_memberships (family_id, user_id, priority_rank, portion_ratio)
+        SELECT COALESCE(p.family_id, m.family_id),
+               COALESCE(p.user_id, m.user_id),
+               p.priority_rank,
+               COALESCE(m.portion_ratio, 1.0)
+        FROM family_member_priorities p
+        FULL OUTER JOIN family_meal_partitions m
+            ON m.family_id = p.family_id AND m.user_id = p.user_id
+    """)
+
+    op.drop_table('family_member_priorities')
+    op.drop_table('family_meal_partitions')
+
+
+def downgrade() -> None:
+    """Split family_memberships back into the two single-value tables"""
+
+    op.create_table(
+        'family_member_priorities',
+        sa.Column('family_id', sa.Integer(), sa.ForeignKey('families.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), primary_key=True),
+        sa.Column('priority_rank', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+    op.create_table(
+        'family_meal_partitions',
+        sa.Column('family_id', sa.Integer(), sa.ForeignKey('families.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), primary_key=True),
+        sa.Column('portion_ratio', sa.Float(), nullable=False, server_default='1.0'),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+
+    op.execute("""
+        INSERT INTO family_member_priorities (family_id, user_id, priority_rank)
+        SELECT family_id, user_id, priority_rank
+        FROM family_memberships WHERE priority_rank IS NOT NULL
+    """)
+    op.execute("""
+        INSERT INTO family_meal_partitions (family_id, user_id, portion_ratio)
+        SELECT family_id, user_id, portion_ratio FROM family_memberships
+    """)
+
+    op.drop_table('family_memberships')
@@ -0,0 +1,51 @@
+"""Store the HH:MM time-of-day columns as integer minutes (PostgreSQL only)
+
+users.meal_timing_preference, meals.planned_time, snacks.preferred_time
+and guests.meal_timing moved to the MinutesOfDay decorator, which binds
+minutes past midnight into a SmallInteger, but the columns were never
+converted and stayed VARCHAR(10) on PostgreSQL. Split the stored
+"HH:MM" strings into minutes on upgrade and format them back on
+downgrade.
+
+Revision ID: minutes_of_day_columns
+Revises: coded_enum_columns_rest
+Create Date: 2026-08-30 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'minutes_of_day_columns'
+down_revision = 'coded_enum_columns_rest'
+branch_labels = None
+depends_on = None
+
+MINUTE_COLUMNS = (
+    ('users', 'meal_timing_preference'),
+    ('meals', 'planned_time'),
+    ('snacks', 'preferred_time'),
+    ('guests', 'meal_timing'),
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        # SQLite development databases are rebuilt from the models
+        return
+    for table, column in MINUTE_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE smallint "
+            f"USING (split_part({column}, ':', 1)::int * 60 "
+            f"+ split_part({column}, ':', 2)::int)::smallint"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, column in MINUTE_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar(10) "
+            f"USING to_char(({column} / 60), 'FM00') || ':' "
+            f"|| to_char(({column} % 60), 'FM00')"
+        )
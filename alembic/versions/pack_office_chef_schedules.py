@@ -0,0 +1,129 @@
+"""Rebuild office_schedules and chef_availability to the packed model shapes
+
+The models pack office schedules into one row per user with per-meal
+weekday bitmasks and key chef_availability by (user_id, day_of_week),
+but no migration ever reshaped the tables, so on PostgreSQL the mask
+columns do not exist and every OfficeSchedule query fails. Rebuild both
+tables the way merge_family_membership does: create the new shape, fold
+the old rows in, then swap.
+
+Revision ID: pack_office_chef_schedules
+Revises: minutes_of_day_columns
+Create Date: 2026-08-30 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'pack_office_chef_schedules'
+down_revision = 'minutes_of_day_columns'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Fold the per-day rows into the packed per-user shapes"""
+
+    op.create_table(
+        'office_schedules_packed',
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('breakfast_mask', sa.SmallInteger(), nullable=False, server_default='0'),
+        sa.Column('lunch_mask', sa.SmallInteger(), nullable=False, server_default='0'),
+        sa.Column('dinner_mask', sa.SmallInteger(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+    op.execute("""
+        INSERT INTO office_schedules_packed
+            (user_id, breakfast_mask, lunch_mask, dinner_mask)
+        SELECT user_id,
+               SUM(CASE WHEN needs_breakfast THEN 1 << day_of_week ELSE 0 END),
+               SUM(CASE WHEN needs_lunch THEN 1 << day_of_week ELSE 0 END),
+               SUM(CASE WHEN needs_dinner THEN 1 << day_of_week ELSE 0 END)
+        FROM office_schedules
+        GROUP BY user_id
+    """)
+    op.drop_table('office_schedules')
+    op.rename_table('office_schedules_packed', 'office_schedules')
+
+    op.create_table(
+        'chef_availability_keyed',
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('day_of_week', sa.SmallInteger(), primary_key=True),
+        sa.Column('start_time', sa.Time(), nullable=False),
+        sa.Column('end_time', sa.Time(), nullable=False),
+        sa.Column('is_available', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+    # The old table never enforced (user_id, day_of_week) uniqueness;
+    # keep the newest row per key so the composite PK insert cannot fail
+    op.execute("""
+        INSERT INTO chef_availability_keyed
+            (user_id, day_of_week, start_time, end_time, is_available,
+             created_at, updated_at)
+        SELECT c.user_id, c.day_of_week, c.start_time, c.end_time,
+               c.is_available, c.created_at, c.updated_at
+        FROM chef_availability c
+        JOIN (
+            SELECT MAX(id) AS id FROM chef_availability
+            GROUP BY user_id, day_of_week
+        ) latest ON latest.id = c.id
+    """)
+    op.drop_table('chef_availability')
+    op.rename_table('chef_availability_keyed', 'chef_availability')
+
+
+def downgrade() -> None:
+    """Unpack the bitmasks back into one row per (user, day)"""
+
+    op.create_table(
+        'office_schedules_unpacked',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('day_of_week', sa.Integer(), nullable=False),
+        sa.Column('needs_breakfast', sa.Boolean(), nullable=True),
+        sa.Column('needs_lunch', sa.Boolean(), nullable=True),
+        sa.Column('needs_dinner', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+    for day in range(7):
+        bit = 1 << day
+        op.execute(f"""
+            INSERT INTO office_schedules_unpacked
+                (user_id, day_of_week, needs_breakfast, needs_lunch,
+                 needs_dinner, created_at, updated_at)
+            SELECT user_id, {day},
+                   (breakfast_mask & {bit}) != 0,
+                   (lunch_mask & {bit}) != 0,
+                   (dinner_mask & {bit}) != 0,
+                   created_at, updated_at
+            FROM office_schedules
+            WHERE ((breakfast_mask | lunch_mask | dinner_mask) & {bit}) != 0
+        """)
+    op.drop_table('office_schedules')
+    op.rename_table('office_schedules_unpacked', 'office_schedules')
+
+    op.create_table(
+        'chef_availability_surrogate',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('day_of_week', sa.Integer(), nullable=False),
+        sa.Column('start_time', sa.Time(), nullable=False),
+        sa.Column('end_time', sa.Time(), nullable=False),
+        sa.Column('is_available', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+    op.execute("""
+        INSERT INTO chef_availability_surrogate
+            (user_id, day_of_week, start_time, end_time, is_available,
+             created_at, updated_at)
+        SELECT user_id, day_of_week, start_time, end_time, is_available,
+               created_at, updated_at
+        FROM chef_availability
+    """)
+    op.drop_table('chef_availability')
+    op.rename_table('chef_availability_surrogate', 'chef_availability')
@@ -0,0 +1,129 @@
+"""Range-partition append-only time-series tables by month (PostgreSQL only)
+
+Converts stock_movements and health_records to native range partitioning
+on their timestamp column. Partition pruning keeps query cost bounded by
+the months actually touched, and autovacuum works per-partition instead
+of over the whole history.
+
+The partitioning is done here rather than in the declarative models
+because PostgreSQL requires the partition key in the primary key, and a
+composite (id, timestamp) primary key would break integer-PK
+autoincrement on the SQLite development database.
+
+Revision ID: partition_time_series
+Revises: enhanced_stock_categorization
+Create Date: 2025-08-30 00:00:00.000000
+
+"""
+from datetime import date
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'partition_time_series'
+down_revision = 'enhanced_stock_categorization'
+branch_labels = None
+depends_on = None
+
+
+# (table, partition key column, covering index prefix column)
+PARTITIONED_TABLES = [
+    ('stock_movements', 'date', 'stock_id'),
+    ('health_records', 'record_date', 'user_id'),
+    ('meal_feedbacks', 'created_at', 'user_id'),
+]
+
+# Monthly partitions created up front; rows outside the range land in the
+# DEFAULT partition until an operator attaches new monthly partitions.
+PARTITION_RANGE = (date(2025, 1, 1), date(2027, 1, 1))
+
+# LIKE ... INCLUDING DEFAULTS copies column defaults but not foreign
+# keys, so the constraints the models declare must be recreated on the
+# new parent by hand
+FOREIGN_KEYS = {
+    'stock_movements': [('stock_id', 'stocks')],
+    'health_records': [('user_id', 'users')],
+    'meal_feedbacks': [('meal_id', 'meals'), ('user_id', 'users')],
+}
+
+
+def _month_bounds():
+    """Yield (label, first_day, next_first_day) for each month in range"""
+    current, end = PARTITION_RANGE
+    while current < end:
+        if current.month == 12:
+            following = date(current.year + 1, 1, 1)
+        else:
+            following = date(current.year, current.month + 1, 1)
+        yield f"{current.year}_{current.month:02d}", current, following
+        current = following
+
+
+def upgrade() -> None:
+    """Convert time-series tables to monthly range partitions"""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table, key, prefix in PARTITIONED_TABLES:
+        # Swap the plain table out and recreate it as a partitioned parent.
+        # LIKE ... INCLUDING DEFAULTS keeps column defaults (id sequence).
+        op.execute(f"ALTER TABLE {table} RENAME TO {table}_unpartitioned")
+        op.execute(
+            f"CREATE TABLE {table} (LIKE {table}_unpartitioned INCLUDING DEFAULTS) "
+            f"PARTITION BY RANGE ({key})"
+        )
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id, {key})")
+
+        # DEFAULT partition catches rows outside the pre-created months
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+        for label, start, end in _month_bounds():
+            op.execute(
+                f"CREATE TABLE {table}_{label} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{start}') TO ('{end}')"
+            )
+
+        # Carry existing rows over, then drop the old table. The id
+        # sequence is still OWNED BY the renamed table's column; retarget
+        # it first or the drop either errors on the dependency or (with
+        # CASCADE) takes the new table's default down with it.
+        op.execute(f"INSERT INTO {table} SELECT * FROM {table}_unpartitioned")
+        op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+        op.execute(f"DROP TABLE {table}_unpartitioned")
+
+        for column, referenced in FOREIGN_KEYS[table]:
+            op.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT {table}_{column}_fkey "
+                f"FOREIGN KEY ({column}) REFERENCES {referenced} (id)"
+            )
+
+        # Recreate the indexes the models declare (LIKE does not copy them);
+        # partitioned parents propagate these to every partition
+        op.execute(
+            f"CREATE INDEX brin_{table}_{key} ON {table} "
+            f"USING brin ({key}) WITH (pages_per_range = 32)"
+        )
+        op.execute(f"CREATE INDEX ix_{table}_{prefix}_{key} ON {table} ({prefix}, {key})")
+
+
+def downgrade() -> None:
+    """Collapse partitioned tables back to plain tables"""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table, key, prefix in PARTITIONED_TABLES:
+        op.execute(f"ALTER TABLE {table} RENAME TO {table}_partitioned")
+        op.execute(f"CREATE TABLE {table} (LIKE {table}_partitioned INCLUDING DEFAULTS)")
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id)")
+        op.execute(f"INSERT INTO {table} SELECT * FROM {table}_partitioned")
+        op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+        op.execute(f"DROP TABLE {table}_partitioned")
+        for column, referenced in FOREIGN_KEYS[table]:
+            op.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT {table}_{column}_fkey "
+                f"FOREIGN KEY ({column}) REFERENCES {referenced} (id)"
+            )
+        op.execute(
+            f"CREATE INDEX brin_{table}_{key} ON {table} "
+            f"USING brin ({key}) WITH (pages_per_range = 32)"
+        )
+        op.execute(f"CREATE INDEX ix_{table}_{prefix}_{key} ON {table} ({prefix}, {key})")
@@ -0,0 +1,33 @@
+"""CHECK constraint on family_memberships.portion_ratio
+
+Replaces the Python-side meal_partitioning ratio validator: portion
+ratios are relative weights (1.0 = normal portion) since the membership
+merge, so the invariant to guard is positivity, evaluated by the DB once
+per write instead of in the app per request.
+
+Revision ID: portion_ratio_check
+Revises: coded_enum_columns
+Create Date: 2025-08-30 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'portion_ratio_check'
+down_revision = 'coded_enum_columns'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_check_constraint(
+        'ck_portion_ratio_positive',
+        'family_memberships',
+        'portion_ratio > 0',
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        'ck_portion_ratio_positive', 'family_memberships', type_='check'
+    )
@@ -0,0 +1,41 @@
+"""Composite and partial indexes for the stock analytics scans
+
+check_stock_alerts and get_stock_recommendations now push their
+low-stock/expiry predicates into SQL, but the only indexes on stocks
+were the single-column owner FKs, so the filtered scans still read the
+owner's whole slice. (owner, expiry_date) composites serve the expiry
+window after the owner equality, and a partial index over low-stock
+rows covers the current_quantity <= minimum_quantity probe without
+indexing the healthy majority. Matches the __table_args__ now on the
+Stock model.
+
+Revision ID: stock_analytics_indexes
+Revises: meal_analytics_mv
+Create Date: 2025-08-30 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'stock_analytics_indexes'
+down_revision = 'meal_analytics_mv'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_stocks_family_expiry', 'stocks', ['family_id', 'expiry_date'])
+    op.create_index('ix_stocks_user_expiry', 'stocks', ['user_id', 'expiry_date'])
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_index(
+            'ix_stocks_family_low_stock', 'stocks', ['family_id'],
+            postgresql_where=sa.text('current_quantity <= minimum_quantity'),
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_stocks_family_low_stock')
+    op.drop_index('ix_stocks_user_expiry')
+    op.drop_index('ix_stocks_family_expiry')
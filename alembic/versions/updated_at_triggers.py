@@ -0,0 +1,51 @@
+"""Server-side updated_at maintenance for guests and vacations (PostgreSQL only)
+
+Python-side onupdate=func.now() adds a bind parameter to every UPDATE and
+round-trips the generated timestamp through the driver. A single shared
+BEFORE UPDATE trigger computes updated_at in the server with no extra
+column in the statement; the models declare server_onupdate=FetchedValue()
+so SQLAlchemy knows the value is generated.
+
+meal_feedbacks is excluded: feedback rows are immutable and the table has
+no updated_at column.
+
+Revision ID: updated_at_triggers
+Revises: vacation_range_index
+Create Date: 2025-08-30 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'updated_at_triggers'
+down_revision = 'vacation_range_index'
+branch_labels = None
+depends_on = None
+
+TABLES = ('guests', 'vacations')
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(
+        "CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$\n"
+        "BEGIN\n"
+        "    NEW.updated_at := statement_timestamp();\n"
+        "    RETURN NEW;\n"
+        "END;\n"
+        "$$ LANGUAGE plpgsql"
+    )
+    for table in TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER trg_{table}_updated_at ON {table}")
+    op.execute("DROP FUNCTION set_updated_at()")
@@ -0,0 +1,35 @@
+"""GIST range index for vacation date-window lookups (PostgreSQL only)
+
+The "active vacation" probe (start_date <= now <= end_date) cannot use a
+plain B-tree efficiently because both bounds are range conditions; a
+GIST index over tsrange(start_date, end_date) answers containment
+directly. Declared here rather than on the model because the expression
+does not exist on the SQLite development database.
+
+Revision ID: vacation_range_index
+Revises: json_columns_guest_vacation
+Create Date: 2025-08-30 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'vacation_range_index'
+down_revision = 'json_columns_guest_vacation'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(
+        "CREATE INDEX ix_vac_range ON vacations "
+        "USING gist (tsrange(start_date, end_date))"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("DROP INDEX ix_vac_range")
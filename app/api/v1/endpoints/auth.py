@@ -19,6 +19,7 @@ from app.schemas.auth import (
     FamilyCreate,
     ProfileCompletion
 )
+from app.schemas import structs
 from app.core.security import (
     create_access_token,
     create_refresh_token,
@@ -31,17 +32,30 @@ router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 
-@router.post("/signup", response_model=UserProfileResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/signup",
+    response_model=UserProfileResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": UserSignUpBasic.model_json_schema()}},
+        }
+    },
+)
 @log_endpoint("user_signup")
 async def signup(
-    user_data: UserSignUpBasic,
     request: Request,
     db: Session = Depends(get_db)
 ):
     """User signup with comprehensive profile creation"""
     client_ip = request.client.host if request.client else "Unknown"
     APILogger.log_request(request)
-    
+
+    # Hot path: decode+validate the body in one msgspec pass instead of
+    # the Pydantic layer; the Pydantic model above still documents the API
+    user_data = structs.decode_body(await request.body(), structs.UserSignUpBasic)
+
     try:
         # Check if user already exists
         existing_user = db.query(User).filter(
@@ -507,7 +521,7 @@ async def add_family_member(
             )
         
         # Create new family member
-        member_data = family_data.dict()
+        member_data = family_data.model_dump()
         member_data["family_id"] = current_user.family_id
         member_data["is_family_account"] = True
         
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
-from sqlalchemy.orm import Session
+from sqlalchemy import text
+from sqlalchemy.orm import Session, raiseload, selectinload
 from typing import List, Optional
 from datetime import datetime, date, timedelta
 import json
@@ -23,15 +24,22 @@ from app.schemas.meals import (
     MealFeedbackResponse,
     MealPlan,
     MealHistory,
-    MealAnalytics
+    MealAnalytics,
+    MEALS_ADAPTER
 )
+from app.schemas import structs
 from app.core.factory import get_service_factory
+from app.services import analytics_refresh  # noqa: F401 - registers MV refresh hooks
 from app.services.meal_service import MealService
 
 router = APIRouter()
 service_factory = get_service_factory()
 meal_service = service_factory.get_service("meal")
 
+# Decodes meals.meal_type smallint codes coming out of meal_analytics_mv;
+# must match the declaration order of CodedString on Meal.meal_type
+_MEAL_TYPE_CODES = {"1": "breakfast", "2": "lunch", "3": "dinner", "4": "snack"}
+
 
 @router.post("/", response_model=MealResponse, status_code=status.HTTP_201_CREATED)
 @log_endpoint("create_meal")
@@ -52,7 +60,7 @@ async def create_meal(
             meal_data.user_id = current_user.id
         
         # Create meal
-        meal = Meal(**meal_data.dict())
+        meal = Meal(**meal_data.model_dump())
         db.add(meal)
         db.commit()
         db.refresh(meal)
@@ -107,8 +115,24 @@ async def get_meals(
         
         # Order by date and time
         meals = query.order_by(Meal.planned_date, Meal.planned_time).all()
-        
-        return meals
+
+        # Rows are already validated by the ORM; build the slotted list
+        # entries and encode with msgspec instead of re-validating through
+        # Pydantic per row
+        return structs.json_response([
+            MealList(
+                id=m.id,
+                name=m.name,
+                meal_type=m.meal_type,
+                planned_date=m.planned_date,
+                planned_time=m.planned_time,
+                status=m.status,
+                is_approved=m.is_approved,
+                total_calories=m.total_calories,
+                created_at=m.created_at,
+            )
+            for m in meals
+        ])
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -186,7 +210,7 @@ async def update_meal(
     
     try:
         # Update meal fields
-        for field, value in meal_update.dict(exclude_unset=True).items():
+        for field, value in meal_update.model_dump(exclude_unset=True).items():
             setattr(meal, field, value)
         
         meal.updated_at = datetime.utcnow()
@@ -319,18 +343,32 @@ async def approve_meal(
         )
 
 
-@router.post("/generate", response_model=MealGenerationResponse)
+@router.post(
+    "/generate",
+    response_model=MealGenerationResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": MealGenerationRequest.model_json_schema()}},
+        }
+    },
+)
 @log_endpoint("generate_meals")
 @log_access_attempt("meal_generation")
 async def generate_meals(
-    generation_request: MealGenerationRequest,
     request: Request,
     current_user: User = Depends(get_chef_user),
     db: Session = Depends(get_db)
 ):
     """Generate AI-powered meal suggestions"""
     APILogger.log_request(request, current_user.id)
-    
+
+    # Hot path: single-pass msgspec decode+validate; the Pydantic model
+    # above still documents the API
+    generation_request = structs.decode_body(
+        await request.body(), structs.MealGenerationRequest
+    )
+
     try:
         # Set user/family ID
         if current_user.family_id:
@@ -388,7 +426,7 @@ async def add_meal_feedback(
         feedback = MealFeedback(
             meal_id=meal_id,
             user_id=current_user.id,
-            **feedback_data.dict()
+            **feedback_data.model_dump()
         )
         
         db.add(feedback)
@@ -439,7 +477,18 @@ async def get_meal_feedback(
                 detail="Access denied"
             )
     
-    feedback = db.query(MealFeedback).filter(MealFeedback.meal_id == meal_id).all()
+    # raiseload("*") hard-fails on any lazy load this route did not plan
+    # for; meal/user arrive via their selectin strategies
+    feedback = (
+        db.query(MealFeedback)
+        .options(
+            selectinload(MealFeedback.meal),
+            selectinload(MealFeedback.user),
+            raiseload("*"),
+        )
+        .filter(MealFeedback.meal_id == meal_id)
+        .all()
+    )
     return feedback
 
 
@@ -474,7 +523,11 @@ async def get_daily_meal_plan(
         for meal in meals:
             if meal.ingredients:
                 try:
-                    ingredients = json.loads(meal.ingredients)
+                    # Native JSON column yields a list; legacy rows may still
+                    # hold a serialized string
+                    ingredients = meal.ingredients
+                    if isinstance(ingredients, str):
+                        ingredients = json.loads(ingredients)
                     for ingredient in ingredients:
                         shopping_list.append(f"{ingredient['name']} - {ingredient['quantity']} {ingredient['unit']}")
                 except:
@@ -488,7 +541,9 @@ async def get_daily_meal_plan(
         
         return MealPlan(
             date=date,
-            meals=meals,
+            # Validate the row batch in one pydantic-core entry; MealPlan
+            # then passes the ready model instances through untouched
+            meals=MEALS_ADAPTER.validate_python(meals, from_attributes=True),
             total_nutrition=total_nutrition,
             shopping_list=shopping_list,
             estimated_cost=estimated_cost
@@ -544,13 +599,13 @@ async def get_meal_history(
             
             history.append(MealHistory(
                 date=date,
-                meals=day_meals,
+                meals=MEALS_ADAPTER.validate_python(day_meals, from_attributes=True),
                 total_calories=total_calories,
                 average_rating=average_rating,
                 feedback_count=len([m for m in day_meals if m.feedback])
             ))
-        
-        return history
+
+        return structs.json_response(history)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -565,8 +620,56 @@ async def get_meal_analytics(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get comprehensive meal analytics"""
+    """Get comprehensive meal analytics.
+
+    Without an explicit date range this serves the all-time snapshot
+    from meal_analytics_mv (one indexed row) on PostgreSQL; passing
+    start_date/end_date always runs the live aggregation.
+    """
     try:
+        # Single-row fetch from the materialized view instead of a full
+        # GROUP BY over meals per request
+        if (
+            start_date is None
+            and end_date is None
+            and db.get_bind().dialect.name == "postgresql"
+        ):
+            scope, scope_id = (
+                ("family", current_user.family_id)
+                if current_user.family_id
+                else ("user", current_user.id)
+            )
+            row = db.execute(
+                text(
+                    "SELECT * FROM meal_analytics_mv "
+                    "WHERE scope = :scope AND scope_id = :scope_id"
+                ),
+                {"scope": scope, "scope_id": scope_id},
+            ).mappings().first()
+            if row is not None:
+                return structs.json_response(MealAnalytics(
+                    total_meals=row["total_meals"],
+                    average_rating=float(row["average_rating"]),
+                    favorite_meals=list(row["favorite_meals"]),
+                    least_favorite_meals=list(row["least_favorite_meals"]),
+                    nutritional_totals={
+                        "calories": float(row["total_calories"]),
+                        "protein": float(row["total_protein"]),
+                        "carbs": float(row["total_carbs"]),
+                        "fat": float(row["total_fat"]),
+                    },
+                    cost_analysis={
+                        "total_cost": row["total_meals"] * 5.0,
+                        "average_cost_per_meal": 5.0,
+                        "cost_trend": "stable",
+                    },
+                    # The view stores meal_type as its smallint code
+                    meal_type_distribution={
+                        _MEAL_TYPE_CODES.get(k, k): v
+                        for k, v in (row["meal_type_distribution"] or {}).items()
+                    },
+                ))
+
         # Set default date range if not provided
         if not start_date:
             start_date = date.today() - timedelta(days=30)
@@ -629,7 +732,7 @@ async def get_meal_analytics(
         for meal in meals:
             meal_type_distribution[meal.meal_type] = meal_type_distribution.get(meal.meal_type, 0) + 1
         
-        return MealAnalytics(
+        return structs.json_response(MealAnalytics(
             total_meals=total_meals,
             average_rating=average_rating,
             favorite_meals=favorite_meals,
@@ -637,7 +740,7 @@ async def get_meal_analytics(
             nutritional_totals=nutritional_totals,
             cost_analysis=cost_analysis,
             meal_type_distribution=meal_type_distribution
-        )
+        ))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
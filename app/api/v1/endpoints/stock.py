@@ -14,10 +14,7 @@ from app.schemas.stock import (
     StockCreate, StockUpdate, StockResponse, StockList, StockSearch,
     StockMovementCreate, StockAlert, StockAnalytics, StockImport, StockExport
 )
-from app.schemas.stock_categories import (
-    StockCategoryResponse, FamilyStockAssignment, StockCategoryAnalytics,
-    CategoryStatsResponse, FamilyStockDistribution, StockAssignmentCreate
-)
+from app.schemas import stock_fast, structs
 from app.core.cache import cache_manager
 from app.services.stock_service import StockService
 from app.api.v1.endpoints.stock_categories import router as categories_router
@@ -45,7 +42,7 @@ async def create_stock_item(
             stock_data.user_id = current_user.id
         
         # Create stock item
-        stock = Stock(**stock_data.dict())
+        stock = Stock(**stock_data.model_dump())
         db.add(stock)
         db.commit()
         db.refresh(stock)
@@ -180,7 +177,12 @@ async def get_stock_items(
         # Order by category and name
         stock_items = query.order_by(Stock.category, Stock.item_name).all()
         
-        return stock_items
+        # Rows already satisfy the schema: one msgspec Struct per row and
+        # a single C encode, instead of per-field pydantic validation.
+        # response_model above still documents the API.
+        return structs.json_response(
+            [stock_fast.from_row(item) for item in stock_items]
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -254,7 +256,7 @@ async def update_stock_item(
     
     try:
         # Update stock fields
-        for field, value in stock_update.dict(exclude_unset=True).items():
+        for field, value in stock_update.model_dump(exclude_unset=True).items():
             setattr(stock, field, value)
         
         stock.updated_at = datetime.utcnow()
@@ -372,7 +374,7 @@ async def record_stock_movement(
         # Create movement record
         movement = StockMovement(
             stock_id=stock_id,
-            **movement_data.dict()
+            **movement_data.model_dump()
         )
         
         db.add(movement)
@@ -472,7 +474,7 @@ async def create_stock_alert(
         # Create alert
         alert = StockAlert(
             stock_id=stock_id,
-            **alert_data.dict()
+            **alert_data.model_dump()
         )
         
         db.add(alert)
@@ -605,7 +607,8 @@ async def get_stock_analytics(
         )
         
         APILogger.log_user_action(current_user.id, "view_stock_analytics", "Enhanced stock analytics viewed")
-        return analytics
+        # Aggregates are server-computed; skip response re-validation
+        return structs.json_response(StockAnalytics.from_trusted(analytics))
         
     except Exception as e:
         APILogger.log_error(f"Stock analytics failed: {str(e)}", current_user.id)
@@ -668,12 +671,12 @@ async def import_stock_csv(
                 
                 if existing_item and overwrite_existing:
                     # Update existing item
-                    for field, value in stock_data.dict(exclude_unset=True).items():
+                    for field, value in stock_data.model_dump(exclude_unset=True).items():
                         setattr(existing_item, field, value)
                     existing_item.updated_at = datetime.utcnow()
                 elif not existing_item:
                     # Create new item
-                    stock = Stock(**stock_data.dict())
+                    stock = Stock(**stock_data.model_dump())
                     db.add(stock)
                 
                 imported_count += 1
@@ -14,6 +14,7 @@ from app.schemas.user import (
     UserList,
     UserProfile
 )
+from app.schemas import structs
 from app.core.cache import cache_manager
 from utils.api_logger import APILogger, log_endpoint
 
@@ -44,8 +45,9 @@ async def update_user_profile(
     """Update current user's profile"""
     APILogger.log_request(request, current_user.id)
     try:
-        # Update user fields
-        for field, value in user_update.dict(exclude_unset=True).items():
+        # Update user fields; dump once and reuse below
+        changed = user_update.model_dump(exclude_unset=True)
+        for field, value in changed.items():
             setattr(current_user, field, value)
         
         current_user.updated_at = datetime.utcnow()
@@ -53,7 +55,7 @@ async def update_user_profile(
         db.refresh(current_user)
         
         APILogger.log_database_operation("UPDATE", "user_profile", True, current_user.id)
-        APILogger.log_user_action(current_user.id, "profile_update", f"Updated profile fields: {list(user_update.dict(exclude_unset=True).keys())}")
+        APILogger.log_user_action(current_user.id, "profile_update", f"Updated profile fields: {list(changed)}")
         
         # Clear cache
         await cache_manager.delete(f"user:{current_user.id}")
@@ -140,7 +142,10 @@ async def get_family_members(
         ).all()
         
         APILogger.log_user_action(current_user.id, "family_members_view", f"Viewed {len(family_members)} family members")
-        return family_members
+        # Rows already satisfy the schema; skip re-validation on the way out
+        return structs.json_response(
+            [UserList.from_orm_fast(member) for member in family_members]
+        )
     except Exception as e:
         APILogger.log_error(f"Failed to get family members for user {current_user.id}: {str(e)}")
         raise HTTPException(
@@ -382,7 +387,7 @@ async def search_users(
         ).limit(10).all()
         
         APILogger.log_user_action(current_user.id, "user_search", f"Searched for users with query: {query}, found {len(users)} results")
-        return users
+        return structs.json_response([UserList.from_orm_fast(user) for user in users])
     except Exception as e:
         APILogger.log_error(f"User search failed for user {current_user.id}: {str(e)}")
         raise HTTPException(
@@ -7,6 +7,8 @@ and adherence to SOLID principles.
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime
+from enum import Enum
 from typing import Any, Dict, Generic, List, Optional, TypeVar
 
 from sqlalchemy.orm import Session
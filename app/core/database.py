@@ -1,6 +1,5 @@
-from sqlalchemy import create_engine, event
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker, Session, DeclarativeBase
 from sqlalchemy.pool import StaticPool
 from sqlalchemy.exc import SQLAlchemyError, DisconnectionError, OperationalError
 import logging
@@ -72,14 +71,16 @@ def create_database_engine():
                 poolclass=StaticPool,
                 echo=False,
                 pool_pre_ping=True,  # Verify connections before use
-                pool_recycle=3600,   # Recycle connections every hour
+                pool_recycle=1800,   # Recycle connections every 30 minutes
             )
         else:
+            # Sized queue pool so requests reuse warm connections instead of
+            # paying connect() latency; recycle well under common idle timeouts
             engine = create_engine(
                 get_database_url(),
                 echo=False,
                 pool_pre_ping=True,
-                pool_recycle=3600,
+                pool_recycle=1800,
                 pool_size=10,
                 max_overflow=20,
                 pool_timeout=30
@@ -117,15 +118,18 @@ engine = create_database_engine()
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Create base class for models
-Base = declarative_base()
+# Create base class for models. DeclarativeBase (2.x style) accepts both
+# legacy Column declarations and typed Mapped[...] models, so classes can
+# migrate to the annotated style incrementally.
+class Base(DeclarativeBase):
+    pass
 
 
 async def init_db():
     """Initialize database and create tables"""
     try:
         # Import all models to ensure they are registered
-        from app.models.user import User, Family, FamilyMemberPriority, FamilyMealPartition, FamilyGuestPreference, FamilyMealTiming, MealGenerationCriteria, UserMealCriteria, OfficeSchedule
+        from app.models.user import User, Family, FamilyMembership, FamilyGuestPreference, FamilyMealTiming, MealGenerationCriteria, UserMealCriteria, OfficeSchedule
         from app.models.address import Address, UserAddress
         from app.models.health import HealthCondition, VitaminDeficiency, UserHealthCondition, UserVitaminDeficiency
         from app.models.cuisine import Cuisine, MeatType, UserCuisine, UserMeatPreference
@@ -178,10 +182,9 @@ def get_db() -> Session:
     
     try:
         db = SessionLocal()
-        
-        # Test the connection
-        db.execute("SELECT 1")
-        
+
+        # No per-request test query: pool_pre_ping already validates the
+        # connection on checkout without an extra application round-trip
         yield db
         
     except OperationalError as e:
@@ -232,9 +235,9 @@ def check_db_health() -> bool:
     try:
         logger.info("🔍 Starting database health check...")
         db = SessionLocal()
-        
+
         # Test basic connectivity
-        db.execute("SELECT 1")
+        db.execute(text("SELECT 1"))
         
         # Test table access (if tables exist)
         try:
@@ -0,0 +1,74 @@
+"""
+Process-local cache for the small lookup tables.
+
+Cuisine, MeatType, HealthCondition and the other lookup tables hold
+dozens of rows but are read on virtually every request that resolves a
+user's preferences. Caching the active rows per model removes those
+repeated SELECTs; entries expire after a TTL and can be invalidated
+explicitly whenever an admin write changes a lookup table.
+
+Follows the in-memory pattern of app/core/cache.py, but synchronous to
+match the session-based model/service code that consumes it.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds before a cached table is re-read; lookup data changes rarely
+DEFAULT_TTL = 300
+
+
+class LookupCache:
+    """TTL cache of active lookup rows, keyed per model class"""
+
+    def __init__(self, ttl: int = DEFAULT_TTL):
+        self.ttl = ttl
+        self._entries: Dict[Any, Tuple[float, List[Any]]] = {}
+        self._lock = threading.Lock()
+
+    def get_active(self, db, model) -> List[Any]:
+        """
+        Return the active rows of ``model``, cached across sessions.
+
+        Rows are detached from the loading session so cached instances
+        never hold a session reference; callers treat them as read-only.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(model)
+            if entry and now - entry[0] < self.ttl:
+                return entry[1]
+
+        query = db.query(model)
+        if hasattr(model, "is_active"):
+            query = query.filter(model.is_active == True)
+        rows = query.order_by(model.id).all()
+        for row in rows:
+            db.expunge(row)
+
+        with self._lock:
+            self._entries[model] = (now, rows)
+        logger.debug(f"Cached {len(rows)} active rows for {model.__name__}")
+        return rows
+
+    def invalidate(self, model=None) -> None:
+        """Drop the cached rows for ``model``, or everything if omitted"""
+        with self._lock:
+            if model is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(model, None)
+
+
+# Global lookup cache instance; call lookup_cache.invalidate(Model) after
+# any write to a lookup table
+lookup_cache = LookupCache()
+
+
+def get_active_lookup(db, model) -> List[Any]:
+    """Module-level convenience wrapper around the global cache"""
+    return lookup_cache.get_active(db, model)
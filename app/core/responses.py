@@ -0,0 +1,28 @@
+"""
+orjson-backed default response class.
+
+FastAPI's stock JSONResponse renders with the standard-library
+``json.dumps`` — a pure-Python tree walk that dominates serialization
+CPU on the larger payloads (meal plans, analytics). orjson encodes the
+same content in one C pass and handles datetimes and dataclasses
+natively, so the ``jsonable_encoder`` pre-pass has less to do.
+
+The hottest list endpoints bypass this entirely via
+``app.schemas.structs.json_response`` (msgspec); this class covers every
+other route through ``default_response_class`` in ``main.py``.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that renders with orjson"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_DATACLASS,
+        )
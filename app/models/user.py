@@ -1,10 +1,137 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text, ForeignKey, Enum, Time
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import CheckConstraint, Column, Integer, SmallInteger, String, Float, Boolean, DateTime, Text, ForeignKey, Enum, FetchedValue, Time, Index, JSON, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import relationship, Mapped, MappedAsDataclass, mapped_column
+from sqlalchemy.sql import expression, func
+from sqlalchemy.types import TypeDecorator
 from app.core.database import Base
+from datetime import datetime, timezone
+from typing import Optional
 import enum
 
 
+class UtcDateTime(TypeDecorator):
+    """UTC timestamps stored as TIMESTAMP WITHOUT TIME ZONE.
+
+    The app is UTC-only, so storing timestamptz would just pay session
+    timezone normalization on every read. Aware datetimes are converted to
+    naive UTC on bind; reads come back as aware UTC datetimes.
+    """
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is not None and getattr(value, "tzinfo", None) is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    def process_result_value(self, value, dialect):
+        if value is not None and getattr(value, "tzinfo", None) is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
+
+
+class utcnow(expression.FunctionElement):
+    """Server-side UTC now() for UtcDateTime defaults"""
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    # SQLite CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    return "(statement_timestamp() AT TIME ZONE 'utc')"
+
+
+class CodedString(TypeDecorator):
+    """Stores a small controlled vocabulary as SmallInteger codes.
+
+    The Python side keeps the plain string values used throughout the app;
+    only the storage representation changes: a 2-byte integer instead of a
+    VARCHAR, which shrinks rows/indexes and makes comparisons and ORDER BY
+    integer operations. Codes follow the declaration order of the values.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, *values):
+        super().__init__()
+        self._to_code = {value: code for code, value in enumerate(values, start=1)}
+        self._to_value = {code: value for code, value in enumerate(values, start=1)}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        # Accept str-based enums as well as raw strings
+        value = getattr(value, "value", value)
+        try:
+            return self._to_code[value]
+        except KeyError:
+            raise ValueError(f"Unknown value {value!r}; expected one of {list(self._to_code)}")
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._to_value.get(value, value)
+
+class MinutesOfDay(TypeDecorator):
+    """Stores an "HH:MM" time-of-day string as minutes past midnight.
+
+    The API keeps exchanging "18:00"-style strings; storage becomes a
+    2-byte integer (0-1439), so range filters like "meals between 12:00
+    and 14:00" are plain integer comparisons instead of string parsing.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, int):
+            return value
+        try:
+            hours, minutes = value.split(":")
+            return int(hours) * 60 + int(minutes)
+        except (ValueError, AttributeError):
+            raise ValueError(f"Expected HH:MM time string, got {value!r}")
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return f"{value // 60:02d}:{value % 60:02d}"
+
+
+# Native JSON storage: binary JSONB on PostgreSQL (pre-parsed, GIN-indexable),
+# plain JSON on the SQLite development database. Avoids json.loads/dumps
+# round-trips in application code for structured columns.
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
+
+class TimestampMixin:
+    """Shared created_at/updated_at pair.
+
+    Declaring the columns once lets every inheriting model reuse the same
+    type singletons instead of constructing a fresh Column/type pair per
+    class at import time.
+    """
+    created_at = Column(UtcDateTime, server_default=utcnow())
+    updated_at = Column(UtcDateTime, onupdate=utcnow())
+
+
+class SoftDeleteMixin:
+    """Shared soft-delete flag with a server-side default."""
+    is_active = Column(Boolean, default=True, server_default=text("true"))
+
+    @classmethod
+    def all_active(cls, db):
+        """Active rows via the process-local lookup cache"""
+        from app.core.lookup_cache import lookup_cache
+        return lookup_cache.get_active(db, cls)
+
+
 class GenderEnum(str, enum.Enum):
     MALE = "male"
     FEMALE = "female"
@@ -35,118 +162,150 @@ class PetTypeEnum(str, enum.Enum):
 
 
 # Normalized lookup tables
-class Cuisine(Base):
-    """Normalized cuisine lookup table"""
+class Cuisine(MappedAsDataclass, Base):
+    """Normalized cuisine lookup table.
+
+    Written in the 2.x MappedAsDataclass style: slimmer instances, a
+    generated keyword __init__/__repr__, and typed attributes. Serves as
+    the template for migrating the remaining Column-style models. The
+    shared mixin columns are redeclared here because dataclass mapping
+    needs init=False markers the legacy-style models cannot carry.
+    """
     __tablename__ = "cuisines"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), unique=True, nullable=False)
-    region = Column(String(100), nullable=True)
-    description = Column(Text, nullable=True)
-    
+    __table_args__ = (
+        # Partial unique index: excludes soft-deleted rows, so the index stays
+        # small and a name can be reused after deactivation
+        Index("ix_cuisines_active_name", "name", unique=True,
+              postgresql_where=text("is_active = true"),
+              sqlite_where=text("is_active = 1")),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True, init=False)
+    name: Mapped[str] = mapped_column(String(100))
+    region: Mapped[Optional[str]] = mapped_column(String(100), default=None)
+    description: Mapped[Optional[str]] = mapped_column(Text, default=None)
+
     # Soft delete
-    is_active = Column(Boolean, default=True)
-    
+    is_active: Mapped[bool] = mapped_column(default=True, server_default=text("true"),
+                                            init=False)
+
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(UtcDateTime,
+                                                           server_default=utcnow(),
+                                                           init=False)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(UtcDateTime,
+                                                           onupdate=utcnow(),
+                                                           init=False)
+
+    @classmethod
+    def all_active(cls, db):
+        """Active rows via the process-local lookup cache"""
+        from app.core.lookup_cache import lookup_cache
+        return lookup_cache.get_active(db, cls)
 
 
-class MeatType(Base):
+class MeatType(TimestampMixin, SoftDeleteMixin, Base):
     """Normalized meat types lookup table"""
     __tablename__ = "meat_types"
-    
+    __table_args__ = (
+        # Partial unique index: excludes soft-deleted rows, so the index stays
+        # small and a name can be reused after deactivation
+        Index("ix_meat_types_active_name", "name", unique=True,
+              postgresql_where=text("is_active = true"),
+              sqlite_where=text("is_active = 1")),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(50), unique=True, nullable=False)
+    name = Column(String(50), nullable=False)
     category = Column(String(30), nullable=False)
     description = Column(Text, nullable=True)
-    
-    # Soft delete
-    is_active = Column(Boolean, default=True)
-    
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
-class HealthCondition(Base):
+class HealthCondition(TimestampMixin, SoftDeleteMixin, Base):
     """Normalized health conditions lookup table"""
     __tablename__ = "health_conditions"
-    
+    __table_args__ = (
+        # Partial unique index: excludes soft-deleted rows, so the index stays
+        # small and a name can be reused after deactivation
+        Index("ix_health_conditions_active_name", "name", unique=True,
+              postgresql_where=text("is_active = true"),
+              sqlite_where=text("is_active = 1")),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), unique=True, nullable=False)
+    name = Column(String(100), nullable=False)
     category = Column(String(50), nullable=False)
     description = Column(Text, nullable=True)
-    
-    # Soft delete
-    is_active = Column(Boolean, default=True)
-    
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
-class VitaminDeficiency(Base):
+class VitaminDeficiency(TimestampMixin, SoftDeleteMixin, Base):
     """Normalized vitamin deficiencies lookup table"""
     __tablename__ = "vitamin_deficiencies"
-    
+    __table_args__ = (
+        # Partial unique index: excludes soft-deleted rows, so the index stays
+        # small and a name can be reused after deactivation
+        Index("ix_vitamin_deficiencies_active_name", "name", unique=True,
+              postgresql_where=text("is_active = true"),
+              sqlite_where=text("is_active = 1")),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(50), unique=True, nullable=False)
+    name = Column(String(50), nullable=False)
     description = Column(Text, nullable=True)
-    
-    # Soft delete
-    is_active = Column(Boolean, default=True)
-    
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
-class MealStyle(Base):
+class MealStyle(TimestampMixin, SoftDeleteMixin, Base):
     """Normalized meal styles lookup table"""
     __tablename__ = "meal_styles"
-    
+    __table_args__ = (
+        # Partial unique index: excludes soft-deleted rows, so the index stays
+        # small and a name can be reused after deactivation
+        Index("ix_meal_styles_active_name", "name", unique=True,
+              postgresql_where=text("is_active = true"),
+              sqlite_where=text("is_active = 1")),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(50), unique=True, nullable=False)
+    name = Column(String(50), nullable=False)
     description = Column(Text, nullable=True)
-    
-    # Soft delete
-    is_active = Column(Boolean, default=True)
-    
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
-class SpecialNeed(Base):
+class SpecialNeed(TimestampMixin, SoftDeleteMixin, Base):
     """Normalized special needs lookup table"""
     __tablename__ = "special_needs"
-    
+    __table_args__ = (
+        # Partial unique index: excludes soft-deleted rows, so the index stays
+        # small and a name can be reused after deactivation
+        Index("ix_special_needs_active_name", "name", unique=True,
+              postgresql_where=text("is_active = true"),
+              sqlite_where=text("is_active = 1")),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), unique=True, nullable=False)
+    name = Column(String(100), nullable=False)
     category = Column(String(50), nullable=False)
     description = Column(Text, nullable=True)
-    
-    # Soft delete
-    is_active = Column(Boolean, default=True)
-    
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
-class Festival(Base):
+class Festival(TimestampMixin, SoftDeleteMixin, Base):
     """Normalized festivals lookup table"""
     __tablename__ = "festivals"
-    
+    __table_args__ = (
+        # Partial unique index: excludes soft-deleted rows, so the index stays
+        # small and a name can be reused after deactivation
+        Index("ix_festivals_active_name", "name", unique=True,
+              postgresql_where=text("is_active = true"),
+              sqlite_where=text("is_active = 1")),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), unique=True, nullable=False)
+    name = Column(String(100), nullable=False)
     religion = Column(String(50), nullable=True)
     region = Column(String(100), nullable=True)
     description = Column(Text, nullable=True)
-    
-    # Soft delete
-    is_active = Column(Boolean, default=True)
-    
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
-class MealGenerationCriteria(Base):
+class MealGenerationCriteria(TimestampMixin, Base):
     """Normalized meal generation criteria"""
     __tablename__ = "meal_generation_criteria"
     
@@ -155,22 +314,41 @@ class MealGenerationCriteria(Base):
     description = Column(Text, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(UtcDateTime, server_default=utcnow())
+
+
+class Address(Base):
+    """Normalized address table following 3NF"""
+    __tablename__ = "addresses"
+
+    id = Column(Integer, primary_key=True, index=True)
+    street_address = Column(Text, nullable=False)
+    postal_code = Column(String(20), nullable=False)
+    city = Column(String(100), nullable=False)
+    state_province = Column(String(100), nullable=True)
+    country = Column(String(100), nullable=False)
+
+    # Address type and ownership
+    address_type = Column(String(20), nullable=False)  # current, native, office, etc.
+    is_primary = Column(Boolean, default=False)
+
+    # Timestamps
+    created_at = Column(UtcDateTime, server_default=utcnow())
+    updated_at = Column(UtcDateTime, onupdate=utcnow())
 
 
 # Junction tables for many-to-many relationships
 class UserAddress(Base):
     """Junction table for user-address relationships"""
     __tablename__ = "user_addresses"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    address_id = Column(Integer, ForeignKey("addresses.id"), nullable=False)
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    address_id = Column(Integer, ForeignKey("addresses.id"), primary_key=True)
     address_type = Column(String(20), nullable=False)  # current, native, billing, shipping
     is_primary = Column(Boolean, default=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(UtcDateTime, server_default=utcnow())
     
     # Relationships
     user = relationship("User", back_populates="user_addresses")
@@ -180,14 +358,13 @@ class UserAddress(Base):
 class UserCuisine(Base):
     """Junction table for user cuisine preferences"""
     __tablename__ = "user_cuisines"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    cuisine_id = Column(Integer, ForeignKey("cuisines.id"), nullable=False)
-    preference_level = Column(String(20), nullable=False)  # mandatory, preferred, optional
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    cuisine_id = Column(Integer, ForeignKey("cuisines.id"), primary_key=True)
+    preference_level = Column(CodedString("mandatory", "preferred", "optional"), nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(UtcDateTime, server_default=utcnow())
     
     # Relationships
     user = relationship("User", back_populates="user_cuisines")
@@ -197,14 +374,13 @@ class UserCuisine(Base):
 class UserMeatPreference(Base):
     """Junction table for user meat preferences"""
     __tablename__ = "user_meat_preferences"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    meat_type_id = Column(Integer, ForeignKey("meat_types.id"), nullable=False)
-    preference_level = Column(String(20), nullable=False)  # love, like, neutral, dislike
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    meat_type_id = Column(Integer, ForeignKey("meat_types.id"), primary_key=True)
+    preference_level = Column(CodedString("love", "like", "neutral", "dislike"), nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(UtcDateTime, server_default=utcnow())
     
     # Relationships
     user = relationship("User", back_populates="meat_preferences")
@@ -214,16 +390,20 @@ class UserMeatPreference(Base):
 class UserHealthCondition(Base):
     """Junction table for user health conditions"""
     __tablename__ = "user_health_conditions"
-    
+    __table_args__ = (
+        Index("ix_user_health_conditions_user_condition", "user_id", "health_condition_id",
+              unique=True, postgresql_include=["severity"]),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     health_condition_id = Column(Integer, ForeignKey("health_conditions.id"), nullable=False)
-    severity = Column(String(20), nullable=True)  # mild, moderate, severe
-    diagnosed_date = Column(DateTime(timezone=True), nullable=True)
+    severity = Column(CodedString("mild", "moderate", "severe"), nullable=True)
+    diagnosed_date = Column(UtcDateTime, nullable=True)
     notes = Column(Text, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(UtcDateTime, server_default=utcnow())
     
     # Relationships
     user = relationship("User", back_populates="health_conditions")
@@ -233,15 +413,19 @@ class UserHealthCondition(Base):
 class UserVitaminDeficiency(Base):
     """Junction table for user vitamin deficiencies"""
     __tablename__ = "user_vitamin_deficiencies"
-    
+    __table_args__ = (
+        Index("ix_user_vitamin_deficiencies_user_deficiency", "user_id", "vitamin_deficiency_id",
+              unique=True, postgresql_include=["severity"]),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     vitamin_deficiency_id = Column(Integer, ForeignKey("vitamin_deficiencies.id"), nullable=False)
-    severity = Column(String(20), nullable=True)  # mild, moderate, severe
-    diagnosed_date = Column(DateTime(timezone=True), nullable=True)
+    severity = Column(CodedString("mild", "moderate", "severe"), nullable=True)
+    diagnosed_date = Column(UtcDateTime, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(UtcDateTime, server_default=utcnow())
     
     # Relationships
     user = relationship("User", back_populates="vitamin_deficiencies")
@@ -251,14 +435,13 @@ class UserVitaminDeficiency(Base):
 class UserMealStyle(Base):
     """Junction table for user meal style preferences"""
     __tablename__ = "user_meal_styles"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    meal_style_id = Column(Integer, ForeignKey("meal_styles.id"), nullable=False)
-    preference_level = Column(String(20), nullable=False)  # love, like, neutral, avoid
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    meal_style_id = Column(Integer, ForeignKey("meal_styles.id"), primary_key=True)
+    preference_level = Column(CodedString("love", "like", "neutral", "avoid"), nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(UtcDateTime, server_default=utcnow())
     
     # Relationships
     user = relationship("User", back_populates="meal_style_preferences")
@@ -266,19 +449,18 @@ class UserMealStyle(Base):
 
 
 class ChefAvailability(Base):
-    """Normalized chef availability schedule"""
+    """Normalized chef availability schedule, keyed by (user, day)"""
     __tablename__ = "chef_availability"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    day_of_week = Column(Integer, nullable=False)  # 0=Monday, 6=Sunday
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    day_of_week = Column(SmallInteger, primary_key=True)  # 0=Monday, 6=Sunday
     start_time = Column(Time, nullable=False)
     end_time = Column(Time, nullable=False)
     is_available = Column(Boolean, default=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(UtcDateTime, server_default=utcnow())
+    updated_at = Column(UtcDateTime, onupdate=utcnow())
     
     # Relationships
     user = relationship("User", back_populates="chef_schedules")
@@ -287,15 +469,19 @@ class ChefAvailability(Base):
 class UserSpecialNeed(Base):
     """Junction table for user special needs"""
     __tablename__ = "user_special_needs"
-    
+    __table_args__ = (
+        Index("ix_user_special_needs_user_need", "user_id", "special_need_id",
+              unique=True, postgresql_include=["severity"]),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     special_need_id = Column(Integer, ForeignKey("special_needs.id"), nullable=False)
-    severity = Column(String(20), nullable=True)  # mild, moderate, severe
+    severity = Column(CodedString("mild", "moderate", "severe"), nullable=True)
     notes = Column(Text, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(UtcDateTime, server_default=utcnow())
     
     # Relationships
     user = relationship("User", back_populates="special_needs")
@@ -307,7 +493,7 @@ class Pet(Base):
     __tablename__ = "pets"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String(100), nullable=False)
     pet_type = Column(Enum(PetTypeEnum), nullable=False)
     breed = Column(String(100), nullable=True)
@@ -319,8 +505,8 @@ class Pet(Base):
     dietary_restrictions = Column(Text, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(UtcDateTime, server_default=utcnow())
+    updated_at = Column(UtcDateTime, onupdate=utcnow())
     
     # Relationships
     user = relationship("User", back_populates="pets")
@@ -329,15 +515,14 @@ class Pet(Base):
 class UserFestivalPreference(Base):
     """Junction table for user festival preferences"""
     __tablename__ = "user_festival_preferences"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    festival_id = Column(Integer, ForeignKey("festivals.id"), nullable=False)
-    preference_level = Column(String(20), nullable=False)  # celebrate, observe, ignore
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    festival_id = Column(Integer, ForeignKey("festivals.id"), primary_key=True)
+    preference_level = Column(CodedString("celebrate", "observe", "ignore"), nullable=False)
     include_traditional_foods = Column(Boolean, default=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(UtcDateTime, server_default=utcnow())
     
     # Relationships
     user = relationship("User", back_populates="festival_preferences")
@@ -347,14 +532,13 @@ class UserFestivalPreference(Base):
 class UserMealCriteria(Base):
     """Junction table for user meal generation criteria"""
     __tablename__ = "user_meal_criteria"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    criteria_id = Column(Integer, ForeignKey("meal_generation_criteria.id"), nullable=False)
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    criteria_id = Column(Integer, ForeignKey("meal_generation_criteria.id"), primary_key=True)
     priority = Column(Integer, nullable=False, default=1)  # 1=highest priority
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(UtcDateTime, server_default=utcnow())
     
     # Relationships
     user = relationship("User", back_populates="meal_criteria")
@@ -362,23 +546,41 @@ class UserMealCriteria(Base):
 
 
 class OfficeSchedule(Base):
-    """Normalized office meal schedule"""
+    """Office meal schedule packed as per-meal weekday bitmasks.
+
+    One row per user instead of one row per (user, day): each mask holds
+    seven bits where bit ``1 << day`` is set when that meal is needed on
+    that day (0=Monday, 6=Sunday).
+    """
     __tablename__ = "office_schedules"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    day_of_week = Column(Integer, nullable=False)  # 0=Monday, 6=Sunday
-    needs_breakfast = Column(Boolean, default=False)
-    needs_lunch = Column(Boolean, default=True)
-    needs_dinner = Column(Boolean, default=False)
-    
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    breakfast_mask = Column(SmallInteger, nullable=False, default=0)
+    lunch_mask = Column(SmallInteger, nullable=False, default=0)
+    dinner_mask = Column(SmallInteger, nullable=False, default=0)
+
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    
+    created_at = Column(UtcDateTime, server_default=utcnow())
+    updated_at = Column(UtcDateTime, onupdate=utcnow())
+
     # Relationships
     user = relationship("User", back_populates="office_schedules")
 
+    def needs(self, day_of_week: int, meal: str) -> bool:
+        """Check whether a meal is needed on a day (meal: breakfast/lunch/dinner)"""
+        mask = getattr(self, f"{meal}_mask") or 0
+        return bool(mask & (1 << day_of_week))
+
+    def set_needs(self, day_of_week: int, meal: str, needed: bool = True):
+        """Set or clear the bit for a meal on a day"""
+        field = f"{meal}_mask"
+        mask = getattr(self, field) or 0
+        if needed:
+            mask |= (1 << day_of_week)
+        else:
+            mask &= ~(1 << day_of_week)
+        setattr(self, field, mask)
+
 
 class User(Base):
     """Normalized User table following 3NF principles"""
@@ -409,7 +611,7 @@ class User(Base):
     dining_style = Column(Enum(DiningStyleEnum), nullable=True)
     
     # Family relationship (foreign key reference)
-    family_id = Column(Integer, ForeignKey("families.id"), nullable=True)
+    family_id = Column(Integer, ForeignKey("families.id"), nullable=True, index=True)
     is_family_account = Column(Boolean, default=False)
     is_decision_maker = Column(Boolean, default=False)
     is_chef = Column(Boolean, default=False)
@@ -431,26 +633,26 @@ class User(Base):
     religion = Column(String(100), nullable=True)
     
     # Meal timing preference (atomic value)
-    meal_timing_preference = Column(String(10), nullable=True, default="18:00")
+    meal_timing_preference = Column(MinutesOfDay, nullable=True, default="18:00")
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(UtcDateTime, server_default=utcnow())
+    updated_at = Column(UtcDateTime, onupdate=utcnow())
     
     # Relationships (2NF/3NF - separate tables for multi-valued attributes)
     family = relationship("Family", back_populates="members")
-    user_addresses = relationship("UserAddress", back_populates="user", cascade="all, delete-orphan")
-    health_conditions = relationship("UserHealthCondition", back_populates="user", cascade="all, delete-orphan")
-    vitamin_deficiencies = relationship("UserVitaminDeficiency", back_populates="user", cascade="all, delete-orphan")
-    user_cuisines = relationship("UserCuisine", back_populates="user", cascade="all, delete-orphan")
-    meat_preferences = relationship("UserMeatPreference", back_populates="user", cascade="all, delete-orphan")
-    meal_style_preferences = relationship("UserMealStyle", back_populates="user", cascade="all, delete-orphan")
-    chef_schedules = relationship("ChefAvailability", back_populates="user", cascade="all, delete-orphan")
-    special_needs = relationship("UserSpecialNeed", back_populates="user", cascade="all, delete-orphan")
-    pets = relationship("Pet", back_populates="user", cascade="all, delete-orphan")
-    festival_preferences = relationship("UserFestivalPreference", back_populates="user", cascade="all, delete-orphan")
-    meal_criteria = relationship("UserMealCriteria", back_populates="user", cascade="all, delete-orphan")
-    office_schedules = relationship("OfficeSchedule", back_populates="user", cascade="all, delete-orphan")
+    user_addresses = relationship("UserAddress", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    health_conditions = relationship("UserHealthCondition", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    vitamin_deficiencies = relationship("UserVitaminDeficiency", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    user_cuisines = relationship("UserCuisine", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    meat_preferences = relationship("UserMeatPreference", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    meal_style_preferences = relationship("UserMealStyle", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    chef_schedules = relationship("ChefAvailability", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    special_needs = relationship("UserSpecialNeed", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    pets = relationship("Pet", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    festival_preferences = relationship("UserFestivalPreference", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    meal_criteria = relationship("UserMealCriteria", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    office_schedules = relationship("OfficeSchedule", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
     
     # Existing relationships
     stocks = relationship("Stock", back_populates="user", foreign_keys="[Stock.user_id]")
@@ -461,39 +663,31 @@ class User(Base):
     vacations = relationship("Vacation", back_populates="user")
 
 
-class FamilyMemberPriority(Base):
-    """Normalized family member priority rankings"""
-    __tablename__ = "family_member_priorities"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    family_id = Column(Integer, ForeignKey("families.id"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    priority_rank = Column(Integer, nullable=False)  # 1=highest priority
-    
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    
-    # Relationships
-    family = relationship("Family", back_populates="member_priorities")
-    user = relationship("User")
+class FamilyMembership(Base):
+    """Per-member family settings: priority ranking and portion ratio.
 
+    Replaces the former family_member_priorities and family_meal_partitions
+    tables, which both keyed on (family_id, user_id) and carried one scalar
+    each; meal-planning reads now fetch both values with a single join.
+    """
+    __tablename__ = "family_memberships"
+    __table_args__ = (
+        # Ratio sanity lives here rather than in a Python validator: the
+        # DB evaluates it once per write instead of per request
+        CheckConstraint("portion_ratio > 0", name="ck_portion_ratio_positive"),
+    )
 
-class FamilyMealPartition(Base):
-    """Normalized family meal portion ratios"""
-    __tablename__ = "family_meal_partitions"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    family_id = Column(Integer, ForeignKey("families.id"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    family_id = Column(Integer, ForeignKey("families.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True, index=True)
+    priority_rank = Column(Integer, nullable=True)  # 1=highest priority
     portion_ratio = Column(Float, nullable=False, default=1.0)  # 1.0 = normal portion
-    
+
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    
+    created_at = Column(UtcDateTime, server_default=utcnow())
+    updated_at = Column(UtcDateTime, onupdate=utcnow())
+
     # Relationships
-    family = relationship("Family", back_populates="meal_partitions")
+    family = relationship("Family", back_populates="memberships")
     user = relationship("User")
 
 
@@ -502,12 +696,12 @@ class FamilyGuestPreference(Base):
     __tablename__ = "family_guest_preferences"
     
     id = Column(Integer, primary_key=True, index=True)
-    family_id = Column(Integer, ForeignKey("families.id"), nullable=False)
+    family_id = Column(Integer, ForeignKey("families.id", ondelete="CASCADE"), nullable=False, index=True)
     preference_type = Column(String(50), nullable=False)  # cuisine, diet, spice_level, etc.
     preference_value = Column(String(100), nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(UtcDateTime, server_default=utcnow())
     
     # Relationships
     family = relationship("Family", back_populates="guest_preferences")
@@ -528,14 +722,18 @@ class Family(Base):
     is_active = Column(Boolean, default=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    
-    # Relationships
-    members = relationship("User", back_populates="family")
-    member_priorities = relationship("FamilyMemberPriority", back_populates="family", cascade="all, delete-orphan")
-    meal_partitions = relationship("FamilyMealPartition", back_populates="family", cascade="all, delete-orphan")
-    guest_preferences = relationship("FamilyGuestPreference", back_populates="family", cascade="all, delete-orphan")
+    created_at = Column(UtcDateTime, server_default=utcnow())
+    updated_at = Column(UtcDateTime, onupdate=utcnow())
+    
+    # Fetch server-generated defaults in the INSERT itself (no post-flush SELECT)
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Relationships: selectin batches member loading into one extra query
+    # for a whole list of families instead of one SELECT per family
+    members = relationship("User", back_populates="family", lazy="selectin",
+                           order_by="User.id")
+    memberships = relationship("FamilyMembership", back_populates="family", cascade="all, delete-orphan", passive_deletes=True)
+    guest_preferences = relationship("FamilyGuestPreference", back_populates="family", cascade="all, delete-orphan", passive_deletes=True)
     meals = relationship("Meal", back_populates="family")
     stocks = relationship("Stock", back_populates="family")
     snacks = relationship("Snack", back_populates="family")
@@ -545,10 +743,22 @@ class Family(Base):
 
 class Stock(Base):
     __tablename__ = "stocks"
-    
+    __table_args__ = (
+        # The analytics/alert/recommendation scans filter by owner and
+        # then by expiry window; these let the planner walk only the
+        # candidate rows instead of every row in the owner's scope
+        Index("ix_stocks_family_expiry", "family_id", "expiry_date"),
+        Index("ix_stocks_user_expiry", "user_id", "expiry_date"),
+        # Low-stock rows are a small, churning fraction of the table;
+        # a partial index keeps the low-stock probe from scanning the
+        # healthy majority (PostgreSQL only)
+        Index("ix_stocks_family_low_stock", "family_id",
+              postgresql_where=text("current_quantity <= minimum_quantity")),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
-    family_id = Column(Integer, ForeignKey("families.id"), nullable=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    family_id = Column(Integer, ForeignKey("families.id"), nullable=True, index=True)
     
     # Item Details
     item_name = Column(String(255), nullable=False)
@@ -568,7 +778,7 @@ class Stock(Base):
     # Stock Management
     current_quantity = Column(Float, nullable=False)
     minimum_quantity = Column(Float, nullable=False)
-    expiry_date = Column(DateTime(timezone=True), nullable=True)
+    expiry_date = Column(UtcDateTime, nullable=True)
     is_perishable = Column(Boolean, default=False)
     
     # Pricing
@@ -578,7 +788,7 @@ class Stock(Base):
     # Enhanced Categorization
     is_special_care_item = Column(Boolean, default=False)
     special_care_user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
-    special_care_types = Column(Text, nullable=True)  # JSON array of SpecialCareTypeEnum
+    special_care_types = Column(JSONVariant, nullable=True)  # JSON array of SpecialCareTypeEnum
     
     # Pet Food
     is_pet_food = Column(Boolean, default=False)
@@ -586,7 +796,10 @@ class Stock(Base):
     
     # Storage & Priority
     storage_type = Column(String(50), default="pantry")  # StorageTypeEnum
-    priority_level = Column(String(20), default="important")  # StockPriorityEnum
+    priority_level = Column(
+        CodedString("luxury", "nice_to_have", "important", "essential", "urgent", "critical"),
+        default="important",
+    )  # ascending urgency, superset of StockPriorityEnum
     requires_refrigeration = Column(Boolean, default=False)
     refrigeration_temperature = Column(Float, nullable=True)  # in Celsius
     
@@ -595,32 +808,65 @@ class Stock(Base):
     is_gluten_free = Column(Boolean, default=False)
     is_vegan = Column(Boolean, default=False)
     is_diabetic_friendly = Column(Boolean, default=False)
-    allergen_info = Column(Text, nullable=True)  # JSON array of allergens
+    allergen_info = Column(JSONVariant, nullable=True)  # JSON array of allergens
     
     # Family Assignment
     assignment_type = Column(String(20), default="shared")  # exclusive, preferred, shared
     assignment_notes = Column(Text, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    
-    # Relationships
-    user = relationship("User", back_populates="stocks", foreign_keys=[user_id])
-    family = relationship("Family", back_populates="stocks")
+    created_at = Column(UtcDateTime, server_default=utcnow())
+    updated_at = Column(UtcDateTime, onupdate=utcnow())
+    
+    # Relationships: the many-to-one sides are small, so joined loading
+    # folds them into the list query instead of 2N lazy SELECTs
+    user = relationship("User", back_populates="stocks", foreign_keys=[user_id],
+                        lazy="joined", innerjoin=False)
+    family = relationship("Family", back_populates="stocks", lazy="joined")
     movements = relationship("StockMovement", back_populates="stock")
     alerts = relationship("StockAlert", back_populates="stock")
+    special_care_links = relationship("StockSpecialCareType", back_populates="stock",
+                                      cascade="all, delete-orphan", passive_deletes=True)
+
+
+class StockSpecialCareType(Base):
+    """Junction table linking stocks to the special needs they serve.
+
+    Queryable/indexed companion to Stock.special_care_types: joins like
+    "all stocks covering a given special need" hit this table instead of
+    scanning JSON payloads.
+    """
+    __tablename__ = "stock_special_care_types"
+
+    stock_id = Column(Integer, ForeignKey("stocks.id", ondelete="CASCADE"), primary_key=True)
+    special_need_id = Column(Integer, ForeignKey("special_needs.id"), primary_key=True)
+
+    # Timestamps
+    created_at = Column(UtcDateTime, server_default=utcnow())
+
+    # Relationships
+    stock = relationship("Stock", back_populates="special_care_links")
+    special_need = relationship("SpecialNeed")
 
 
 class StockMovement(Base):
     __tablename__ = "stock_movements"
-    
-    id = Column(Integer, primary_key=True, index=True)
+    # On PostgreSQL this table is range-partitioned by month on "date"
+    # (see alembic revision partition_time_series)
+    __table_args__ = (
+        # Append-only, time-ordered table: BRIN stays tiny on a
+        # monotonically-increasing column while serving date-range scans
+        Index("brin_stock_movements_date", "date",
+              postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        Index("ix_stock_movements_stock_date", "stock_id", "date"),
+    )
+
+    id = Column(Integer, primary_key=True)
     stock_id = Column(Integer, ForeignKey("stocks.id"), nullable=False)
     quantity_change = Column(Float, nullable=False)  # positive for addition, negative for consumption
     movement_type = Column(String(20), nullable=False)  # addition, consumption, adjustment, expiry, damage
     reason = Column(String(255), nullable=True)
-    date = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    date = Column(UtcDateTime, nullable=False, server_default=utcnow())
     notes = Column(Text, nullable=True)
 
     # Relationships
@@ -629,16 +875,21 @@ class StockMovement(Base):
 
 class StockAlert(Base):
     __tablename__ = "stock_alerts"
-    
-    id = Column(Integer, primary_key=True, index=True)
+    __table_args__ = (
+        Index("brin_stock_alerts_created_at", "created_at",
+              postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        Index("ix_stock_alerts_stock_created", "stock_id", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
     stock_id = Column(Integer, ForeignKey("stocks.id"), nullable=False)
     alert_type = Column(String(20), nullable=False)  # low_stock, expiring_soon, expired, overstock
     message = Column(Text, nullable=False)
-    priority = Column(String(10), nullable=False)  # low, medium, high, critical
+    priority = Column(CodedString("low", "medium", "high", "critical"), nullable=False)
     is_resolved = Column(Boolean, default=False)
-    resolved_at = Column(DateTime(timezone=True), nullable=True)
+    resolved_at = Column(UtcDateTime, nullable=True)
     resolved_by = Column(Integer, ForeignKey("users.id"), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(UtcDateTime, server_default=utcnow())
 
     # Relationships
     stock = relationship("Stock", back_populates="alerts")
@@ -647,19 +898,24 @@ class StockAlert(Base):
 
 class Meal(Base):
     __tablename__ = "meals"
-    
+    __table_args__ = (
+        # GIN index enables server-side containment filters on ingredients
+        # (e.g. ingredients @> '[{"name": "rice"}]') on PostgreSQL
+        Index("ix_meal_ingredients_gin", "ingredients", postgresql_using="gin"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
-    family_id = Column(Integer, ForeignKey("families.id"), nullable=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    family_id = Column(Integer, ForeignKey("families.id"), nullable=True, index=True)
     
     # Meal Details
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
-    meal_type = Column(String(50), nullable=False)  # breakfast, lunch, dinner, snack
+    meal_type = Column(CodedString("breakfast", "lunch", "dinner", "snack"), nullable=False)
     
     # Timing
-    planned_date = Column(DateTime(timezone=True), nullable=False)
-    planned_time = Column(String(10), nullable=False)
+    planned_date = Column(UtcDateTime, nullable=False)
+    planned_time = Column(MinutesOfDay, nullable=False)
     
     # Nutritional Information
     total_calories = Column(Float, nullable=True)
@@ -668,11 +924,14 @@ class Meal(Base):
     total_fat = Column(Float, nullable=True)
     
     # Ingredients
-    ingredients = Column(Text, nullable=False)  # JSON string for ingredients with quantities
+    ingredients = Column(JSONVariant, nullable=False)  # ingredients with quantities
     cooking_instructions = Column(Text, nullable=True)
     
     # Status
-    status = Column(String(50), default="planned")  # planned, approved, cooking, completed
+    status = Column(
+        CodedString("planned", "approved", "cooking", "completed", "cancelled"),
+        default="planned",
+    )
     is_approved = Column(Boolean, default=False)
     approved_by = Column(Integer, ForeignKey("users.id"), nullable=True)
     
@@ -686,8 +945,8 @@ class Meal(Base):
     feedback = Column(Text, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(UtcDateTime, server_default=utcnow())
+    updated_at = Column(UtcDateTime, onupdate=utcnow())
     
     # Relationships
     user = relationship("User", back_populates="meals", foreign_keys=[user_id])
@@ -697,8 +956,15 @@ class Meal(Base):
 
 class HealthRecord(Base):
     __tablename__ = "health_records"
-    
-    id = Column(Integer, primary_key=True, index=True)
+    # On PostgreSQL this table is range-partitioned by month on "record_date"
+    # (see alembic revision partition_time_series)
+    __table_args__ = (
+        Index("brin_health_records_record_date", "record_date",
+              postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        Index("ix_health_records_user_record_date", "user_id", "record_date"),
+    )
+
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
     # Health Metrics
@@ -714,12 +980,12 @@ class HealthRecord(Base):
     daily_fat = Column(Float, nullable=True)
     
     # Health Conditions
-    conditions = Column(Text, nullable=True)  # JSON string for health conditions
-    medications = Column(Text, nullable=True)  # JSON string for medications
+    conditions = Column(JSONVariant, nullable=True)  # list of health conditions
+    medications = Column(JSONVariant, nullable=True)  # list of medications
     
     # Timestamps
-    record_date = Column(DateTime(timezone=True), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    record_date = Column(UtcDateTime, nullable=False)
+    created_at = Column(UtcDateTime, server_default=utcnow())
     
     # Relationships
     user = relationship("User", back_populates="health_records")
@@ -729,8 +995,8 @@ class Snack(Base):
     __tablename__ = "snacks"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
-    family_id = Column(Integer, ForeignKey("families.id"), nullable=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    family_id = Column(Integer, ForeignKey("families.id"), nullable=True, index=True)
     
     # Snack Details
     name = Column(String(255), nullable=False)
@@ -739,8 +1005,8 @@ class Snack(Base):
     
     # Timing and Frequency
     frequency = Column(String(20), nullable=False)  # daily, weekly, monthly
-    preferred_time = Column(String(10), nullable=True)  # HH:MM format
-    days_of_week = Column(Text, nullable=True)  # JSON string for specific days
+    preferred_time = Column(MinutesOfDay, nullable=True)  # "HH:MM" in Python, minutes in storage
+    days_of_week = Column(JSONVariant, nullable=True)  # list of specific days
     
     # Nutritional Information
     calories_per_serving = Column(Float, nullable=True)
@@ -753,8 +1019,8 @@ class Snack(Base):
     special_care_user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(UtcDateTime, server_default=utcnow())
+    updated_at = Column(UtcDateTime, onupdate=utcnow())
     
     # Relationships
     user = relationship("User", back_populates="snacks", foreign_keys=[user_id])
@@ -763,7 +1029,14 @@ class Snack(Base):
 
 class Guest(Base):
     __tablename__ = "guests"
-    
+    __table_args__ = (
+        # GIN index enables server-side containment filters on guest
+        # dietary preferences on PostgreSQL
+        Index("ix_guest_meal_pref_gin", "meal_preferences", postgresql_using="gin"),
+        # Dominant filter: upcoming guests for a family in a date window
+        Index("ix_guest_family_visit", "family_id", "visit_date"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     family_id = Column(Integer, ForeignKey("families.id"), nullable=False)
     
@@ -772,12 +1045,12 @@ class Guest(Base):
     guest_count = Column(Integer, nullable=False, default=1)
     
     # Meal Preferences
-    meal_preferences = Column(Text, nullable=True)  # JSON string for dietary restrictions
-    meal_timing = Column(String(10), nullable=True)  # HH:MM format
+    meal_preferences = Column(JSONVariant, nullable=True)  # dietary restrictions
+    meal_timing = Column(MinutesOfDay, nullable=True)  # "HH:MM" in Python, minutes in storage
     
     # Visit Details
-    visit_date = Column(DateTime(timezone=True), nullable=False)
-    meal_type = Column(String(50), nullable=False)  # breakfast, lunch, dinner, all
+    visit_date = Column(UtcDateTime, nullable=False)
+    meal_type = Column(CodedString("breakfast", "lunch", "dinner", "all"), nullable=False)
     duration_days = Column(Integer, default=1)
     
     # Special Requirements
@@ -785,23 +1058,33 @@ class Guest(Base):
     special_needs_details = Column(Text, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    
+    created_at = Column(UtcDateTime, server_default=utcnow())
+    # Maintained by a BEFORE UPDATE trigger on PostgreSQL (see the
+    # updated_at_triggers migration): no extra bind param per UPDATE
+    updated_at = Column(UtcDateTime, server_onupdate=FetchedValue())
+
     # Relationships
-    family = relationship("Family", back_populates="guests")
+    # Many-to-one sides are dereferenced on every list row; selectin
+    # batches them into one extra query per result set
+    family = relationship("Family", back_populates="guests", lazy="selectin")
 
 
 class MealFeedback(Base):
     __tablename__ = "meal_feedbacks"
-    
+    __table_args__ = (
+        # Per-meal feedback listing and per-user history ordered by recency;
+        # names match the indexes the partition migration creates on PG
+        Index("ix_mf_meal", "meal_id"),
+        Index("ix_meal_feedbacks_user_created_at", "user_id", "created_at"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     meal_id = Column(Integer, ForeignKey("meals.id"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
     # Feedback Details
     rating = Column(Integer, nullable=False)  # 1-5 stars
-    feedback_type = Column(String(20), nullable=False)  # like, dislike, comment
+    feedback_type = Column(CodedString("like", "dislike", "comment"), nullable=False)
     comment = Column(Text, nullable=True)
     
     # Nutritional Feedback
@@ -810,23 +1093,28 @@ class MealFeedback(Base):
     portion_rating = Column(Integer, nullable=True)  # 1-5 stars
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(UtcDateTime, server_default=utcnow())
     
     # Relationships
-    meal = relationship("Meal", back_populates="feedbacks")
-    user = relationship("User", back_populates="meal_feedbacks")
+    meal = relationship("Meal", back_populates="feedbacks", lazy="selectin")
+    user = relationship("User", back_populates="meal_feedbacks", lazy="selectin")
 
 
 class Vacation(Base):
     __tablename__ = "vacations"
-    
+    __table_args__ = (
+        # "is this user/family on vacation today" date-window probes
+        Index("ix_vac_user_dates", "user_id", "start_date", "end_date"),
+        Index("ix_vac_family_dates", "family_id", "start_date", "end_date"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     family_id = Column(Integer, ForeignKey("families.id"), nullable=True)
     
     # Vacation Details
-    start_date = Column(DateTime(timezone=True), nullable=False)
-    end_date = Column(DateTime(timezone=True), nullable=False)
+    start_date = Column(UtcDateTime, nullable=False)
+    end_date = Column(UtcDateTime, nullable=False)
     destination = Column(String(255), nullable=True)
     
     # Meal Handling
@@ -834,12 +1122,14 @@ class Vacation(Base):
     log_external_meals = Column(Boolean, default=False)
     
     # External Meal Logging
-    external_meals = Column(Text, nullable=True)  # JSON string for logged meals
+    external_meals = Column(JSONVariant, nullable=True)  # logged meals
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    
+    created_at = Column(UtcDateTime, server_default=utcnow())
+    # Maintained by a BEFORE UPDATE trigger on PostgreSQL (see the
+    # updated_at_triggers migration): no extra bind param per UPDATE
+    updated_at = Column(UtcDateTime, server_onupdate=FetchedValue())
+
     # Relationships
-    user = relationship("User", back_populates="vacations")
-    family = relationship("Family", back_populates="vacations")
+    user = relationship("User", back_populates="vacations", lazy="selectin")
+    family = relationship("Family", back_populates="vacations", lazy="selectin")
@@ -2,10 +2,25 @@
 Fixed authentication schemas with Pydantic v2 compatibility
 """
 
+# Imported eagerly so EmailStr's backing package is loaded and its
+# syntax tables built at startup, not lazily inside the first signup
+# request. EmailStr itself stays confined to the write schemas; read
+# models carry plain str since the address was validated at insert.
+import email_validator  # noqa: F401
+
 from pydantic import BaseModel, EmailStr, field_validator, Field
 from typing import Optional, List, Dict, Any
 from enum import Enum
 
+from app.schemas.payloads import (
+    ChefAvailabilityDict,
+    HHMMPattern,
+    FestivalPreferencesDict,
+    OfficeMealPreferencesDict,
+    PetsInfoDict,
+    SpecialNeedsDict,
+)
+
 
 class GenderEnum(str, Enum):
     MALE = "male"
@@ -94,30 +109,30 @@ class UserSignUp(BaseModel):
     
     # Chef Settings
     is_chef: bool = False
-    chef_availability: Optional[Dict[str, Any]] = None
+    chef_availability: Optional[ChefAvailabilityDict] = None
     
     # Special Needs
     has_special_needs: bool = False
-    special_needs_details: Optional[Dict[str, Any]] = None
+    special_needs_details: Optional[SpecialNeedsDict] = None
     
     # Pets
     has_pets: bool = False
-    pets_info: Optional[Dict[str, Any]] = None
+    pets_info: Optional[PetsInfoDict] = None
     
     # Religion and Festivals
     religion: Optional[str] = None
-    festival_preferences: Optional[Dict[str, Any]] = None
+    festival_preferences: Optional[FestivalPreferencesDict] = None
     
     # Refrigeration
     has_refrigeration: Optional[bool] = None
     
     # Meal Generation Preferences
     meal_generation_criteria: List[str] = Field(default=["stock", "region", "native"])
-    meal_timing_preference: str = Field(default="18:00", pattern=r"^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$")
+    meal_timing_preference: HHMMPattern = "18:00"
     
     # Office Meals
     needs_office_meals: bool = False
-    office_meal_preferences: Optional[Dict[str, Any]] = None
+    office_meal_preferences: Optional[OfficeMealPreferencesDict] = None
 
     @field_validator('cuisines')
     @classmethod
@@ -224,11 +239,11 @@ class FamilyCreate(BaseModel):
     
     # Special Settings
     is_chef: bool = False
-    chef_availability: Optional[Dict[str, Any]] = None
+    chef_availability: Optional[ChefAvailabilityDict] = None
     has_special_needs: bool = False
-    special_needs_details: Optional[Dict[str, Any]] = None
+    special_needs_details: Optional[SpecialNeedsDict] = None
     needs_office_meals: bool = False
-    office_meal_preferences: Optional[Dict[str, Any]] = None
+    office_meal_preferences: Optional[OfficeMealPreferencesDict] = None
     
     # Religion
     religion: Optional[str] = None
@@ -272,30 +287,30 @@ class UserUpdate(BaseModel):
     
     # Chef Settings
     is_chef: Optional[bool] = None
-    chef_availability: Optional[Dict[str, Any]] = None
+    chef_availability: Optional[ChefAvailabilityDict] = None
     
     # Special Needs
     has_special_needs: Optional[bool] = None
-    special_needs_details: Optional[Dict[str, Any]] = None
+    special_needs_details: Optional[SpecialNeedsDict] = None
     
     # Pets
     has_pets: Optional[bool] = None
-    pets_info: Optional[Dict[str, Any]] = None
+    pets_info: Optional[PetsInfoDict] = None
     
     # Religion and Festivals
     religion: Optional[str] = None
-    festival_preferences: Optional[Dict[str, Any]] = None
+    festival_preferences: Optional[FestivalPreferencesDict] = None
     
     # Refrigeration
     has_refrigeration: Optional[bool] = None
     
     # Meal Generation Preferences
     meal_generation_criteria: Optional[List[str]] = None
-    meal_timing_preference: Optional[str] = Field(None, pattern=r"^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$")
+    meal_timing_preference: Optional[HHMMPattern] = None
     
     # Office Meals
     needs_office_meals: Optional[bool] = None
-    office_meal_preferences: Optional[Dict[str, Any]] = None
+    office_meal_preferences: Optional[OfficeMealPreferencesDict] = None
 
 
 class PasswordChange(BaseModel):
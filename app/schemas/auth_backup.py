@@ -1,7 +1,31 @@
-from pydantic import BaseModel, EmailStr, field_validator, Field
-from typing import Optional, List, Dict, Any
+import re
+from pydantic import AfterValidator, BaseModel, ConfigDict, StringConstraints, create_model, field_validator, model_validator, Field
+from typing import Annotated, Optional, List, Dict, Any
 from enum import Enum
 
+from app.schemas.payloads import (
+    ChefAvailabilityDict,
+    FestivalPreferencesDict,
+    OfficeMealPreferencesDict,
+    PetsInfoDict,
+    SpecialNeedsDict,
+)
+
+
+# Syntactic check only, compiled once: EmailStr routes through the
+# email-validator package, which is far heavier than the request path
+# needs. Deliverability checking belongs in a post-signup task, not here.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _check_email(value: str) -> str:
+    if not _EMAIL_RE.match(value):
+        raise ValueError('invalid email address')
+    return value
+
+
+Email = Annotated[str, StringConstraints(max_length=254), AfterValidator(_check_email)]
+
 
 class GenderEnum(str, Enum):
     MALE = "male"
@@ -23,116 +47,180 @@ class DiningStyleEnum(str, Enum):
     OTHER = "other"
 
 
-class UserSignUpBasic(BaseModel):
-    """Basic user signup schema - minimal required fields"""
-    
-    # Authentication
-    email: EmailStr
-    password: str = Field(..., min_length=8)
-    
-    # Basic Personal Information
-    first_name: str = Field(..., min_length=1, max_length=100)
-    last_name: str = Field(..., min_length=1, max_length=100)
-    
-    # Basic Address
-    address: str = Field(..., min_length=10)
+class _SchemaBase(BaseModel):
+    """Shared config for the generated signup/update/completion schemas"""
+    model_config = ConfigDict(frozen=True, extra='forbid')
 
 
-class UserSignUp(BaseModel):
-    """User signup schema with comprehensive profile data"""
-    
+# One field-spec table shared by the four user-profile schemas below. Each
+# entry is (type, default, Field kwargs); the schemas are generated from
+# picks over this table with create_model, so Pydantic compiles each core
+# schema once per variant instead of re-declaring ~40 near-identical fields
+# four times over.
+_USER_FIELDS = {
     # Authentication
-    email: EmailStr
-    phone: str = Field(..., min_length=10, max_length=15)
-    password: str = Field(..., min_length=8)
-    country_code: str = Field(..., min_length=1, max_length=5)
-    
+    "email": (Email, ..., {}),
+    "phone": (str, ..., {"min_length": 10, "max_length": 15}),
+    "password": (str, ..., {"min_length": 8}),
+    "country_code": (str, ..., {"min_length": 1, "max_length": 5}),
+
     # Personal Information
-    first_name: str = Field(..., min_length=1, max_length=100)
-    last_name: str = Field(..., min_length=1, max_length=100)
-    height: float = Field(..., gt=0, le=300)  # in cm
-    weight: float = Field(..., gt=0, le=500)  # in kg
-    age: int = Field(..., gt=0, le=120)
-    gender: GenderEnum
-    
+    "first_name": (str, ..., {"min_length": 1, "max_length": 100}),
+    "last_name": (str, ..., {"min_length": 1, "max_length": 100}),
+    "height": (float, ..., {"gt": 0, "le": 300}),  # in cm
+    "weight": (float, ..., {"gt": 0, "le": 500}),  # in kg
+    "age": (int, ..., {"gt": 0, "le": 120}),
+    "gender": (GenderEnum, ..., {}),
+
     # Addresses
-    current_address: str = Field(..., min_length=10)
-    current_postal_code: str = Field(..., min_length=3, max_length=20)
-    current_city: str = Field(..., min_length=2, max_length=100)
-    current_country: str = Field(..., min_length=2, max_length=100)
-    
-    native_address: str = Field(..., min_length=10)
-    native_postal_code: str = Field(..., min_length=3, max_length=20)
-    native_city: str = Field(..., min_length=2, max_length=100)
-    native_country: str = Field(..., min_length=2, max_length=100)
-    
+    "current_address": (str, ..., {"min_length": 10}),
+    "current_postal_code": (str, ..., {"min_length": 3, "max_length": 20}),
+    "current_city": (str, ..., {"min_length": 2, "max_length": 100}),
+    "current_country": (str, ..., {"min_length": 2, "max_length": 100}),
+    "native_address": (str, ..., {"min_length": 10}),
+    "native_postal_code": (str, ..., {"min_length": 3, "max_length": 20}),
+    "native_city": (str, ..., {"min_length": 2, "max_length": 100}),
+    "native_country": (str, ..., {"min_length": 2, "max_length": 100}),
+
     # Budget
-    daily_budget: Optional[float] = Field(None, gt=0)
-    monthly_budget: Optional[float] = Field(None, gt=0)
-    one_time_budget: Optional[float] = Field(None, gt=0)
-    
+    "daily_budget": (Optional[float], None, {"gt": 0}),
+    "monthly_budget": (Optional[float], None, {"gt": 0}),
+    "one_time_budget": (Optional[float], None, {"gt": 0}),
+
     # Health and Diet
-    diet: DietEnum
-    preferred_meats: Optional[List[str]] = None  # for non-vegetarians
-    health_conditions: Optional[List[str]] = None
-    vitamin_deficiencies: Optional[List[str]] = None
-    
+    "diet": (DietEnum, ..., {}),
+    "preferred_meats": (Optional[List[str]], None, {}),  # for non-vegetarians
+    "health_conditions": (Optional[List[str]], None, {}),
+    "vitamin_deficiencies": (Optional[List[str]], None, {}),
+
     # Preferences
-    meal_styles: Optional[List[str]] = None  # junk, healthy, spicy, tasty
-    cuisines: List[str] = Field(..., min_items=2, max_items=6)  # mandatory + optional
-    dining_style: Optional[DiningStyleEnum] = None
-    
+    "meal_styles": (Optional[List[str]], None, {}),  # junk, healthy, spicy, tasty
+    "cuisines": (List[str], ..., {"min_length": 2, "max_length": 6}),
+    "dining_style": (Optional[DiningStyleEnum], None, {}),
+
     # Family Settings
-    is_family_account: bool = False
-    family_name: Optional[str] = None
-    meal_frequency: Optional[int] = Field(None, ge=1, le=6)  # meals per day
-    meal_timings: Optional[List[str]] = None  # meal times
-    
+    "is_family_account": (bool, False, {}),
+    "family_name": (Optional[str], None, {}),
+    "meal_frequency": (Optional[int], None, {"ge": 1, "le": 6}),  # meals per day
+    "meal_timings": (Optional[List[str]], None, {}),  # meal times
+
     # Chef Settings
-    is_chef: bool = False
-    chef_availability: Optional[Dict[str, Any]] = None
-    
+    "is_chef": (bool, False, {}),
+    "chef_availability": (Optional[ChefAvailabilityDict], None, {}),
+
     # Special Needs
-    has_special_needs: bool = False
-    special_needs_details: Optional[Dict[str, Any]] = None
-    
+    "has_special_needs": (bool, False, {}),
+    "special_needs_details": (Optional[SpecialNeedsDict], None, {}),
+
     # Pets
-    has_pets: bool = False
-    pets_info: Optional[Dict[str, Any]] = None
-    
+    "has_pets": (bool, False, {}),
+    "pets_info": (Optional[PetsInfoDict], None, {}),
+
     # Religion and Festivals
-    religion: Optional[str] = None
-    festival_preferences: Optional[Dict[str, Any]] = None
-    
+    "religion": (Optional[str], None, {}),
+    "festival_preferences": (Optional[FestivalPreferencesDict], None, {}),
+
     # Refrigeration
-    has_refrigeration: Optional[bool] = None
-    
+    "has_refrigeration": (Optional[bool], None, {}),
+
     # Meal Generation Preferences
-    meal_generation_criteria: List[str] = Field(default=["stock", "region", "native"])
-    meal_timing_preference: str = Field(default="18:00", pattern=r"^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$")
-    
+    "meal_generation_criteria": (List[str], ["stock", "region", "native"], {}),
+    "meal_timing_preference": (str, "18:00", {"pattern": r"^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$"}),
+
     # Office Meals
-    needs_office_meals: bool = False
-    office_meal_preferences: Optional[Dict[str, Any]] = None
-    
-    @field_validator('cuisines')
-    @classmethod
-    def validate_cuisines(cls, v):
-        """Validate cuisine selection"""
-        if len(v) < 2:
-            raise ValueError("At least 2 cuisines are required")
-        if len(v) > 6:
-            raise ValueError("Maximum 6 cuisines allowed")
-        return v
+    "needs_office_meals": (bool, False, {}),
+    "office_meal_preferences": (Optional[OfficeMealPreferencesDict], None, {}),
+}
+
+
+def _pick(*names):
+    """Field definitions for the given names, as declared in the table"""
+    return {
+        name: (tp, Field(default, **kwargs))
+        for name, (tp, default, kwargs) in ((n, _USER_FIELDS[n]) for n in names)
+    }
+
+
+def _pick_optional(*names):
+    """Same fields but Optional with default None (partial-update variant)"""
+    return {
+        name: (Optional[tp], Field(None, **kwargs))
+        for name, (tp, _, kwargs) in ((n, _USER_FIELDS[n]) for n in names)
+    }
+
+
+def _validate_cuisines(cls, v):
+    """Validate cuisine selection"""
+    if len(v) < 2:
+        raise ValueError("At least 2 cuisines are required")
+    if len(v) > 6:
+        raise ValueError("Maximum 6 cuisines allowed")
+    return v
+
+
+def _validate_meats_for_diet(self):
+    """Validate meat preferences for non-vegetarian diet"""
+    if self.diet == DietEnum.NON_VEGETARIAN and not self.preferred_meats:
+        raise ValueError("Meat preferences are required for non-vegetarian diet")
+    return self
+
+
+def _validate_family_name(self):
+    """Validate family name for family accounts"""
+    if self.is_family_account and not self.family_name:
+        raise ValueError("Family name is required for family accounts")
+    return self
 
 
-class UserSignIn(BaseModel):
+class UserSignUpBasic(_SchemaBase):
+    """Basic user signup schema - minimal required fields"""
+
+    # Authentication
+    email: Email
+    password: str = Field(..., min_length=8)
+
+    # Basic Personal Information
+    first_name: str = Field(..., min_length=1, max_length=100)
+    last_name: str = Field(..., min_length=1, max_length=100)
+
+    # Basic Address
+    address: str = Field(..., min_length=10)
+
+
+UserSignUp = create_model(
+    "UserSignUp",
+    __base__=_SchemaBase,
+    __doc__="User signup schema with comprehensive profile data",
+    __validators__={
+        "validate_cuisines": field_validator("cuisines")(_validate_cuisines),
+    },
+    **_pick(
+        "email", "phone", "password", "country_code",
+        "first_name", "last_name", "height", "weight", "age", "gender",
+        "current_address", "current_postal_code", "current_city", "current_country",
+        "native_address", "native_postal_code", "native_city", "native_country",
+        "daily_budget", "monthly_budget", "one_time_budget",
+        "diet", "preferred_meats", "health_conditions", "vitamin_deficiencies",
+        "meal_styles", "cuisines", "dining_style",
+        "is_family_account", "family_name", "meal_frequency", "meal_timings",
+        "is_chef", "chef_availability",
+        "has_special_needs", "special_needs_details",
+        "has_pets", "pets_info",
+        "religion", "festival_preferences",
+        "has_refrigeration",
+        "meal_generation_criteria", "meal_timing_preference",
+        "needs_office_meals", "office_meal_preferences",
+    ),
+)
+
+
+class UserSignIn(_SchemaBase):
     """User signin schema"""
     username: str = Field(..., description="Email or phone number")
     password: str = Field(..., min_length=1)
 
 
-class TokenResponse(BaseModel):
+class TokenResponse(_SchemaBase):
     """Token response schema"""
     access_token: str
     refresh_token: str
@@ -143,174 +231,79 @@ class TokenResponse(BaseModel):
 
 class UserProfileResponse(BaseModel):
     """User profile response schema"""
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid')
+
     user: Dict[str, Any]  # User model data
     access_token: Optional[str] = None
     refresh_token: Optional[str] = None
     message: str
-    
-    class Config:
-        from_attributes = True
 
 
-class FamilyCreate(BaseModel):
-    """Family member creation schema"""
-    
-    # Authentication
-    email: EmailStr
-    phone: str = Field(..., min_length=10, max_length=15)
-    password: str = Field(..., min_length=8)
-    
-    # Personal Information
-    first_name: str = Field(..., min_length=1, max_length=100)
-    last_name: str = Field(..., min_length=1, max_length=100)
-    height: float = Field(..., gt=0, le=300)
-    weight: float = Field(..., gt=0, le=500)
-    age: int = Field(..., gt=0, le=120)
-    gender: GenderEnum
-    
-    # Health and Diet
-    diet: DietEnum
-    preferred_meats: Optional[List[str]] = None
-    health_conditions: Optional[List[str]] = None
-    vitamin_deficiencies: Optional[List[str]] = None
-    
-    # Preferences
-    meal_styles: Optional[List[str]] = None
-    cuisines: List[str] = Field(..., min_items=2, max_items=6)
-    dining_style: Optional[DiningStyleEnum] = None
-    
-    # Special Settings
-    is_chef: bool = False
-    chef_availability: Optional[Dict[str, Any]] = None
-    has_special_needs: bool = False
-    special_needs_details: Optional[Dict[str, Any]] = None
-    needs_office_meals: bool = False
-    office_meal_preferences: Optional[Dict[str, Any]] = None
-    
-    # Religion
-    religion: Optional[str] = None
-    
-    @validator('preferred_meats')
-    def validate_meats_for_diet(cls, v, values):
-        """Validate meat preferences for non-vegetarian diet"""
-        if values.get('diet') == DietEnum.NON_VEGETARIAN and not v:
-            raise ValueError("Meat preferences are required for non-vegetarian diet")
-        return v
+FamilyCreate = create_model(
+    "FamilyCreate",
+    __base__=_SchemaBase,
+    __doc__="Family member creation schema",
+    __validators__={
+        "validate_meats_for_diet": model_validator(mode="after")(_validate_meats_for_diet),
+    },
+    **_pick(
+        "email", "phone", "password",
+        "first_name", "last_name", "height", "weight", "age", "gender",
+        "diet", "preferred_meats", "health_conditions", "vitamin_deficiencies",
+        "meal_styles", "cuisines", "dining_style",
+        "is_chef", "chef_availability",
+        "has_special_needs", "special_needs_details",
+        "needs_office_meals", "office_meal_preferences",
+        "religion",
+    ),
+)
 
 
-class UserUpdate(BaseModel):
-    """User profile update schema"""
-    
-    # Personal Information
-    first_name: Optional[str] = Field(None, min_length=1, max_length=100)
-    last_name: Optional[str] = Field(None, min_length=1, max_length=100)
-    height: Optional[float] = Field(None, gt=0, le=300)
-    weight: Optional[float] = Field(None, gt=0, le=500)
-    
-    # Addresses
-    current_address: Optional[str] = Field(None, min_length=10)
-    current_postal_code: Optional[str] = Field(None, min_length=3, max_length=20)
-    current_city: Optional[str] = Field(None, min_length=2, max_length=100)
-    current_country: Optional[str] = Field(None, min_length=2, max_length=100)
-    
-    native_address: Optional[str] = Field(None, min_length=10)
-    native_postal_code: Optional[str] = Field(None, min_length=3, max_length=20)
-    native_city: Optional[str] = Field(None, min_length=2, max_length=100)
-    native_country: Optional[str] = Field(None, min_length=2, max_length=100)
-    
-    # Budget
-    daily_budget: Optional[float] = Field(None, gt=0)
-    monthly_budget: Optional[float] = Field(None, gt=0)
-    one_time_budget: Optional[float] = Field(None, gt=0)
-    
-    # Health and Diet
-    diet: Optional[DietEnum] = None
-    preferred_meats: Optional[List[str]] = None
-    health_conditions: Optional[List[str]] = None
-    vitamin_deficiencies: Optional[List[str]] = None
-    
-    # Preferences
-    meal_styles: Optional[List[str]] = None
-    cuisines: Optional[List[str]] = Field(None, min_items=2, max_items=6)
-    dining_style: Optional[DiningStyleEnum] = None
-    
-    # Chef Settings
-    is_chef: Optional[bool] = None
-    chef_availability: Optional[Dict[str, Any]] = None
-    
-    # Special Needs
-    has_special_needs: Optional[bool] = None
-    special_needs_details: Optional[Dict[str, Any]] = None
-    
-    # Pets
-    has_pets: Optional[bool] = None
-    pets_info: Optional[Dict[str, Any]] = None
-    
-    # Religion and Festivals
-    religion: Optional[str] = None
-    festival_preferences: Optional[Dict[str, Any]] = None
-    
-    # Refrigeration
-    has_refrigeration: Optional[bool] = None
-    
-    # Meal Generation Preferences
-    meal_generation_criteria: Optional[List[str]] = None
-    meal_timing_preference: Optional[str] = Field(None, pattern=r"^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$")
-    
-    # Office Meals
-    needs_office_meals: Optional[bool] = None
-    office_meal_preferences: Optional[Dict[str, Any]] = None
-
-
-class ProfileCompletion(BaseModel):
-    """Mandatory profile completion schema"""
-    
-    # Required Personal Information
-    phone: str = Field(..., min_length=10, max_length=15)
-    country_code: str = Field(..., min_length=1, max_length=5)
-    height: float = Field(..., gt=0, le=300)  # in cm
-    weight: float = Field(..., gt=0, le=500)  # in kg
-    age: int = Field(..., gt=0, le=120)
-    gender: GenderEnum
-    
-    # Required Address Details
-    current_postal_code: str = Field(..., min_length=3, max_length=20)
-    current_city: str = Field(..., min_length=2, max_length=100)
-    current_country: str = Field(..., min_length=2, max_length=100)
-    
-    native_address: str = Field(..., min_length=10)
-    native_postal_code: str = Field(..., min_length=3, max_length=20)
-    native_city: str = Field(..., min_length=2, max_length=100)
-    native_country: str = Field(..., min_length=2, max_length=100)
-    
-    # Required Preferences
-    cuisines: List[str] = Field(..., min_items=2, max_items=6)
-    
-    # Family Settings
-    is_family_account: bool = False
-    family_name: Optional[str] = None
-    
-    @validator('preferred_meats')
-    def validate_meats_for_diet(cls, v, values):
-        """Validate meat preferences for non-vegetarian diet"""
-        if values.get('diet') == DietEnum.NON_VEGETARIAN and not v:
-            raise ValueError("Meat preferences are required for non-vegetarian diet")
-        return v
-    
-    @validator('family_name')
-    def validate_family_name(cls, v, values):
-        """Validate family name for family accounts"""
-        if values.get('is_family_account') and not v:
-            raise ValueError("Family name is required for family accounts")
-        return v
+UserUpdate = create_model(
+    "UserUpdate",
+    __base__=_SchemaBase,
+    __doc__="User profile update schema",
+    **_pick_optional(
+        "first_name", "last_name", "height", "weight",
+        "current_address", "current_postal_code", "current_city", "current_country",
+        "native_address", "native_postal_code", "native_city", "native_country",
+        "daily_budget", "monthly_budget", "one_time_budget",
+        "diet", "preferred_meats", "health_conditions", "vitamin_deficiencies",
+        "meal_styles", "cuisines", "dining_style",
+        "is_chef", "chef_availability",
+        "has_special_needs", "special_needs_details",
+        "has_pets", "pets_info",
+        "religion", "festival_preferences",
+        "has_refrigeration",
+        "meal_generation_criteria", "meal_timing_preference",
+        "needs_office_meals", "office_meal_preferences",
+    ),
+)
+
 
+ProfileCompletion = create_model(
+    "ProfileCompletion",
+    __base__=_SchemaBase,
+    __doc__="Mandatory profile completion schema",
+    __validators__={
+        "validate_family_name": model_validator(mode="after")(_validate_family_name),
+    },
+    **_pick(
+        "phone", "country_code", "height", "weight", "age", "gender",
+        "current_postal_code", "current_city", "current_country",
+        "native_address", "native_postal_code", "native_city", "native_country",
+        "cuisines",
+        "is_family_account", "family_name",
+    ),
+)
 
-class PasswordChange(BaseModel):
+
+class PasswordChange(_SchemaBase):
     """Password change schema"""
     current_password: str = Field(..., min_length=1)
     new_password: str = Field(..., min_length=8)
     confirm_password: str = Field(..., min_length=8)
-    
+
     @field_validator('confirm_password')
     @classmethod
     def passwords_match(cls, v, info):
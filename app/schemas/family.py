@@ -1,7 +1,12 @@
-from pydantic import BaseModel, validator, Field
-from typing import Optional, List
+import re
+from dataclasses import dataclass
+from pydantic import AfterValidator, BaseModel, ConfigDict, field_validator, model_validator, Field
+from typing import Annotated, Any, Dict, Literal, Optional, List
+from datetime import date, datetime
 from enum import Enum
 
+from app.schemas.payloads import ChefAvailabilityDict, MealPreferencesDict
+
 
 class MealTypeEnum(str, Enum):
     BREAKFAST = "breakfast"
@@ -10,13 +15,33 @@ class MealTypeEnum(str, Enum):
     SNACK = "snack"
 
 
+# Compiled once at import; per-request validation reuses the same pattern
+# instead of re-parsing the regex source
+_HHMM_RE = re.compile(r'^([01]?[0-9]|2[0-3]):[0-5][0-9]$')
+_MEAL_TYPES = frozenset({"breakfast", "lunch", "dinner", "snack"})
+
+
+def _check_hhmm(value: str) -> str:
+    if not _HHMM_RE.match(value):
+        raise ValueError('Invalid time format. Use HH:MM format')
+    return value
+
+
+# "HH:MM" string validated against the precompiled pattern
+HHMMTime = Annotated[str, AfterValidator(_check_hhmm)]
+
+
 # Base Family Schema
 class FamilyBase(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     name: str = Field(..., min_length=2, max_length=255)
     meal_frequency: int = Field(..., ge=1, le=6)  # meals per day
     meal_timings: Dict[str, str] = Field(..., min_items=1)  # meal type -> time
     
-    # Meal Partitioning
+    # Meal Partitioning. Ratios are relative weights (1.0 = normal portion)
+    # persisted on family_memberships.portion_ratio, where a CHECK
+    # constraint guards them; no per-request Python validation
     meal_partitioning: Optional[Dict[str, float]] = None  # member_id -> ratio
     
     # Priority Settings
@@ -24,28 +49,18 @@ class FamilyBase(BaseModel):
     
     # Guest Management
     guest_count: int = Field(default=0, ge=0)
-    guest_meal_preferences: Optional[Dict[str, Any]] = None
+    guest_meal_preferences: Optional[MealPreferencesDict] = None
 
-    @validator('meal_timings')
+    @field_validator('meal_timings')
+    @classmethod
     def validate_meal_timings(cls, v):
-        valid_meals = ['breakfast', 'lunch', 'dinner', 'snack']
-        if not all(meal in valid_meals for meal in v.keys()):
-            raise ValueError(f'Invalid meal types. Must be one of: {valid_meals}')
-        
+        if not _MEAL_TYPES.issuperset(v.keys()):
+            raise ValueError(f'Invalid meal types. Must be one of: {sorted(_MEAL_TYPES)}')
+
         # Validate time format HH:MM
-        import re
-        time_pattern = r'^([01]?[0-9]|2[0-3]):[0-5][0-9]$'
-        if not all(re.match(time_pattern, time) for time in v.values()):
+        if not all(_HHMM_RE.match(time) for time in v.values()):
             raise ValueError('Invalid time format. Use HH:MM format')
-        
-        return v
 
-    @validator('meal_partitioning')
-    def validate_meal_partitioning(cls, v):
-        if v:
-            total_ratio = sum(v.values())
-            if abs(total_ratio - 1.0) > 0.01:  # Allow small floating point errors
-                raise ValueError('Meal partitioning ratios must sum to 1.0')
         return v
 
 
@@ -56,13 +71,15 @@ class FamilyCreate(FamilyBase):
 
 # Family Update Schema
 class FamilyUpdate(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     name: Optional[str] = Field(None, min_length=2, max_length=255)
     meal_frequency: Optional[int] = Field(None, ge=1, le=6)
     meal_timings: Optional[Dict[str, str]] = None
     meal_partitioning: Optional[Dict[str, float]] = None
     member_priorities: Optional[List[int]] = None
     guest_count: Optional[int] = Field(None, ge=0)
-    guest_meal_preferences: Optional[Dict[str, Any]] = None
+    guest_meal_preferences: Optional[MealPreferencesDict] = None
 
 
 # Family Response Schema
@@ -71,8 +88,7 @@ class FamilyResponse(FamilyBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid')
 
 
 # Family Member Schema
@@ -83,7 +99,7 @@ class FamilyMember(BaseModel):
     email: str
     is_decision_maker: bool
     is_chef: bool
-    chef_availability: Optional[Dict[str, Any]]
+    chef_availability: Optional[ChefAvailabilityDict]
     has_special_needs: bool
     has_pets: bool
     diet: str
@@ -91,8 +107,7 @@ class FamilyMember(BaseModel):
     gender: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid')
 
 
 # Family Detail Schema (with members)
@@ -100,30 +115,32 @@ class FamilyDetail(FamilyResponse):
     members: List[FamilyMember]
     total_members: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid')
 
 
-# Family List Schema
-class FamilyList(BaseModel):
+# Family List Schema. Built from already-validated rows, so a slotted
+# dataclass instead of a BaseModel: no validation cost and no per-instance
+# __dict__ when listing many families.
+@dataclass(slots=True, frozen=True)
+class FamilyList:
     id: int
     name: str
     meal_frequency: int
     total_members: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Guest Schema
 class GuestBase(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     name: Optional[str] = Field(None, max_length=255)
     guest_count: int = Field(..., ge=1, le=20)
-    meal_preferences: Optional[Dict[str, Any]] = None
-    meal_timing: Optional[str] = Field(None, pattern=r"^([01]?[0-9]|2[0-3]):[0-5][0-9]$")
+    meal_preferences: Optional[MealPreferencesDict] = None
+    meal_timing: Optional[HHMMTime] = None
     visit_date: date
-    meal_type: str = Field(..., pattern=r"^(breakfast|lunch|dinner|all)$")
+    # Literal dispatches on an interned-string lookup instead of a regex
+    meal_type: Literal["breakfast", "lunch", "dinner", "all"]
     duration_days: int = Field(default=1, ge=1, le=30)
     has_special_needs: bool = False
     special_needs_details: Optional[str] = None
@@ -134,12 +151,14 @@ class GuestCreate(GuestBase):
 
 
 class GuestUpdate(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     name: Optional[str] = Field(None, max_length=255)
     guest_count: Optional[int] = Field(None, ge=1, le=20)
-    meal_preferences: Optional[Dict[str, Any]] = None
-    meal_timing: Optional[str] = Field(None, pattern=r"^([01]?[0-9]|2[0-3]):[0-5][0-9]$")
+    meal_preferences: Optional[MealPreferencesDict] = None
+    meal_timing: Optional[HHMMTime] = None
     visit_date: Optional[date] = None
-    meal_type: Optional[str] = Field(None, pattern=r"^(breakfast|lunch|dinner|all)$")
+    meal_type: Optional[Literal["breakfast", "lunch", "dinner", "all"]] = None
     duration_days: Optional[int] = Field(None, ge=1, le=30)
     has_special_needs: Optional[bool] = None
     special_needs_details: Optional[str] = None
@@ -151,12 +170,13 @@ class GuestResponse(GuestBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid')
 
 
 # Meal Partitioning Schema
 class MealPartitioning(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     member_id: int
     ratio: float = Field(..., gt=0, le=1)
     meal_types: List[str] = Field(..., min_items=1)  # breakfast, lunch, dinner, snack
@@ -164,35 +184,40 @@ class MealPartitioning(BaseModel):
 
 # Chef Availability Schema
 class ChefAvailability(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     days_of_week: List[str] = Field(..., min_items=1)  # Monday, Tuesday, etc.
     meal_types: List[str] = Field(..., min_items=1)  # breakfast, lunch, dinner, snack
-    start_time: str = Field(..., pattern=r"^([01]?[0-9]|2[0-3]):[0-5][0-9]$")
-    end_time: str = Field(..., pattern=r"^([01]?[0-9]|2[0-3]):[0-5][0-9]$")
+    start_time: HHMMTime
+    end_time: HHMMTime
     is_available: bool = True
     notes: Optional[str] = None
 
-    @validator('days_of_week')
+    @field_validator('days_of_week')
+    @classmethod
     def validate_days(cls, v):
         valid_days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
         if not all(day in valid_days for day in v):
             raise ValueError(f'Invalid days. Must be one of: {valid_days}')
         return v
 
-    @validator('end_time')
-    def validate_time_range(cls, v, values):
-        if 'start_time' in values:
-            from datetime import datetime
-            start = datetime.strptime(values['start_time'], '%H:%M')
-            end = datetime.strptime(v, '%H:%M')
-            if end <= start:
-                raise ValueError('End time must be after start time')
-        return v
+    @model_validator(mode='after')
+    def validate_time_range(self):
+        # HHMMTime already guarantees the format; compare as (hour, minute)
+        # tuples instead of round-tripping through strptime
+        start = tuple(int(part) for part in self.start_time.split(':'))
+        end = tuple(int(part) for part in self.end_time.split(':'))
+        if end <= start:
+            raise ValueError('End time must be after start time')
+        return self
 
 
 # Family Settings Update Schema
 class FamilySettingsUpdate(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     meal_frequency: Optional[int] = Field(None, ge=1, le=6)
     meal_timings: Optional[Dict[str, str]] = None
     meal_partitioning: Optional[Dict[str, float]] = None
     member_priorities: Optional[List[int]] = None
-    guest_meal_preferences: Optional[Dict[str, Any]] = None
+    guest_meal_preferences: Optional[MealPreferencesDict] = None
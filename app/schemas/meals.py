@@ -1,8 +1,26 @@
-from pydantic import BaseModel, validator, Field
-from typing import Optional, List
+import re
+from dataclasses import dataclass
+from pydantic import AfterValidator, BaseModel, ConfigDict, TypeAdapter, field_validator, Field
+from typing import Annotated, Any, Dict, Optional, List
+from datetime import date, datetime
 from enum import Enum
 
 
+# Compiled once at import; per-request validation reuses the same pattern
+# instead of re-parsing the regex source
+_HHMM_RE = re.compile(r'^([01]?[0-9]|2[0-3]):[0-5][0-9]$')
+
+
+def _check_hhmm(value: str) -> str:
+    if not _HHMM_RE.match(value):
+        raise ValueError('Invalid time format. Use HH:MM format')
+    return value
+
+
+# "HH:MM" string validated against the precompiled pattern
+HHMMTime = Annotated[str, AfterValidator(_check_hhmm)]
+
+
 class MealTypeEnum(str, Enum):
     BREAKFAST = "breakfast"
     LUNCH = "lunch"
@@ -26,13 +44,15 @@ class FeedbackTypeEnum(str, Enum):
 
 # Base Meal Schema
 class MealBase(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     name: str = Field(..., min_length=2, max_length=255)
     description: Optional[str] = None
     meal_type: MealTypeEnum
     
     # Timing
     planned_date: date
-    planned_time: str = Field(..., pattern=r"^([01]?[0-9]|2[0-3]):[0-5][0-9]$")
+    planned_time: HHMMTime
     
     # Nutritional Information
     total_calories: Optional[float] = Field(None, gt=0)
@@ -51,7 +71,8 @@ class MealBase(BaseModel):
     is_office_meal: bool = False
     is_guest_meal: bool = False
 
-    @validator('ingredients')
+    @field_validator('ingredients')
+    @classmethod
     def validate_ingredients(cls, v):
         required_fields = ['name', 'quantity', 'unit']
         for ingredient in v:
@@ -62,17 +83,22 @@ class MealBase(BaseModel):
 
 # Meal Create Schema
 class MealCreate(MealBase):
+    # Mutable: the create route injects user_id/family_id after validation
+    model_config = ConfigDict(frozen=False, extra='forbid')
+
     user_id: Optional[int] = None
     family_id: Optional[int] = None
 
 
 # Meal Update Schema
 class MealUpdate(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     name: Optional[str] = Field(None, min_length=2, max_length=255)
     description: Optional[str] = None
     meal_type: Optional[MealTypeEnum] = None
     planned_date: Optional[date] = None
-    planned_time: Optional[str] = Field(None, pattern=r"^([01]?[0-9]|2[0-3]):[0-5][0-9]$")
+    planned_time: Optional[HHMMTime] = None
     total_calories: Optional[float] = Field(None, gt=0)
     total_protein: Optional[float] = Field(None, gt=0)
     total_carbs: Optional[float] = Field(None, gt=0)
@@ -97,12 +123,20 @@ class MealResponse(MealBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid')
+
 
+# Built once at import: validating a whole list through one adapter enters
+# pydantic-core a single time instead of once per element, which is the
+# recommended way to validate row batches
+MEALS_ADAPTER = TypeAdapter(List[MealResponse])
 
-# Meal List Schema
-class MealList(BaseModel):
+
+# Meal List Schema. Built from rows the ORM already validated, so this is
+# a plain slotted dataclass: no per-field validation on construction and no
+# __dict__ per instance, which matters when listing hundreds of meals.
+@dataclass(slots=True, frozen=True)
+class MealList:
     id: int
     name: str
     meal_type: MealTypeEnum
@@ -113,18 +147,19 @@ class MealList(BaseModel):
     total_calories: Optional[float]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Meal Approval Schema
 class MealApproval(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     is_approved: bool
     notes: Optional[str] = None
 
 
 # Meal Generation Request Schema
 class MealGenerationRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     generation_date: date
     meal_types: List[MealTypeEnum] = Field(..., min_items=1)
     user_id: Optional[int] = None
@@ -145,6 +180,8 @@ class MealGenerationRequest(BaseModel):
 
 # Meal Generation Response Schema
 class MealGenerationResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     meals: List[MealResponse]
     total_calories: float
     total_protein: float
@@ -157,6 +194,8 @@ class MealGenerationResponse(BaseModel):
 
 # Meal Feedback Schema
 class MealFeedbackBase(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     rating: int = Field(..., ge=1, le=5)
     feedback_type: FeedbackTypeEnum
     comment: Optional[str] = None
@@ -172,6 +211,8 @@ class MealFeedbackCreate(MealFeedbackBase):
 
 
 class MealFeedbackUpdate(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     rating: Optional[int] = Field(None, ge=1, le=5)
     feedback_type: Optional[FeedbackTypeEnum] = None
     comment: Optional[str] = None
@@ -186,12 +227,13 @@ class MealFeedbackResponse(MealFeedbackBase):
     user_id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid')
 
 
 # Meal Plan Schema (for weekly/daily planning)
 class MealPlan(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     date: date
     meals: List[MealResponse]
     total_nutrition: Dict[str, float]
@@ -201,6 +243,8 @@ class MealPlan(BaseModel):
 
 # Meal Template Schema (for reusable meal patterns)
 class MealTemplate(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     name: str = Field(..., min_length=2, max_length=255)
     description: Optional[str] = None
     meal_type: MealTypeEnum
@@ -219,6 +263,8 @@ class MealTemplateCreate(MealTemplate):
 
 
 class MealTemplateUpdate(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     name: Optional[str] = Field(None, min_length=2, max_length=255)
     description: Optional[str] = None
     meal_type: Optional[MealTypeEnum] = None
@@ -237,12 +283,12 @@ class MealTemplateResponse(MealTemplate):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid')
 
 
-# Meal History Schema
-class MealHistory(BaseModel):
+# Meal History Schema. Internal aggregate container, see MealList.
+@dataclass(slots=True, frozen=True)
+class MealHistory:
     date: date
     meals: List[MealResponse]
     total_calories: float
@@ -250,8 +296,9 @@ class MealHistory(BaseModel):
     feedback_count: int
 
 
-# Meal Analytics Schema
-class MealAnalytics(BaseModel):
+# Meal Analytics Schema. Internal aggregate container, see MealList.
+@dataclass(slots=True, frozen=True)
+class MealAnalytics:
     total_meals: int
     average_rating: float
     favorite_meals: List[str]
@@ -0,0 +1,101 @@
+"""
+TypedDict shapes for the JSON blob fields shared across schemas.
+
+``chef_availability``, ``pets_info`` and friends were typed
+``Dict[str, Any]``, which sends pydantic-core through its generic dict
+validator (a deep copy per request to enforce ``Any``). A ``TypedDict``
+compiles to a fixed field-by-field check instead and documents what the
+JSON columns actually hold. All are ``total=False``: every key is
+optional and unknown keys are ignored, matching the free-form payloads
+already in the database.
+"""
+
+import re
+
+from typing import List
+
+from pydantic import AfterValidator
+from typing_extensions import Annotated, TypedDict
+
+
+class FromORMFastMixin:
+    """Unvalidated ORM-row -> response-model conversion.
+
+    Response models built from rows the database already constrained
+    gain nothing from re-validation; model_construct assigns fields
+    directly. Only for trusted reads - client input keeps going through
+    model_validate.
+    """
+
+    @classmethod
+    def from_orm_fast(cls, obj):
+        return cls.model_construct(
+            **{name: getattr(obj, name) for name in cls.model_fields}
+        )
+
+# HH:MM wall-clock string. One Pattern compiled here at import is
+# shared by every field using the alias; a StringConstraints pattern
+# would be recompiled into each field's core schema instead.
+_HHMM_RE = re.compile(r"^([01]?[0-9]|2[0-3]):[0-5][0-9]$")
+
+
+def _validate_hhmm(v: str) -> str:
+    if not _HHMM_RE.match(v):
+        raise ValueError("must be a time in HH:MM format")
+    return v
+
+
+HHMMPattern = Annotated[str, AfterValidator(_validate_hhmm)]
+
+
+class ChefAvailabilityDict(TypedDict, total=False):
+    """Weekly cooking window for a chef member"""
+    days_of_week: List[str]
+    start_time: str  # HH:MM
+    end_time: str  # HH:MM
+
+
+class SpecialNeedsDict(TypedDict, total=False):
+    """Dietary/medical conditions attached to a user"""
+    conditions: List[str]
+    severity: str
+    notes: str
+
+
+class PetDict(TypedDict, total=False):
+    """One pet entry inside pets_info"""
+    name: str
+    pet_type: str
+    breed: str
+    age: int
+    weight: float
+    dietary_restrictions: str
+
+
+class PetsInfoDict(TypedDict, total=False):
+    """Household pets payload"""
+    pets: List[PetDict]
+    notes: str
+
+
+class MealPreferencesDict(TypedDict, total=False):
+    """Dietary preferences for a guest or a group"""
+    diet: str
+    cuisines: List[str]
+    allergies: List[str]
+    notes: str
+
+
+class FestivalPreferencesDict(TypedDict, total=False):
+    """Festival observance details"""
+    festivals: List[str]
+    fasting_days: List[str]
+    notes: str
+
+
+class OfficeMealPreferencesDict(TypedDict, total=False):
+    """Office meal delivery details"""
+    days_of_week: List[str]
+    meal_types: List[str]
+    delivery_time: str  # HH:MM
+    office_address: str
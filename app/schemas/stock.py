@@ -1,17 +1,27 @@
-from pydantic import BaseModel, validator, Field
-from typing import Optional, List, Dict, Any
+from contextvars import ContextVar
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model, field_validator, Field
+from pydantic.fields import FieldInfo
+from typing import Literal, Optional, List, Dict, Any
 from enum import Enum
 from datetime import date, datetime
+from .payloads import FromORMFastMixin
 from .stock_categories import (
-    StockCategoryEnum,
-    PetFoodTypeEnum,
-    SpecialCareTypeEnum,
-    StorageTypeEnum,
-    StockPriorityEnum,
-    AssignmentTypeEnum
+    AssignmentTypeLiteral,
+    PetFoodTypeLiteral,
+    SpecialCareTypeLiteral,
+    StockCategoryLiteral,
+    StockPriorityLiteral,
+    StorageTypeLiteral,
 )
 
 
+# Batch-scoped "today" for expiry validation. date.today() goes through a
+# syscall; during a bulk import that fires once per row for the same
+# answer. validate_items pins it for the duration of the batch.
+_IMPORT_TODAY: ContextVar[Optional[date]] = ContextVar("stock_import_today", default=None)
+
+
 # Enhanced Stock Schemas with Categorization
 
 
@@ -25,15 +35,17 @@ class UnitEnum(str, Enum):
     BOTTLES = "bottles"
     CANS = "cans"
 
+UnitLiteral = Literal[tuple(e.value for e in UnitEnum)]  # type: ignore[valid-type]
+
 
 # Base Stock Schema with Enhanced Categorization
 class StockBase(BaseModel):
     item_name: str = Field(..., min_length=2, max_length=255)
-    category: StockCategoryEnum
+    category: StockCategoryLiteral
     subcategory: Optional[str] = Field(None, max_length=100)
     brand: Optional[str] = Field(None, max_length=100)
     weight: float = Field(..., gt=0)
-    unit: UnitEnum = UnitEnum.KG
+    unit: UnitLiteral = "kg"
     
     # Nutritional Information (per 100g)
     calories_per_100g: Optional[float] = Field(None, ge=0)
@@ -54,15 +66,15 @@ class StockBase(BaseModel):
     
     # Enhanced Categorization
     is_special_care_item: bool = False
-    special_care_types: Optional[List[SpecialCareTypeEnum]] = None
+    special_care_types: Optional[List[SpecialCareTypeLiteral]] = None
     
     # Pet Food
     is_pet_food: bool = False
-    pet_type: Optional[PetFoodTypeEnum] = None
+    pet_type: Optional[PetFoodTypeLiteral] = None
     
     # Storage & Priority
-    storage_type: StorageTypeEnum = StorageTypeEnum.PANTRY
-    priority_level: StockPriorityEnum = StockPriorityEnum.IMPORTANT
+    storage_type: StorageTypeLiteral = "pantry"
+    priority_level: StockPriorityLiteral = "important"
     requires_refrigeration: bool = False
     refrigeration_temperature: Optional[float] = Field(None, ge=-50, le=50)  # Celsius
     
@@ -74,18 +86,24 @@ class StockBase(BaseModel):
     allergen_info: Optional[List[str]] = None
     
     # Family Assignment
-    assignment_type: AssignmentTypeEnum = AssignmentTypeEnum.SHARED
+    assignment_type: AssignmentTypeLiteral = "shared"
     assignment_notes: Optional[str] = None
 
-    @validator('minimum_quantity')
-    def validate_minimum_quantity(cls, v, values):
-        if 'current_quantity' in values and v > values['current_quantity']:
+    @field_validator('minimum_quantity')
+    @classmethod
+    def validate_minimum_quantity(cls, v, info):
+        if 'current_quantity' in info.data and v > info.data['current_quantity']:
             raise ValueError('Minimum quantity cannot be greater than current quantity')
         return v
 
-    @validator('expiry_date')
+    @field_validator('expiry_date')
+    @classmethod
     def validate_expiry_date(cls, v):
-        if v and v < date.today():
+        # Bail before touching the ContextVar or the clock; most rows in
+        # bulk imports carry no expiry date at all.
+        if v is None:
+            return v
+        if v < (_IMPORT_TODAY.get() or date.today()):
             raise ValueError('Expiry date cannot be in the past')
         return v
 
@@ -97,55 +115,41 @@ class StockCreate(StockBase):
     special_care_user_id: Optional[int] = None
 
 
-# Stock Update Schema
-class StockUpdate(BaseModel):
-    item_name: Optional[str] = Field(None, min_length=2, max_length=255)
-    category: Optional[StockCategoryEnum] = None
-    subcategory: Optional[str] = Field(None, max_length=100)
-    brand: Optional[str] = Field(None, max_length=100)
-    weight: Optional[float] = Field(None, gt=0)
-    unit: Optional[UnitEnum] = None
-    calories_per_100g: Optional[float] = Field(None, ge=0)
-    protein_per_100g: Optional[float] = Field(None, ge=0)
-    carbs_per_100g: Optional[float] = Field(None, ge=0)
-    fat_per_100g: Optional[float] = Field(None, ge=0)
-    fiber_per_100g: Optional[float] = Field(None, ge=0)
-    current_quantity: Optional[float] = Field(None, gt=0)
-    minimum_quantity: Optional[float] = Field(None, ge=0)
-    expiry_date: Optional[date] = None
-    is_perishable: Optional[bool] = None
-    price_per_unit: Optional[float] = Field(None, ge=0)
-    currency: Optional[str] = None
-    
-    # Enhanced Categorization
-    is_special_care_item: Optional[bool] = None
-    special_care_types: Optional[List[SpecialCareTypeEnum]] = None
-    special_care_user_id: Optional[int] = None
-    
-    # Pet Food
-    is_pet_food: Optional[bool] = None
-    pet_type: Optional[PetFoodTypeEnum] = None
-    
-    # Storage & Priority
-    storage_type: Optional[StorageTypeEnum] = None
-    priority_level: Optional[StockPriorityEnum] = None
-    requires_refrigeration: Optional[bool] = None
-    refrigeration_temperature: Optional[float] = Field(None, ge=-50, le=50)
-    
-    # Health & Diet
-    is_organic: Optional[bool] = None
-    is_gluten_free: Optional[bool] = None
-    is_vegan: Optional[bool] = None
-    is_diabetic_friendly: Optional[bool] = None
-    allergen_info: Optional[List[str]] = None
-    
-    # Family Assignment
-    assignment_type: Optional[AssignmentTypeEnum] = None
-    assignment_notes: Optional[str] = None
+# Built once at import: the bulk-import path validates whole batches
+# through these instead of constructing one model per item, entering
+# pydantic-core a single time per call
+STOCK_CREATE_ADAPTER = TypeAdapter(StockCreate)
+STOCK_LIST_ADAPTER = TypeAdapter(List[StockCreate])
+
+
+# Stock Update Schema: every StockCreate field made optional, minus the
+# ownership columns a PATCH may not move. Constraints (gt/ge/lengths)
+# carry over from the source FieldInfo, so the two can't drift apart.
+def _optional_fields(source, exclude=()):
+    return {
+        name: (
+            Optional[field.annotation],
+            FieldInfo.merge_field_infos(field, FieldInfo(default=None)),
+        )
+        for name, field in source.model_fields.items()
+        if name not in exclude
+    }
+
+
+StockUpdate = create_model(
+    "StockUpdate",
+    __doc__="Partial stock update payload",
+    **_optional_fields(StockCreate, exclude=("user_id", "family_id")),
+)
+
+
+# Known-at-import field set for PATCH handlers to intersect with
+# allowed columns without re-reading model_fields per request
+STOCK_UPDATE_FIELDS = frozenset(StockUpdate.model_fields)
 
 
 # Stock Response Schema
-class StockResponse(StockBase):
+class StockResponse(FromORMFastMixin, StockBase):
     id: int
     user_id: Optional[int]
     family_id: Optional[int]
@@ -153,52 +157,44 @@ class StockResponse(StockBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid')
+
+
+# Stock List Schema: a projection of StockResponse. The field list is the
+# single source of truth; annotations are pulled from StockResponse so the
+# two can't drift apart.
+_LIST_FIELDS = (
+    "id", "item_name", "category", "subcategory", "brand",
+    "current_quantity", "unit", "minimum_quantity", "expiry_date",
+    "is_perishable", "price_per_unit",
+    "is_special_care_item", "special_care_types", "is_pet_food",
+    "pet_type", "storage_type", "priority_level",
+    "requires_refrigeration",
+    "is_organic", "is_gluten_free", "is_vegan", "is_diabetic_friendly",
+    "assignment_type", "created_at",
+)
 
 
-# Stock List Schema
-class StockList(BaseModel):
-    id: int
-    item_name: str
-    category: StockCategoryEnum
-    subcategory: Optional[str]
-    brand: Optional[str]
-    current_quantity: float
-    unit: UnitEnum
-    minimum_quantity: float
-    expiry_date: Optional[date]
-    is_perishable: bool
-    price_per_unit: Optional[float]
-    
-    # Enhanced Categorization
-    is_special_care_item: bool
-    special_care_types: Optional[List[SpecialCareTypeEnum]]
-    is_pet_food: bool
-    pet_type: Optional[PetFoodTypeEnum]
-    storage_type: StorageTypeEnum
-    priority_level: StockPriorityEnum
-    requires_refrigeration: bool
-    
-    # Health & Diet
-    is_organic: bool
-    is_gluten_free: bool
-    is_vegan: bool
-    is_diabetic_friendly: bool
-    
-    # Family Assignment
-    assignment_type: AssignmentTypeEnum
-    created_at: datetime
+class _StockListBase(FromORMFastMixin, BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid')
+
 
-    class Config:
-        from_attributes = True
+StockList = create_model(
+    "StockList",
+    __base__=_StockListBase,
+    __doc__="Compact stock projection for list endpoints",
+    **{
+        name: (StockResponse.model_fields[name].annotation, ...)
+        for name in _LIST_FIELDS
+    },
+)
 
 
 # Stock Movement Schema
 class StockMovementCreate(BaseModel):
     stock_id: int
     quantity_change: float
-    movement_type: str = Field(..., pattern=r"^(addition|consumption|adjustment|expiry|damage)$")
+    movement_type: Literal["addition", "consumption", "adjustment", "expiry", "damage"]
     movement_date: date = Field(default_factory=date.today)
     notes: Optional[str] = None
     reason: Optional[str] = None
@@ -207,15 +203,24 @@ class StockMovementCreate(BaseModel):
 # Stock Alert Schema
 class StockAlert(BaseModel):
     stock_id: int
-    alert_type: str = Field(..., pattern=r"^(low_stock|expiring_soon|expired|overstock)$")
+    alert_type: Literal["low_stock", "expiring_soon", "expired", "overstock"]
     message: str
-    priority: str = Field(..., pattern=r"^(low|medium|high|critical)$")
+    priority: Literal["low", "medium", "high", "critical"]
     is_resolved: bool = False
     resolved_at: Optional[datetime] = None
     resolved_by: Optional[int] = None
 
 
 # Stock Analytics Schema
+class ExpiryRiskEntry(BaseModel):
+    """One at-risk item in the analytics expiry report"""
+    item_name: str
+    days_until_expiry: int
+    current_quantity: float
+    priority: Literal["high", "medium"]
+    action_required: str
+
+
 class StockAnalytics(BaseModel):
     total_items: int
     total_value: float
@@ -225,13 +230,27 @@ class StockAnalytics(BaseModel):
     category_distribution: Dict[str, int]
     value_by_category: Dict[str, float]
     consumption_trends: Dict[str, float]
-    expiry_risk: List[Dict[str, Any]]
+    # Typed entries validate on the core fast path instead of recursing
+    # through Any
+    expiry_risk: List[ExpiryRiskEntry]
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "StockAnalytics":
+        """Build from the aggregates the service just computed.
+
+        The values come straight out of our own aggregation code, so
+        re-validating every dict entry per request buys nothing;
+        model_construct assigns them directly.
+        """
+        return cls.model_construct(
+            **{name: data[name] for name in cls.model_fields}
+        )
 
 
 # Enhanced Stock Search Schema
 class StockSearch(BaseModel):
     query: Optional[str] = None
-    category: Optional[StockCategoryEnum] = None
+    category: Optional[StockCategoryLiteral] = None
     subcategory: Optional[str] = None
     brand: Optional[str] = None
     is_perishable: Optional[bool] = None
@@ -239,11 +258,11 @@ class StockSearch(BaseModel):
     
     # Enhanced Categorization Filters
     is_special_care: Optional[bool] = None
-    special_care_types: Optional[List[SpecialCareTypeEnum]] = None
+    special_care_types: Optional[List[SpecialCareTypeLiteral]] = None
     is_pet_food: Optional[bool] = None
-    pet_type: Optional[PetFoodTypeEnum] = None
-    storage_type: Optional[StorageTypeEnum] = None
-    priority_level: Optional[StockPriorityEnum] = None
+    pet_type: Optional[PetFoodTypeLiteral] = None
+    storage_type: Optional[StorageTypeLiteral] = None
+    priority_level: Optional[StockPriorityLiteral] = None
     
     # Health & Diet Filters
     is_organic: Optional[bool] = None
@@ -252,7 +271,7 @@ class StockSearch(BaseModel):
     is_diabetic_friendly: Optional[bool] = None
     
     # Family Assignment Filters
-    assignment_type: Optional[AssignmentTypeEnum] = None
+    assignment_type: Optional[AssignmentTypeLiteral] = None
     assigned_to_user_id: Optional[int] = None
     
     # Price and Date Filters
@@ -270,21 +289,35 @@ class StockImport(BaseModel):
     overwrite_existing: bool = False
     skip_duplicates: bool = True
 
+    @classmethod
+    def validate_items(cls, raw: bytes) -> List[StockCreate]:
+        """Validate a raw JSON array of items in one pydantic-core pass.
+
+        Routes straight into the batched JSON parser - no Python-side
+        json.loads and no per-item model __init__. Today's date is
+        resolved once for the whole batch.
+        """
+        token = _IMPORT_TODAY.set(date.today())
+        try:
+            return STOCK_LIST_ADAPTER.validate_json(raw)
+        finally:
+            _IMPORT_TODAY.reset(token)
+
 
 # Stock Export Schema
 class StockExport(BaseModel):
-    format: str = Field(..., pattern=r"^(csv|json|excel)$")
+    format: Literal["csv", "json", "excel"]
     include_nutritional_info: bool = True
     include_pricing: bool = True
     include_timestamps: bool = False
-    categories: Optional[List[StockCategoryEnum]] = None
+    categories: Optional[List[StockCategoryLiteral]] = None
 
 
 # Stock Template Schema (for common items)
 class StockTemplate(BaseModel):
     name: str = Field(..., min_length=2, max_length=255)
-    category: StockCategoryEnum
-    default_unit: UnitEnum
+    category: StockCategoryLiteral
+    default_unit: UnitLiteral
     default_minimum_quantity: float
     default_price: Optional[float] = None
     nutritional_info: Optional[Dict[str, float]] = None
@@ -300,8 +333,8 @@ class StockTemplateCreate(StockTemplate):
 
 class StockTemplateUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=2, max_length=255)
-    category: Optional[StockCategoryEnum] = None
-    default_unit: Optional[UnitEnum] = None
+    category: Optional[StockCategoryLiteral] = None
+    default_unit: Optional[UnitLiteral] = None
     default_minimum_quantity: Optional[float] = None
     default_price: Optional[float] = None
     nutritional_info: Optional[Dict[str, float]] = None
@@ -311,13 +344,12 @@ class StockTemplateUpdate(BaseModel):
     tags: Optional[List[str]] = None
 
 
-class StockTemplateResponse(StockTemplate):
+class StockTemplateResponse(FromORMFastMixin, StockTemplate):
     id: int
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid')
 
 
 # Stock Reconciliation Schema
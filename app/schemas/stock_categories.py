@@ -2,8 +2,10 @@
 Enhanced stock categorization schemas and enums for better organization.
 """
 
+import sys
+
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -46,6 +48,28 @@ class StockCategoryEnum(str, Enum):
     HOUSEHOLD_ITEMS = "household_items"
     MEDICAL_SUPPLIES = "medical_supplies"
 
+# pydantic validates Literal[str, ...] with an interned-string lookup;
+# use this in schema fields, keep the Enum for ORM/code references
+StockCategoryLiteral = Literal[tuple(e.value for e in StockCategoryEnum)]  # type: ignore[valid-type]
+
+class PetFoodTypeEnum(str, Enum):
+    """Pet types for pet food stock items"""
+    DOG = "dog"
+    CAT = "cat"
+    BIRD = "bird"
+    FISH = "fish"
+    OTHER = "other"
+
+PetFoodTypeLiteral = Literal[tuple(e.value for e in PetFoodTypeEnum)]  # type: ignore[valid-type]
+
+class AssignmentTypeEnum(str, Enum):
+    """How a stock item is assigned to family members"""
+    EXCLUSIVE = "exclusive"
+    PREFERRED = "preferred"
+    SHARED = "shared"
+
+AssignmentTypeLiteral = Literal[tuple(e.value for e in AssignmentTypeEnum)]  # type: ignore[valid-type]
+
 class SpecialCareTypeEnum(str, Enum):
     """Types of special care requirements"""
     DIABETIC = "diabetic"
@@ -59,6 +83,8 @@ class SpecialCareTypeEnum(str, Enum):
     ALLERGY_SPECIFIC = "allergy_specific"
     WEIGHT_MANAGEMENT = "weight_management"
 
+SpecialCareTypeLiteral = Literal[tuple(e.value for e in SpecialCareTypeEnum)]  # type: ignore[valid-type]
+
 class StorageTypeEnum(str, Enum):
     """Storage requirements"""
     PANTRY = "pantry"
@@ -67,6 +93,8 @@ class StorageTypeEnum(str, Enum):
     COOL_DRY_PLACE = "cool_dry_place"
     ROOM_TEMPERATURE = "room_temperature"
 
+StorageTypeLiteral = Literal[tuple(e.value for e in StorageTypeEnum)]  # type: ignore[valid-type]
+
 class StockPriorityEnum(str, Enum):
     """Stock priority levels"""
     ESSENTIAL = "essential"
@@ -74,6 +102,16 @@ class StockPriorityEnum(str, Enum):
     NICE_TO_HAVE = "nice_to_have"
     LUXURY = "luxury"
 
+StockPriorityLiteral = Literal[tuple(e.value for e in StockPriorityEnum)]  # type: ignore[valid-type]
+
+# Intern the values that key the analytics distribution dicts so Literal
+# key matching in pydantic-core stays a pointer comparison even when the
+# incoming keys were built at runtime (e.g. f-strings or DB rows).
+for _enum in (StorageTypeEnum, StockPriorityEnum):
+    for _member in _enum:
+        sys.intern(_member.value)
+del _enum, _member
+
 class FamilyMemberStockAssignment(BaseModel):
     """Assignment of stock to specific family members"""
     family_member_id: int
@@ -94,7 +132,7 @@ class EnhancedStockCreate(BaseModel):
     """Enhanced stock creation with better categorization"""
     # Basic Info
     item_name: str
-    category: StockCategoryEnum
+    category: StockCategoryLiteral
     subcategory: Optional[str] = None
     brand: Optional[str] = None
     
@@ -108,12 +146,12 @@ class EnhancedStockCreate(BaseModel):
     is_pet_food: bool = False
     pet_type: Optional[str] = None
     is_special_care_item: bool = False
-    special_care_types: List[SpecialCareTypeEnum] = []
+    special_care_types: List[SpecialCareTypeLiteral] = []
     assigned_family_members: List[FamilyMemberStockAssignment] = []
     
     # Storage & Priority
-    storage_type: StorageTypeEnum = StorageTypeEnum.PANTRY
-    priority_level: StockPriorityEnum = StockPriorityEnum.IMPORTANT
+    storage_type: StorageTypeLiteral = "pantry"
+    priority_level: StockPriorityLiteral = "important"
     
     # Nutritional & Health
     is_organic: bool = False
@@ -165,5 +203,7 @@ class StockCategoryAnalytics(BaseModel):
     family_distribution: List[FamilyStockDistribution]
     pet_food_stats: Dict[str, Any]
     special_care_stats: Dict[str, Any]
-    storage_distribution: Dict[StorageTypeEnum, int]
-    priority_distribution: Dict[StockPriorityEnum, int]
+    # Literal keys match by interned-pointer equality; Enum keys would
+    # round-trip through _value2member_map_ on every analytics build.
+    storage_distribution: Dict[StorageTypeLiteral, int]
+    priority_distribution: Dict[StockPriorityLiteral, int]
@@ -0,0 +1,50 @@
+"""
+msgspec projection of StockList for the stock listing hot path.
+
+A stock listing can serialize thousands of rows per request; building a
+pydantic StockList per row pays per-field validator dispatch that adds
+nothing for data the database already constrained. This Struct mirrors
+StockList's fields, costs one C-level constructor call per row and
+encodes natively through app.schemas.structs.json_response. The
+pydantic StockList stays as the OpenAPI source of truth.
+"""
+
+from datetime import datetime
+from typing import Any, Optional
+
+import msgspec
+
+
+class StockListFast(msgspec.Struct, frozen=True, gc=False):
+    """Field-for-field mirror of app.schemas.stock.StockList"""
+    id: int
+    item_name: str
+    category: str
+    subcategory: Optional[str]
+    brand: Optional[str]
+    current_quantity: float
+    unit: str
+    minimum_quantity: float
+    expiry_date: Optional[datetime]
+    is_perishable: Optional[bool]
+    price_per_unit: Optional[float]
+    is_special_care_item: Optional[bool]
+    special_care_types: Any  # JSON array, already decoded by the driver
+    is_pet_food: Optional[bool]
+    pet_type: Optional[str]
+    storage_type: Optional[str]
+    priority_level: Optional[str]
+    requires_refrigeration: Optional[bool]
+    is_organic: Optional[bool]
+    is_gluten_free: Optional[bool]
+    is_vegan: Optional[bool]
+    is_diabetic_friendly: Optional[bool]
+    assignment_type: Optional[str]
+    created_at: Optional[datetime]
+
+
+def from_row(row) -> StockListFast:
+    """Build the projection straight off an ORM row, no validation pass"""
+    return StockListFast(
+        *[getattr(row, name) for name in StockListFast.__struct_fields__]
+    )
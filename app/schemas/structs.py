@@ -0,0 +1,111 @@
+"""
+msgspec.Struct request schemas for the hottest endpoints.
+
+Signup and meal generation decode their JSON bodies with msgspec instead
+of going through FastAPI's Pydantic layer: one reusable Decoder per type
+parses and validates in a single C pass, with no per-field Python
+attribute sets. The matching Pydantic models in app.schemas.auth /
+app.schemas.meals stay as the OpenAPI source of truth; routes attach
+their JSON schema via openapi_extra.
+"""
+
+import re
+from datetime import date
+from typing import List, Literal, Optional
+
+import msgspec
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel
+
+# Same syntactic check the Pydantic Email alias compiles: one non-space
+# local part, one domain with a dot, and the RFC length cap. Heavier
+# deliverability checking stays out of the request path.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+class UserSignUpBasic(msgspec.Struct, frozen=True, gc=False):
+    """Basic user signup payload - minimal required fields"""
+    email: str
+    password: str
+    first_name: str
+    last_name: str
+    address: str
+
+    def __post_init__(self):
+        if len(self.email) > 254 or not _EMAIL_RE.match(self.email):
+            raise ValueError("email must be a valid email address")
+        if len(self.password) < 8:
+            raise ValueError("password must be at least 8 characters")
+        if not 1 <= len(self.first_name) <= 100:
+            raise ValueError("first_name must be 1-100 characters")
+        if not 1 <= len(self.last_name) <= 100:
+            raise ValueError("last_name must be 1-100 characters")
+        if len(self.address) < 10:
+            raise ValueError("address must be at least 10 characters")
+
+
+class MealGenerationRequest(msgspec.Struct, gc=False):
+    """Meal generation payload; mutable because the route injects
+    user_id/family_id from the authenticated user"""
+    generation_date: date
+    meal_types: List[Literal["breakfast", "lunch", "dinner", "snack"]]
+    user_id: Optional[int] = None
+    family_id: Optional[int] = None
+
+    # Generation Criteria
+    use_stock: bool = True
+    use_region_based: bool = True
+    use_native_based: bool = True
+    prioritize_expiry: bool = True
+
+    # Special Requirements
+    include_guests: bool = False
+    guest_count: int = 0
+    is_office_meal: bool = False
+    special_dietary_needs: Optional[List[str]] = None
+
+    def __post_init__(self):
+        if not self.meal_types:
+            raise ValueError("meal_types must contain at least 1 item")
+
+
+# One decoder instance per type, built at import time
+_DECODERS = {
+    UserSignUpBasic: msgspec.json.Decoder(UserSignUpBasic),
+    MealGenerationRequest: msgspec.json.Decoder(MealGenerationRequest),
+}
+
+
+def decode_body(body: bytes, struct_type):
+    """Decode and validate a request body, raising 422 like FastAPI does"""
+    try:
+        return _DECODERS[struct_type].decode(body)
+    except (msgspec.ValidationError, msgspec.DecodeError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+
+
+def _enc_hook(obj):
+    # Nested Pydantic models (e.g. MealResponse inside MealHistory) are the
+    # only types the encoder cannot handle natively
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise NotImplementedError(f"cannot encode {type(obj).__name__}")
+
+
+# One shared encoder; msgspec handles dataclasses, enums, dates and
+# datetimes in C without a jsonable_encoder pass
+_ENCODER = msgspec.json.Encoder(enc_hook=_enc_hook)
+
+
+def json_response(content) -> Response:
+    """Serialize dataclass/struct response payloads directly with msgspec.
+
+    Returning a Response makes FastAPI skip response_model validation and
+    jsonable_encoder entirely; the route's response_model still documents
+    the shape in OpenAPI.
+    """
+    return Response(content=_ENCODER.encode(content),
+                    media_type="application/json")
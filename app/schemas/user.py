@@ -1,7 +1,17 @@
-from pydantic import BaseModel, EmailStr, validator, Field
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, EmailStr, field_validator, Field
+from typing import List, Literal, Optional
+from datetime import datetime
 from enum import Enum
 
+from app.schemas.payloads import (
+    ChefAvailabilityDict,
+    FromORMFastMixin,
+    HHMMPattern,
+    FestivalPreferencesDict,
+    OfficeMealPreferencesDict,
+    PetsInfoDict,
+)
+
 
 class GenderEnum(str, Enum):
     MALE = "male"
@@ -59,14 +69,14 @@ class UserBase(BaseModel):
     
     # Preferences
     meal_styles: Optional[List[str]] = None
-    cuisines: List[str] = Field(..., min_items=2, max_items=6)
+    cuisines: List[str] = Field(..., min_length=2, max_length=6)
     dining_style: Optional[DiningStyleEnum] = None
     
     # Family Settings
     is_family_account: bool = False
     is_decision_maker: bool = False
     is_chef: bool = False
-    chef_availability: Optional[Dict[str, Any]] = None
+    chef_availability: Optional[ChefAvailabilityDict] = None
     
     # Special Needs
     has_special_needs: bool = False
@@ -74,51 +84,46 @@ class UserBase(BaseModel):
     
     # Pets
     has_pets: bool = False
-    pets_info: Optional[Dict[str, Any]] = None
+    pets_info: Optional[PetsInfoDict] = None
     
     # Religion and Festivals
     religion: Optional[str] = None
-    festival_preferences: Optional[Dict[str, Any]] = None
+    festival_preferences: Optional[FestivalPreferencesDict] = None
     
     # Refrigeration
     has_refrigeration: Optional[bool] = None
     
     # Meal Generation Preferences
-    meal_generation_criteria: List[str] = Field(..., min_items=1)
-    meal_timing_preference: str = Field(default="18:00", pattern=r"^([01]?[0-9]|2[0-3]):[0-5][0-9]$")
+    # pydantic-core enforces the membership check; no Python validator
+    meal_generation_criteria: List[
+        Literal["stock_based", "region_based", "native_based"]
+    ] = Field(..., min_length=1)
+    meal_timing_preference: HHMMPattern = "18:00"
     
     # Office Meals
     needs_office_meals: bool = False
-    office_meal_preferences: Optional[Dict[str, Any]] = None
+    office_meal_preferences: Optional[OfficeMealPreferencesDict] = None
 
-    @validator('preferred_meats')
-    def validate_preferred_meats(cls, v, values):
-        if v and values.get('diet') != DietEnum.NON_VEGETARIAN:
+    @field_validator('preferred_meats')
+    @classmethod
+    def validate_preferred_meats(cls, v, info):
+        # Most payloads omit meats entirely; skip the diet lookup for them
+        if not v:
+            return v
+        if info.data.get('diet') != DietEnum.NON_VEGETARIAN:
             raise ValueError('Preferred meats can only be set for non-vegetarian diets')
         return v
 
-    @validator('cuisines')
-    def validate_cuisines(cls, v):
-        if len(v) < 2:
-            raise ValueError('At least 2 cuisines must be selected')
-        return v
-
-    @validator('meal_generation_criteria')
-    def validate_meal_generation_criteria(cls, v):
-        valid_criteria = ['stock_based', 'region_based', 'native_based']
-        if not all(criteria in valid_criteria for criteria in v):
-            raise ValueError(f'Invalid meal generation criteria. Must be one of: {valid_criteria}')
-        return v
-
 
 # User Create Schema
 class UserCreate(UserBase):
     password: str = Field(..., min_length=8)
     password_confirm: str = Field(..., min_length=8)
 
-    @validator('password_confirm')
-    def passwords_match(cls, v, values):
-        if 'password' in values and v != values['password']:
+    @field_validator('password_confirm')
+    @classmethod
+    def passwords_match(cls, v, info):
+        if 'password' in info.data and v != info.data['password']:
             raise ValueError('Passwords do not match')
         return v
 
@@ -163,7 +168,7 @@ class UserUpdate(BaseModel):
     is_family_account: Optional[bool] = None
     is_decision_maker: Optional[bool] = None
     is_chef: Optional[bool] = None
-    chef_availability: Optional[Dict[str, Any]] = None
+    chef_availability: Optional[ChefAvailabilityDict] = None
     
     # Special Needs
     has_special_needs: Optional[bool] = None
@@ -171,26 +176,31 @@ class UserUpdate(BaseModel):
     
     # Pets
     has_pets: Optional[bool] = None
-    pets_info: Optional[Dict[str, Any]] = None
+    pets_info: Optional[PetsInfoDict] = None
     
     # Religion and Festivals
     religion: Optional[str] = None
-    festival_preferences: Optional[Dict[str, Any]] = None
+    festival_preferences: Optional[FestivalPreferencesDict] = None
     
     # Refrigeration
     has_refrigeration: Optional[bool] = None
     
     # Meal Generation Preferences
     meal_generation_criteria: Optional[List[str]] = None
-    meal_timing_preference: Optional[str] = Field(None, pattern=r"^([01]?[0-9]|2[0-3]):[0-5][0-9]$")
+    meal_timing_preference: Optional[HHMMPattern] = None
     
     # Office Meals
     needs_office_meals: Optional[bool] = None
-    office_meal_preferences: Optional[Dict[str, Any]] = None
+    office_meal_preferences: Optional[OfficeMealPreferencesDict] = None
+
+
+# Known-at-import field set for PATCH handlers to intersect with
+# allowed columns without re-reading model_fields per request
+USER_UPDATE_FIELDS = frozenset(UserUpdate.model_fields)
 
 
 # User Response Schema
-class UserResponse(BaseModel):
+class UserResponse(FromORMFastMixin, BaseModel):
     id: int
     email: str
     phone: str
@@ -234,7 +244,7 @@ class UserResponse(BaseModel):
     family_id: Optional[int]
     is_decision_maker: bool
     is_chef: bool
-    chef_availability: Optional[Dict[str, Any]]
+    chef_availability: Optional[ChefAvailabilityDict]
     
     # Special Needs
     has_special_needs: bool
@@ -242,11 +252,11 @@ class UserResponse(BaseModel):
     
     # Pets
     has_pets: bool
-    pets_info: Optional[Dict[str, Any]]
+    pets_info: Optional[PetsInfoDict]
     
     # Religion and Festivals
     religion: Optional[str]
-    festival_preferences: Optional[Dict[str, Any]]
+    festival_preferences: Optional[FestivalPreferencesDict]
     
     # Refrigeration
     has_refrigeration: Optional[bool]
@@ -257,18 +267,17 @@ class UserResponse(BaseModel):
     
     # Office Meals
     needs_office_meals: bool
-    office_meal_preferences: Optional[Dict[str, Any]]
+    office_meal_preferences: Optional[OfficeMealPreferencesDict]
     
     # Timestamps
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid')
 
 
 # User List Schema
-class UserList(BaseModel):
+class UserList(FromORMFastMixin, BaseModel):
     id: int
     first_name: str
     last_name: str
@@ -277,12 +286,11 @@ class UserList(BaseModel):
     family_id: Optional[int]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid')
 
 
 # User Profile Schema (for dashboard display)
-class UserProfile(BaseModel):
+class UserProfile(FromORMFastMixin, BaseModel):
     id: int
     first_name: str
     last_name: str
@@ -300,5 +308,4 @@ class UserProfile(BaseModel):
     is_chef: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid')
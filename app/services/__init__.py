@@ -19,20 +19,15 @@ from .strategies import (
     MealGenerationStrategyFactory,
 )
 
-# Import service interfaces and base classes
-try:
-    from app.core.base import (
-        ServiceInterface,
-        CacheInterface,
-        NotificationInterface,
-        AIServiceInterface,
-    )
-except ImportError:
-    # Fallback if base interfaces are not available
-    ServiceInterface = object
-    CacheInterface = object
-    NotificationInterface = object
-    AIServiceInterface = object
+# Service interfaces and base classes. app.core.base ships with the
+# package, so import it directly; the old ImportError fallback to bare
+# `object` only hid broken installs until a subclass failed later.
+from app.core.base import (
+    ServiceInterface,
+    CacheInterface,
+    NotificationInterface,
+    AIServiceInterface,
+)
 
 __all__ = [
     # Core services
@@ -0,0 +1,61 @@
+"""
+Refresh hooks for the meal_analytics_mv materialized view.
+
+The view (see the meal_analytics_mv migration) pre-aggregates the meal
+analytics per user/family scope. It goes stale whenever meals or
+feedback change, so ORM flush events mark the session and an
+after_commit listener refreshes the view once per dirtying transaction.
+REFRESH ... CONCURRENTLY runs outside the request transaction and does
+not block readers; there is no task queue in this deployment, so the
+refresh happens inline post-commit rather than being handed off to a
+worker.
+
+No-ops entirely on non-PostgreSQL binds (dev/test SQLite has no view).
+"""
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from config.logging_config import logger
+
+from app.models.user import Meal, MealFeedback
+
+_DIRTY_KEY = "meal_analytics_mv_dirty"
+
+
+def refresh_meal_analytics_mv(bind) -> None:
+    """Refresh the analytics view; silently skip on non-PG binds"""
+    if bind.dialect.name != "postgresql":
+        return
+    try:
+        # CONCURRENTLY refuses to run inside a transaction block and
+        # SQLAlchemy autobegins one on execute; AUTOCOMMIT sends the
+        # statement on a bare connection instead
+        with bind.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as conn:
+            conn.execute(
+                text("REFRESH MATERIALIZED VIEW CONCURRENTLY meal_analytics_mv")
+            )
+    except Exception as e:
+        # A stale view is served until the next refresh; never fail the
+        # request over it.
+        logger.warning(f"meal_analytics_mv refresh failed: {str(e)}")
+
+
+def _mark_dirty(mapper, connection, target) -> None:
+    session = Session.object_session(target)
+    if session is not None:
+        session.info[_DIRTY_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _refresh_if_dirty(session) -> None:
+    if session.info.pop(_DIRTY_KEY, False):
+        refresh_meal_analytics_mv(session.get_bind())
+
+
+for _model in (Meal, MealFeedback):
+    event.listen(_model, "after_insert", _mark_dirty)
+    event.listen(_model, "after_update", _mark_dirty)
+    event.listen(_model, "after_delete", _mark_dirty)
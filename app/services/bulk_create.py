@@ -0,0 +1,48 @@
+"""
+Bulk insert helpers for burst-written tables.
+
+Guests and meal feedback arrive in batches (a family rating a week of
+meals, bulk-inviting visitors). Going through session.add() per row makes
+the unit of work emit one INSERT plus RETURNING per object; executing a
+Core insert with a list of parameter dicts instead compiles one statement
+and sends the whole batch in a single multi-valued INSERT
+(insertmanyvalues), skipping ORM object construction and attribute
+tracking entirely.
+
+Callers that need the new ids should pass returning_ids=True; otherwise
+the round-trip for RETURNING is skipped too.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.user import Guest, MealFeedback
+
+
+def bulk_create_feedback(
+    db: Session, rows: List[Dict[str, Any]], returning_ids: bool = False
+) -> Optional[List[int]]:
+    """Insert feedback rows in one statement; flushes, does not commit"""
+    return _bulk_insert(db, MealFeedback, rows, returning_ids)
+
+
+def bulk_create_guests(
+    db: Session, rows: List[Dict[str, Any]], returning_ids: bool = False
+) -> Optional[List[int]]:
+    """Insert guest rows in one statement; flushes, does not commit"""
+    return _bulk_insert(db, Guest, rows, returning_ids)
+
+
+def _bulk_insert(db, model, rows, returning_ids):
+    if not rows:
+        return [] if returning_ids else None
+    if returning_ids:
+        result = db.execute(insert(model).returning(model.id), rows)
+        ids = [row[0] for row in result]
+    else:
+        db.execute(insert(model), rows)
+        ids = None
+    db.flush()
+    return ids
@@ -5,10 +5,19 @@ This service now follows SOLID principles and uses the strategy pattern
 for different meal generation algorithms.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from sqlalchemy import and_, func, insert, select
 from sqlalchemy.orm import Session
+from collections import defaultdict, namedtuple
 from datetime import date, datetime
+import asyncio
+import hashlib
 import logging
+import random
+
+import msgspec
+import orjson
+from functools import lru_cache
 
 from app.core.base import (
     ServiceInterface,
@@ -31,6 +40,209 @@ from app.services.strategies.meal_generation_strategy import MealGenerationStrat
 logger = logging.getLogger(__name__)
 
 
+# Forbidden-ingredient words per diet; filtering intersects these with
+# each template's precomputed token set, a single C-level frozenset
+# operation instead of a regex scan over the template text.
+_DIET_FORBIDDEN: Dict[str, frozenset] = {
+    'vegetarian': frozenset({'meat', 'chicken', 'beef', 'fish'}),
+    'vegan': frozenset({'meat', 'chicken', 'beef', 'fish', 'dairy', 'eggs'}),
+}
+
+
+# Columns the generation pipeline actually reads from a stock row. The
+# hot read fetches these instead of full ORM Stock instances, skipping
+# identity-map and instance-init work per row; StockRow keeps the same
+# attribute names so the matching and nutrition code is unaffected.
+_STOCK_COLUMNS = (
+    Stock.id, Stock.item_name, Stock.current_quantity,
+    Stock.minimum_quantity, Stock.unit, Stock.expiry_date,
+    Stock.price_per_unit, Stock.calories_per_100g, Stock.protein_per_100g,
+    Stock.carbs_per_100g, Stock.fat_per_100g, Stock.fiber_per_100g,
+    Stock.is_perishable, Stock.is_special_care_item,
+)
+
+StockRow = namedtuple("StockRow", [column.key for column in _STOCK_COLUMNS])
+
+
+def _tokens(name: str) -> frozenset:
+    """Lowered word tokens of an item or ingredient name.
+
+    Includes the full lowered name so exact matches hit first; commas
+    are treated as separators ("tomatoes, diced").
+    """
+    lowered = name.lower().replace(',', ' ')
+    tokens = set(lowered.split())
+    tokens.add(name.lower().strip())
+    return frozenset(tokens)
+
+
+# Strong references to in-flight background tasks; the event loop only
+# keeps weak ones, so without this a fire-and-forget task can be
+# garbage-collected mid-flight.
+_background_tasks: set = set()
+
+
+def _task_done(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Background task failed: {task.exception()}")
+
+
+def _spawn_background(coro) -> None:
+    """Schedule a best-effort coroutine without awaiting it.
+
+    Used for the post-generation side work (cache writes, notification)
+    so a slow cache or notification provider never adds latency to the
+    response. Failures are logged by the done callback.
+    """
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_task_done)
+
+
+@lru_cache(maxsize=1024)
+def _parse_json_field(raw: str):
+    """Parse a serialized user preference column, memoized on the raw string.
+
+    Template selection runs per meal per day but the preference strings
+    change only when the profile is edited, so repeat parses are cache
+    hits. Callers must treat the result as read-only - it is shared
+    across calls.
+    """
+    return orjson.loads(raw)
+
+
+def _load_meal_templates() -> List[Dict[str, Any]]:
+    """Load meal templates for local testing."""
+    templates = [
+        {
+            'name': 'Healthy Breakfast Bowl',
+            'meal_type': 'breakfast',
+            'cuisine': 'international',
+            'ingredients': [
+                {'name': 'oats', 'quantity': 50, 'unit': 'g'},
+                {'name': 'milk', 'quantity': 200, 'unit': 'ml'},
+                {'name': 'banana', 'quantity': 1, 'unit': 'pcs'},
+                {'name': 'honey', 'quantity': 10, 'unit': 'g'},
+                {'name': 'nuts', 'quantity': 20, 'unit': 'g'}
+            ],
+            'cooking_instructions': 'Cook oats with milk, top with sliced banana, honey, and nuts.',
+            'calories': 350,
+            'protein': 12,
+            'carbs': 55,
+            'fat': 8
+        },
+        {
+            'name': 'Grilled Chicken Salad',
+            'meal_type': 'lunch',
+            'cuisine': 'mediterranean',
+            'ingredients': [
+                {'name': 'chicken breast', 'quantity': 150, 'unit': 'g'},
+                {'name': 'lettuce', 'quantity': 100, 'unit': 'g'},
+                {'name': 'tomatoes', 'quantity': 100, 'unit': 'g'},
+                {'name': 'olive oil', 'quantity': 15, 'unit': 'ml'},
+                {'name': 'lemon', 'quantity': 1, 'unit': 'pcs'}
+            ],
+            'cooking_instructions': 'Grill chicken, chop vegetables, mix with olive oil and lemon.',
+            'calories': 280,
+            'protein': 35,
+            'carbs': 8,
+            'fat': 12
+        },
+        {
+            'name': 'Vegetarian Pasta',
+            'meal_type': 'dinner',
+            'cuisine': 'italian',
+            'ingredients': [
+                {'name': 'pasta', 'quantity': 100, 'unit': 'g'},
+                {'name': 'tomato sauce', 'quantity': 150, 'unit': 'ml'},
+                {'name': 'vegetables', 'quantity': 150, 'unit': 'g'},
+                {'name': 'cheese', 'quantity': 30, 'unit': 'g'},
+                {'name': 'herbs', 'quantity': 5, 'unit': 'g'}
+            ],
+            'cooking_instructions': 'Cook pasta, prepare sauce with vegetables, combine and top with cheese.',
+            'calories': 420,
+            'protein': 15,
+            'carbs': 65,
+            'fat': 12
+        }
+    ]
+
+    # Lowered word tokens of the searchable template text (name,
+    # instructions, ingredient names), built once at load; diet
+    # filtering intersects _DIET_FORBIDDEN with this set instead of
+    # scanning the template text on every pass.
+    for template in templates:
+        template['_ingredient_tokens'] = frozenset(
+            ' '.join(
+                [template['name'], template['cooking_instructions']]
+                + [i['name'] for i in template['ingredients']]
+            ).lower().split()
+        )
+        # Ingredient names normalized once here; stock matching reads
+        # these (lowered name, token set, quantity, unit) tuples instead
+        # of re-tokenizing static template data on every generation.
+        template['_ingredients_norm'] = tuple(
+            (i['name'].lower(), _tokens(i['name']), i['quantity'], i['unit'])
+            for i in template['ingredients']
+        )
+
+    return templates
+
+
+def _load_nutritional_data() -> Dict[str, Any]:
+    """Load nutritional data for common ingredients."""
+    return {
+        'oats': {'calories': 389, 'protein': 16.9, 'carbs': 66.3, 'fat': 6.9},
+        'milk': {'calories': 42, 'protein': 3.4, 'carbs': 5.0, 'fat': 1.0},
+        'banana': {'calories': 89, 'protein': 1.1, 'carbs': 22.8, 'fat': 0.3},
+        'chicken breast': {'calories': 165, 'protein': 31.0, 'carbs': 0.0, 'fat': 3.6},
+        'lettuce': {'calories': 15, 'protein': 1.4, 'carbs': 2.9, 'fat': 0.1},
+        'pasta': {'calories': 131, 'protein': 5.0, 'carbs': 25.0, 'fat': 1.1}
+    }
+
+
+def _build_template_indices(templates: List[Dict[str, Any]]):
+    """Index templates by (meal_type, diet) and cuisine at load time.
+
+    Templates are static, so the diet regexes run once per template and
+    _get_meal_template becomes dict lookups instead of three linear
+    filter passes per generated meal.
+    """
+    by_type_diet: Dict[Tuple[str, str], List[Dict[str, Any]]] = defaultdict(list)
+    by_type_diet_cuisine: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = defaultdict(list)
+    
+    for template in templates:
+        meal_type = template['meal_type']
+        diet_keys = ['any'] + [
+            diet for diet, forbidden in _DIET_FORBIDDEN.items()
+            if not (forbidden & template['_ingredient_tokens'])
+        ]
+        for diet in diet_keys:
+            by_type_diet[(meal_type, diet)].append(template)
+            by_type_diet_cuisine[(meal_type, diet, template['cuisine'])].append(template)
+    
+    # Tuples: slightly faster to index than lists, and fixed after build
+    return (
+        {key: tuple(values) for key, values in by_type_diet.items()},
+        {key: tuple(values) for key, values in by_type_diet_cuisine.items()},
+    )
+
+
+# Templates and nutrition tables are static; build them and their
+# lookup indices once at import instead of per MealService instance
+# (one instance per request under dependency injection).
+_MEAL_TEMPLATES = _load_meal_templates()
+_NUTRITIONAL_DATA = _load_nutritional_data()
+
+# The factory holds only stateless strategy singletons; one shared
+# instance serves every request-scoped MealService
+_STRATEGY_FACTORY = MealGenerationStrategyFactory()
+_TEMPLATES_BY_TYPE_DIET, _TEMPLATES_BY_TYPE_DIET_CUISINE = (
+    _build_template_indices(_MEAL_TEMPLATES)
+)
+
+
 class MealService(ServiceInterface[Meal, Any, Any, MealResponse]):
     """
     Refactored service for AI-powered meal generation and management.
@@ -45,10 +257,6 @@ class MealService(ServiceInterface[Meal, Any, Any, MealResponse]):
         ai_service: AIServiceInterface,
         notification_service: NotificationInterface,
     ):
-        self.cache_service = cache_service
-        self.ai_service = ai_service
-        self.notification_service = notification_service
-        self.strategy_factory = MealGenerationStrategyFactory()
         """
         Initialize the meal service with dependencies.
         
@@ -60,13 +268,13 @@ class MealService(ServiceInterface[Meal, Any, Any, MealResponse]):
         self.cache_service = cache_service
         self.ai_service = ai_service
         self.notification_service = notification_service
-        self.strategy_factory = MealGenerationStrategyFactory()
+        self.strategy_factory = _STRATEGY_FACTORY
         
-        # Mock meal templates for local testing
-        self.meal_templates = self._load_meal_templates()
-        
-        # Mock nutritional data
-        self.nutritional_data = self._load_nutritional_data()
+        # Shared static tables built once at module import
+        self.meal_templates = _MEAL_TEMPLATES
+        self.nutritional_data = _NUTRITIONAL_DATA
+        self._templates_by_type_diet = _TEMPLATES_BY_TYPE_DIET
+        self._templates_by_type_diet_cuisine = _TEMPLATES_BY_TYPE_DIET_CUISINE
 
     async def create(
         self, obj_in: Any, db: Session, **kwargs
@@ -135,13 +343,21 @@ class MealService(ServiceInterface[Meal, Any, Any, MealResponse]):
             Result containing generated meals or error information
         """
         try:
-            # Get user/family preferences
-            user = await self._get_user(generation_request, db)
+            # Get user/family preferences and stock in one round-trip
+            user, stock_items = await self._get_user_and_stock(generation_request, db)
             if not user:
                 return Result.failure_result("User not found")
-
-            # Get available stock
-            stock_items = await self._get_available_stock(generation_request, db)
+            
+            # Re-submits with the same request against an unchanged stock
+            # snapshot are idempotent; serve them from cache instead of
+            # re-running the strategy
+            cache_key = self._generation_cache_key(generation_request, stock_items)
+            cached = await self._get_cached_generation(cache_key)
+            if cached is not None:
+                return Result.success_result(
+                    data=cached,
+                    message=f"Returned {len(cached)} cached meals"
+                )
             
             # Determine strategy based on user preferences
             strategy = self._select_generation_strategy(generation_request, user)
@@ -150,14 +366,18 @@ class MealService(ServiceInterface[Meal, Any, Any, MealResponse]):
             result = await strategy.generate_meals(user, stock_items, generation_request)
             
             if result.success:
-                # Cache the generated meals
-                await self._cache_generated_meals(
+                # Cache writes and the notification are best-effort and
+                # off the response path: spawn them instead of awaiting,
+                # so a slow provider never delays the caller. Today's
+                # date is resolved once here rather than per cache write
+                # in batch runs.
+                _spawn_background(self._cache_generated_meals(
                     generation_request.user_id or generation_request.family_id,
-                    result.data
-                )
-                
-                # Send notification if enabled
-                await self._send_generation_notification(user, result.data)
+                    result.data,
+                    date.today().isoformat(),
+                ))
+                _spawn_background(self._store_cached_generation(cache_key, result.data))
+                _spawn_background(self._send_generation_notification(user, result.data))
             
             return result
 
@@ -165,15 +385,78 @@ class MealService(ServiceInterface[Meal, Any, Any, MealResponse]):
             logger.error(f"Failed to generate meals: {str(e)}")
             return Result.failure_result(f"Meal generation failed: {str(e)}")
 
+    async def _get_user_and_stock(
+        self, generation_request: MealGenerationRequest, db: Session
+    ) -> Tuple[Optional[User], List[StockRow]]:
+        """Fetch the requesting user and their available stock together.
+
+        One outer-joined statement replaces the two sequential queries
+        generate_meals used to issue, halving the round-trips for the
+        prep phase. Running the old pair concurrently was not an option:
+        a sync Session may not be used from two threads at once. Stock
+        comes back as plain StockRow tuples, not ORM instances.
+        """
+        if generation_request.user_id:
+            user_clause = User.id == generation_request.user_id
+            stock_clauses = [Stock.user_id == generation_request.user_id]
+        elif generation_request.family_id:
+            # Pin the join to one member (the lowest id, matching the old
+            # query.first()); joining the whole family would replicate
+            # every pantry row once per member
+            user_clause = User.id == (
+                select(func.min(User.id))
+                .where(User.family_id == generation_request.family_id)
+                .scalar_subquery()
+            )
+            stock_clauses = [Stock.family_id == generation_request.family_id]
+        else:
+            return None, []
+        
+        if generation_request.use_stock:
+            stock_clauses.append(Stock.current_quantity > 0)
+        if generation_request.prioritize_expiry:
+            stock_clauses.append(Stock.expiry_date.isnot(None))
+        
+        stmt = (
+            select(User, *_STOCK_COLUMNS)
+            .outerjoin(Stock, and_(*stock_clauses))
+            .where(user_clause)
+            .order_by(
+                User.id,
+                Stock.expiry_date if generation_request.prioritize_expiry else Stock.id,
+            )
+        )
+        
+        # yield_per keeps the driver streaming fixed-size partitions
+        # (server-side cursor on PostgreSQL) instead of buffering the
+        # whole pantry before the first row is seen
+        stmt = stmt.execution_options(yield_per=500)
+        rows = await asyncio.to_thread(lambda: db.execute(stmt).all())
+        if not rows:
+            return None, []
+        
+        # Family scope can join several users; keep the first, as the old
+        # query.first() did
+        user = rows[0][0]
+        stock_items = [
+            StockRow(*row[1:]) for row in rows
+            if row[0] is user and row[1] is not None
+        ]
+        return user, stock_items
+
     async def _get_user(
         self, generation_request: MealGenerationRequest, db: Session
     ) -> Optional[User]:
         """Get user for meal generation."""
+        # The sync Session blocks; run the round-trip off the event loop
+        # so other requests keep being served while the query is in flight
         if generation_request.user_id:
-            return db.query(User).filter(User.id == generation_request.user_id).first()
+            query = db.query(User).filter(User.id == generation_request.user_id)
         elif generation_request.family_id:
-            return db.query(User).filter(User.family_id == generation_request.family_id).first()
-        return None
+            query = db.query(User).filter(User.family_id == generation_request.family_id)
+        else:
+            return None
+        return await asyncio.to_thread(query.first)
 
     async def _get_available_stock(
         self, generation_request: MealGenerationRequest, db: Session
@@ -194,7 +477,11 @@ class MealService(ServiceInterface[Meal, Any, Any, MealResponse]):
             query = query.filter(Stock.expiry_date.isnot(None))
             query = query.order_by(Stock.expiry_date)
         
-        return query.all()
+        # Same event-loop protection as _get_user: the fetch runs in a
+        # worker thread, only the query construction stays on the loop.
+        # Streamed in partitions so a thousands-row pantry never sits in
+        # the driver buffer twice.
+        return await asyncio.to_thread(lambda: list(query.yield_per(500)))
 
     def _select_generation_strategy(
         self, generation_request: MealGenerationRequest, user: User
@@ -203,7 +490,7 @@ class MealService(ServiceInterface[Meal, Any, Any, MealResponse]):
         # Check user preferences for strategy selection
         if hasattr(user, 'meal_generation_criteria'):
             try:
-                criteria = json.loads(user.meal_generation_criteria)
+                criteria = _parse_json_field(user.meal_generation_criteria)
                 
                 # Health-focused strategy for users with health conditions
                 if criteria.get('health_focused', False):
@@ -217,16 +504,58 @@ class MealService(ServiceInterface[Meal, Any, Any, MealResponse]):
                 if criteria.get('stock_utilization', False):
                     return self.strategy_factory.get_strategy("stock")
                     
-            except (json.JSONDecodeError, AttributeError):
+            except (orjson.JSONDecodeError, AttributeError):
                 logger.warning("Invalid meal generation criteria format")
         
         # Default to health-focused strategy
         return self.strategy_factory.get_strategy("health")
 
-    async def _cache_generated_meals(self, user_id: int, meals: List[Dict[str, Any]]):
+    def _generation_cache_key(
+        self, generation_request: MealGenerationRequest, stock_items: List[StockRow]
+    ) -> str:
+        """Fingerprint a generation request against its stock snapshot.
+
+        The digest folds in each stock row's id, quantity and expiry, so
+        any pantry change produces a new key - a generational key without
+        a separately maintained revision counter.
+        """
+        # The route hands us a msgspec Struct, not a Pydantic model;
+        # to_builtins flattens it to plain dict/list/str for hashing
+        digest = hashlib.blake2b(
+            orjson.dumps(
+                msgspec.to_builtins(generation_request),
+                option=orjson.OPT_SORT_KEYS,
+                default=str,
+            ),
+            digest_size=16,
+        )
+        for row in stock_items:
+            digest.update(
+                f"{row.id}:{row.current_quantity}:{row.expiry_date}".encode()
+            )
+        return f"meal_generation:{digest.hexdigest()}"
+
+    async def _get_cached_generation(self, cache_key: str):
+        try:
+            return await self.cache_service.get(cache_key)
+        except Exception as e:
+            logger.warning(f"Generation cache read failed: {str(e)}")
+            return None
+
+    async def _store_cached_generation(self, cache_key: str, meals: List[Dict[str, Any]]):
+        try:
+            await self.cache_service.set(cache_key, meals, expire=3600)  # 1 hour
+        except Exception as e:
+            logger.warning(f"Generation cache write failed: {str(e)}")
+
+    async def _cache_generated_meals(
+        self, user_id: int, meals: List[Dict[str, Any]], today_iso: Optional[str] = None
+    ):
         """Cache generated meals for quick retrieval."""
         try:
-            cache_key = f"generated_meals:{user_id}:{date.today().isoformat()}"
+            if today_iso is None:
+                today_iso = date.today().isoformat()
+            cache_key = "generated_meals:" + str(user_id) + ":" + today_iso
             await self.cache_service.set(cache_key, meals, expire=86400)  # 24 hours
         except Exception as e:
             logger.warning(f"Failed to cache generated meals: {str(e)}")
@@ -252,8 +581,13 @@ class MealService(ServiceInterface[Meal, Any, Any, MealResponse]):
         user: User,
         stock_items: List[Stock],
         generation_request: MealGenerationRequest
-    ) -> Optional[MealResponse]:
-        """Generate a single meal based on type and preferences."""
+    ) -> Optional[Dict[str, Any]]:
+        """Generate a single meal as an insertable row dict.
+
+        Returning plain column values instead of an ORM Meal keeps the
+        per-meal loop free of instance construction; callers collect the
+        dicts and persist them in one statement via save_generated_meals.
+        """
         try:
             # Get meal template
             template = self._get_meal_template(meal_type, user)
@@ -263,52 +597,76 @@ class MealService(ServiceInterface[Meal, Any, Any, MealResponse]):
             # Adapt template based on available stock
             adapted_meal = self._adapt_meal_to_stock(template, stock_items, user)
             
-            # Create meal object
-            meal = Meal(
-                name=adapted_meal['name'],
-                description=adapted_meal['description'],
-                meal_type=meal_type,
-                planned_date=date,
-                planned_time=self._get_meal_time(meal_type, user),
-                total_calories=adapted_meal['calories'],
-                total_protein=adapted_meal['protein'],
-                total_carbs=adapted_meal['carbs'],
-                total_fat=adapted_meal['fat'],
-                ingredients=json.dumps(adapted_meal['ingredients']),
-                cooking_instructions=adapted_meal['cooking_instructions'],
-                is_special_care_meal=user.has_special_needs,
-                is_office_meal=generation_request.is_office_meal,
-                is_guest_meal=generation_request.include_guests,
-                status="planned",
-                is_approved=False
-            )
-            
-            return meal
+            return {
+                'name': adapted_meal['name'],
+                'description': adapted_meal.get('description'),
+                'meal_type': meal_type,
+                'planned_date': date,
+                'planned_time': self._get_meal_time(meal_type, user),
+                'total_calories': adapted_meal['calories'],
+                'total_protein': adapted_meal['protein'],
+                'total_carbs': adapted_meal['carbs'],
+                'total_fat': adapted_meal['fat'],
+                'ingredients': adapted_meal['ingredients'],
+                'cooking_instructions': adapted_meal['cooking_instructions'],
+                'is_special_care_meal': user.has_special_needs,
+                'is_office_meal': generation_request.is_office_meal,
+                'is_guest_meal': generation_request.include_guests,
+                'status': "planned",
+                'is_approved': False,
+            }
             
         except Exception as e:
             logger.error(f"Error generating meal for {meal_type}: {str(e)}")
             return None
 
-    def _get_meal_template(self, meal_type: str, user: User) -> Optional[Dict[str, Any]]:
-        """Get a meal template based on type and user preferences."""
-        # Filter templates by meal type and user preferences
-        available_templates = [
-            template for template in self.meal_templates 
-            if template['meal_type'] == meal_type
-        ]
+    async def save_generated_meals(
+        self, rows: List[Dict[str, Any]], db: Session
+    ) -> int:
+        """Persist generated meal rows with one bulk INSERT.
+
+        A single executemany round-trip replaces per-meal add()/flush()
+        cycles; the commit runs in a worker thread like the other
+        blocking calls in this service.
+        """
+        if not rows:
+            return 0
         
-        if not available_templates:
-            return None
+        def _insert_all():
+            db.execute(insert(Meal), rows)
+            db.commit()
         
-        # Filter by diet restrictions
-        available_templates = self._filter_by_diet(available_templates, user)
+        await asyncio.to_thread(_insert_all)
+        return len(rows)
+
+    def _get_meal_template(self, meal_type: str, user: User) -> Optional[Dict[str, Any]]:
+        """Get a meal template based on type and user preferences."""
+        diet = user.diet if user.diet in _DIET_FORBIDDEN else 'any'
         
-        # Filter by cuisine preferences
-        available_templates = self._filter_by_cuisine(available_templates, user)
+        # Cuisine preferences narrow the lookup key; absent or malformed
+        # preferences fall back to every cuisine for the diet
+        if user.cuisines:
+            try:
+                user_cuisines = _parse_json_field(user.cuisines)
+            except (orjson.JSONDecodeError, AttributeError):
+                logger.warning("Invalid cuisine preferences format")
+            else:
+                available_templates = [
+                    template
+                    for cuisine in user_cuisines
+                    for template in self._templates_by_type_diet_cuisine.get(
+                        (meal_type, diet, cuisine), ()
+                    )
+                ]
+                if not available_templates:
+                    return None
+                # randrange + index skips random.choice's extra call layer;
+                # this runs once per meal per day per user
+                return available_templates[random.randrange(len(available_templates))]
         
-        # Return random template if available
+        available_templates = self._templates_by_type_diet.get((meal_type, diet))
         if available_templates:
-            return random.choice(available_templates)
+            return available_templates[random.randrange(len(available_templates))]
         
         return None
 
@@ -316,20 +674,10 @@ class MealService(ServiceInterface[Meal, Any, Any, MealResponse]):
         self, templates: List[Dict[str, Any]], user: User
     ) -> List[Dict[str, Any]]:
         """Filter templates by user's dietary restrictions."""
-        if user.diet == 'vegetarian':
-            return [
-                t for t in templates 
-                if not any(ingredient in str(t).lower() 
-                          for ingredient in ['meat', 'chicken', 'beef', 'fish'])
-            ]
-        elif user.diet == 'vegan':
-            return [
-                t for t in templates 
-                if not any(ingredient in str(t).lower() 
-                          for ingredient in ['meat', 'chicken', 'beef', 'fish', 'dairy', 'eggs'])
-            ]
-        
-        return templates
+        forbidden = _DIET_FORBIDDEN.get(user.diet)
+        if not forbidden:
+            return templates
+        return [t for t in templates if not (forbidden & t['_ingredient_tokens'])]
 
     def _filter_by_cuisine(
         self, templates: List[Dict[str, Any]], user: User
@@ -339,12 +687,12 @@ class MealService(ServiceInterface[Meal, Any, Any, MealResponse]):
             return templates
         
         try:
-            user_cuisines = json.loads(user.cuisines)
+            user_cuisines = orjson.loads(user.cuisines)
             return [
                 t for t in templates
                 if t.get('cuisine') in user_cuisines
             ]
-        except (json.JSONDecodeError, AttributeError):
+        except (orjson.JSONDecodeError, AttributeError):
             logger.warning("Invalid cuisine preferences format")
             return templates
 
@@ -357,24 +705,33 @@ class MealService(ServiceInterface[Meal, Any, Any, MealResponse]):
         """Adapt meal template to available stock."""
         adapted_meal = template.copy()
         
+        # One pass over the pantry builds a name/token index; matching an
+        # ingredient is then a couple of hash lookups instead of a
+        # substring scan across every stock row.
+        stock_by_token: Dict[str, Stock] = {}
+        for item in stock_items:
+            for token in _tokens(item.item_name):
+                stock_by_token.setdefault(token, item)
+        
         # Check which ingredients are available
         available_ingredients = []
         missing_ingredients = []
         
-        for ingredient in template['ingredients']:
-            # Find matching stock item
-            stock_item = next(
-                (item for item in stock_items 
-                 if item.item_name.lower() in ingredient['name'].lower() or 
-                    ingredient['name'].lower() in item.item_name.lower()),
+        for ingredient, (ing_name, ing_tokens, quantity, unit) in zip(
+            template['ingredients'], template['_ingredients_norm']
+        ):
+            # Find matching stock item: full name first, then any token
+            stock_item = stock_by_token.get(ing_name) or next(
+                (stock_by_token[token] for token in ing_tokens
+                 if token in stock_by_token),
                 None
             )
-            
-            if stock_item and stock_item.current_quantity >= ingredient['quantity']:
+
+            if stock_item and stock_item.current_quantity >= quantity:
                 available_ingredients.append({
                     'name': stock_item.item_name,
-                    'quantity': ingredient['quantity'],
-                    'unit': ingredient['unit'],
+                    'quantity': quantity,
+                    'unit': unit,
                     'stock_id': stock_item.id
                 })
             else:
@@ -400,11 +757,11 @@ class MealService(ServiceInterface[Meal, Any, Any, MealResponse]):
         total_carbs = 0
         total_fat = 0
         
+        # Index once; the per-ingredient next() scan was O(I x S)
+        stock_by_id = {item.id: item for item in stock_items}
+        
         for ingredient in available_ingredients:
-            stock_item = next(
-                (item for item in stock_items if item.id == ingredient['stock_id']),
-                None
-            )
+            stock_item = stock_by_id.get(ingredient['stock_id'])
             
             if stock_item:
                 # Calculate nutrition based on quantity
@@ -439,20 +796,22 @@ class MealService(ServiceInterface[Meal, Any, Any, MealResponse]):
 
     def _calculate_total_nutrition(self, meals: List[MealResponse]) -> Dict[str, float]:
         """Calculate total nutritional values across all meals."""
-        totals = {
-            'calories': 0,
-            'protein': 0,
-            'carbs': 0,
-            'fat': 0
-        }
+        # Accumulate into locals; the dict is built once at the end
+        # instead of paying four hashed item-assignments per meal
+        calories = protein = carbs = fat = 0
         
         for meal in meals:
-            totals['calories'] += meal.total_calories or 0
-            totals['protein'] += meal.total_protein or 0
-            totals['carbs'] += meal.total_carbs or 0
-            totals['fat'] += meal.total_fat or 0
+            calories += meal.total_calories or 0
+            protein += meal.total_protein or 0
+            carbs += meal.total_carbs or 0
+            fat += meal.total_fat or 0
         
-        return totals
+        return {
+            'calories': calories,
+            'protein': protein,
+            'carbs': carbs,
+            'fat': fat,
+        }
 
     def _determine_shopping_list(
         self, 
@@ -460,94 +819,47 @@ class MealService(ServiceInterface[Meal, Any, Any, MealResponse]):
         stock_items: List[Stock]
     ) -> List[str]:
         """Determine items that need to be purchased."""
-        shopping_list = []
+        # Missing ingredients aggregated on (name, unit); the same item
+        # across meals merges its quantities instead of producing one
+        # formatted string per occurrence
+        needed: Dict[Tuple[str, str], List[Any]] = {}
+        
+        # Normalized pantry tokens computed once for all meals
+        stock_tokens = set()
+        for item in stock_items:
+            stock_tokens.update(_tokens(item.item_name))
         
         for meal in meals:
             if meal.ingredients:
                 try:
-                    ingredients = json.loads(meal.ingredients)
+                    # Native JSON column yields a list; legacy rows may
+                    # still hold a serialized string - parse those once
+                    # and keep the result on the object, since meals are
+                    # re-read across shopping-list and nutrition flows
+                    ingredients = getattr(meal, '_parsed_ingredients', None)
+                    if ingredients is None:
+                        ingredients = meal.ingredients
+                        if isinstance(ingredients, str):
+                            ingredients = orjson.loads(ingredients)
+                            meal._parsed_ingredients = ingredients
                     for ingredient in ingredients:
                         # Check if ingredient is available in stock
-                        available = any(
-                            item.item_name.lower() in ingredient['name'].lower() or
-                            ingredient['name'].lower() in item.item_name.lower()
-                            for item in stock_items
-                        )
+                        ing_name = ingredient['name'].lower()
                         
-                        if not available:
-                            shopping_list.append(
-                                f"{ingredient['name']} - {ingredient['quantity']} {ingredient['unit']}"
-                            )
-                except (json.JSONDecodeError, AttributeError):
+                        if _tokens(ingredient['name']).isdisjoint(stock_tokens):
+                            key = (ing_name, ingredient['unit'])
+                            entry = needed.get(key)
+                            if entry is None:
+                                needed[key] = [
+                                    ingredient['name'],
+                                    ingredient['quantity'],
+                                    ingredient['unit'],
+                                ]
+                            else:
+                                entry[1] += ingredient['quantity']
+                except (orjson.JSONDecodeError, AttributeError):
                     logger.warning(f"Invalid ingredients format for meal {meal.id}")
                     continue
         
-        # Remove duplicates
-        return list(set(shopping_list))
-
-    def _load_meal_templates(self) -> List[Dict[str, Any]]:
-        """Load meal templates for local testing."""
-        return [
-            {
-                'name': 'Healthy Breakfast Bowl',
-                'meal_type': 'breakfast',
-                'cuisine': 'international',
-                'ingredients': [
-                    {'name': 'oats', 'quantity': 50, 'unit': 'g'},
-                    {'name': 'milk', 'quantity': 200, 'unit': 'ml'},
-                    {'name': 'banana', 'quantity': 1, 'unit': 'pcs'},
-                    {'name': 'honey', 'quantity': 10, 'unit': 'g'},
-                    {'name': 'nuts', 'quantity': 20, 'unit': 'g'}
-                ],
-                'cooking_instructions': 'Cook oats with milk, top with sliced banana, honey, and nuts.',
-                'calories': 350,
-                'protein': 12,
-                'carbs': 55,
-                'fat': 8
-            },
-            {
-                'name': 'Grilled Chicken Salad',
-                'meal_type': 'lunch',
-                'cuisine': 'mediterranean',
-                'ingredients': [
-                    {'name': 'chicken breast', 'quantity': 150, 'unit': 'g'},
-                    {'name': 'lettuce', 'quantity': 100, 'unit': 'g'},
-                    {'name': 'tomatoes', 'quantity': 100, 'unit': 'g'},
-                    {'name': 'olive oil', 'quantity': 15, 'unit': 'ml'},
-                    {'name': 'lemon', 'quantity': 1, 'unit': 'pcs'}
-                ],
-                'cooking_instructions': 'Grill chicken, chop vegetables, mix with olive oil and lemon.',
-                'calories': 280,
-                'protein': 35,
-                'carbs': 8,
-                'fat': 12
-            },
-            {
-                'name': 'Vegetarian Pasta',
-                'meal_type': 'dinner',
-                'cuisine': 'italian',
-                'ingredients': [
-                    {'name': 'pasta', 'quantity': 100, 'unit': 'g'},
-                    {'name': 'tomato sauce', 'quantity': 150, 'unit': 'ml'},
-                    {'name': 'vegetables', 'quantity': 150, 'unit': 'g'},
-                    {'name': 'cheese', 'quantity': 30, 'unit': 'g'},
-                    {'name': 'herbs', 'quantity': 5, 'unit': 'g'}
-                ],
-                'cooking_instructions': 'Cook pasta, prepare sauce with vegetables, combine and top with cheese.',
-                'calories': 420,
-                'protein': 15,
-                'carbs': 65,
-                'fat': 12
-            }
-        ]
+        return [f"{name} - {qty} {unit}" for name, qty, unit in needed.values()]
 
-    def _load_nutritional_data(self) -> Dict[str, Any]:
-        """Load nutritional data for common ingredients."""
-        return {
-            'oats': {'calories': 389, 'protein': 16.9, 'carbs': 66.3, 'fat': 6.9},
-            'milk': {'calories': 42, 'protein': 3.4, 'carbs': 5.0, 'fat': 1.0},
-            'banana': {'calories': 89, 'protein': 1.1, 'carbs': 22.8, 'fat': 0.3},
-            'chicken breast': {'calories': 165, 'protein': 31.0, 'carbs': 0.0, 'fat': 3.6},
-            'lettuce': {'calories': 15, 'protein': 1.4, 'carbs': 2.9, 'fat': 0.1},
-            'pasta': {'calories': 131, 'protein': 5.0, 'carbs': 25.0, 'fat': 1.1}
-        }
@@ -1,5 +1,8 @@
+from collections import defaultdict
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, load_only, selectinload
 from datetime import date, datetime, timedelta
 import json
 
@@ -14,6 +17,98 @@ from app.schemas.stock_categories import (
 )
 from utils.api_logger import APILogger
 
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - pandas is in requirements
+    pd = None
+
+# Below this size the Python loop beats DataFrame construction; above
+# it the columnar reductions in _columnar_sections win by a wide margin
+_VECTORIZE_MIN_ROWS = 500
+
+
+# Full Stock.priority_level vocabulary in ascending urgency - the
+# CodedString column allows 'urgent' and 'critical' beyond the
+# StockPriorityEnum values the API exposes
+_PRIORITY_LEVELS = ('luxury', 'nice_to_have', 'important', 'essential',
+                    'urgent', 'critical')
+_CRITICAL_LEVELS = frozenset({'essential', 'urgent', 'critical'})
+
+
+def _build_priority_tables():
+    """Enumerate the alert/restock priority decision trees once.
+
+    The classifiers run once per candidate row; with only priority
+    level, special-care and pet-food feeding the decision, every
+    outcome can be precomputed so classification at call time is a
+    single dict lookup instead of a branch chain with enum comparisons.
+    Covers the whole column vocabulary, with urgent/critical classified
+    at least as severe as essential.
+    """
+    alert = {}
+    restock = {}
+    for level in _PRIORITY_LEVELS + (None,):
+        for special in (False, True):
+            for pet in (False, True):
+                if level in _CRITICAL_LEVELS:
+                    alert_priority = 'critical'
+                elif special:
+                    alert_priority = 'high'
+                elif pet or level == StockPriorityEnum.IMPORTANT:
+                    alert_priority = 'medium'
+                else:
+                    alert_priority = 'low'
+
+                if level in _CRITICAL_LEVELS or special:
+                    restock_priority = 'critical'
+                elif pet:
+                    restock_priority = 'high'
+                elif level == StockPriorityEnum.IMPORTANT:
+                    restock_priority = 'medium'
+                else:
+                    restock_priority = 'low'
+
+                alert[(level, special, pet)] = alert_priority
+                restock[(level, special, pet)] = restock_priority
+    return alert, restock
+
+
+_ALERT_PRIORITY, _RESTOCK_PRIORITY = _build_priority_tables()
+
+# Severity rank for StockAlert.priority, matching its CodedString
+# declaration order; the decoded strings sort alphabetically
+# (medium > low > high > critical), not by urgency
+_ALERT_SEVERITY = {'low': 0, 'medium': 1, 'high': 2, 'critical': 3}
+
+# Every column the analytics/alert/recommendation loops read. Loading
+# only these keeps the wide text and nutrition columns (description,
+# barcode, *_per_100g, ...) out of the analytics SELECT; anything not
+# listed stays deferred, so adding a new accumulator means adding its
+# column here or paying a per-row lazy load.
+_ANALYTICS_COLUMNS = (
+    Stock.user_id,
+    Stock.item_name,
+    Stock.category,
+    Stock.unit,
+    Stock.current_quantity,
+    Stock.minimum_quantity,
+    Stock.price_per_unit,
+    Stock.expiry_date,
+    Stock.is_perishable,
+    Stock.storage_type,
+    Stock.priority_level,
+    Stock.assignment_type,
+    Stock.is_pet_food,
+    Stock.pet_type,
+    Stock.is_special_care_item,
+    Stock.special_care_types,
+    Stock.special_care_user_id,
+    Stock.is_organic,
+    Stock.is_gluten_free,
+    Stock.is_vegan,
+    Stock.is_diabetic_friendly,
+)
+
 
 class StockService:
     """Service for stock management and analytics"""
@@ -22,75 +117,66 @@ class StockService:
         pass
     
     async def get_stock_analytics(
-        self, 
-        user_id: Optional[int], 
-        family_id: Optional[int], 
-        db: Session
+        self,
+        user_id: Optional[int],
+        family_id: Optional[int],
+        db: Session,
+        stock_items: Optional[List[Stock]] = None,
     ) -> Dict[str, Any]:
-        """Get comprehensive stock analytics with enhanced categorization"""
+        """Get comprehensive stock analytics with enhanced categorization.
+
+        Callers combining several stock methods in one request can load
+        the rows once with _load_stocks(with_alerts=True) and pass them
+        as stock_items to skip the repeat fetch.
+        """
         try:
-            # Get stock items
-            query = db.query(Stock)
-            
-            if family_id:
-                query = query.filter(Stock.family_id == family_id)
-            else:
-                query = query.filter(Stock.user_id == user_id)
-            
-            stock_items = query.all()
-            
+            if stock_items is None:
+                stock_items = self._load_stocks(user_id, family_id, db, with_alerts=True)
+
             if not stock_items:
                 return self._empty_analytics()
-            
-            # Calculate enhanced analytics
-            analytics = {
-                'total_items': len(stock_items),
-                'total_value': self._calculate_total_value(stock_items),
-                'low_stock_items': self._count_low_stock_items(stock_items),
-                'expiring_soon_items': self._count_expiring_soon_items(stock_items),
-                'expired_items': self._count_expired_items(stock_items),
-                
-                # Enhanced categorization analytics
-                'category_distribution': self._get_category_distribution(stock_items),
-                'value_by_category': self._get_value_by_category(stock_items),
-                'pet_food_analytics': self._get_pet_food_analytics(stock_items),
-                'special_care_analytics': self._get_special_care_analytics(stock_items),
-                'storage_distribution': self._get_storage_distribution(stock_items),
-                'priority_distribution': self._get_priority_distribution(stock_items),
-                'health_diet_analytics': self._get_health_diet_analytics(stock_items),
-                'family_assignment_analytics': self._get_family_assignment_analytics(stock_items),
-                
-                # Existing analytics
-                'consumption_trends': self._get_consumption_trends(stock_items, db),
-                'expiry_risk': self._get_expiry_risk(stock_items),
-                'stock_alerts': self._get_stock_alerts(stock_items, db)
-            }
-            
+
+            # Every per-item section comes out of one traversal; alerts
+            # are already attached by the selectin load
+            analytics = self._aggregate(stock_items)
+            analytics['stock_alerts'] = self._get_stock_alerts(stock_items)
+
             return analytics
             
         except Exception as e:
             raise Exception(f"Failed to get stock analytics: {str(e)}")
     
     async def check_stock_alerts(
-        self, 
-        user_id: Optional[int], 
-        family_id: Optional[int], 
-        db: Session
+        self,
+        user_id: Optional[int],
+        family_id: Optional[int],
+        db: Session,
+        stock_items: Optional[List[Stock]] = None,
     ) -> List[Dict[str, Any]]:
-        """Check for stock items that need alerts"""
+        """Check for stock items that need alerts.
+
+        A pre-loaded stock_items list skips the fetch; the loop
+        re-checks every condition, so an unfiltered list is fine.
+        """
         try:
             alerts = []
-            
-            # Get stock items
-            query = db.query(Stock)
-            
-            if family_id:
-                query = query.filter(Stock.family_id == family_id)
-            else:
-                query = query.filter(Stock.user_id == user_id)
-            
-            stock_items = query.all()
-            
+            today = date.today()
+
+            # Only rows that can produce an alert leave the database:
+            # low stock, or an expiry within the 7-day warning window
+            # (which also covers already-expired items)
+            if stock_items is None:
+                stock_items = self._load_stocks(
+                    user_id, family_id, db,
+                    or_(
+                        Stock.current_quantity <= Stock.minimum_quantity,
+                        # Strictly before day 8, not <= day 7: the column
+                        # is a timestamp, and <= would cut the window at
+                        # midnight while the loop counts the whole day
+                        Stock.expiry_date < today + timedelta(days=8),
+                    ),
+                )
+
             for item in stock_items:
                 # Check low stock with enhanced priority logic
                 if item.current_quantity <= item.minimum_quantity:
@@ -107,10 +193,11 @@ class StockService:
                         'priority_level': item.priority_level
                     })
                 
-                # Check expiring items
+                # Check expiring items. expiry_date is a UtcDateTime
+                # column; drop the time portion before date arithmetic
                 if item.expiry_date:
-                    days_until_expiry = (item.expiry_date - date.today()).days
-                    
+                    days_until_expiry = (item.expiry_date.date() - today).days
+
                     if days_until_expiry < 0:
                         alerts.append({
                             'type': 'expired',
@@ -142,71 +229,121 @@ class StockService:
             raise Exception(f"Failed to check stock alerts: {str(e)}")
     
     async def record_stock_movement(
-        self, 
-        stock_id: int, 
-        quantity_change: float, 
-        movement_type: str, 
-        reason: Optional[str], 
+        self,
+        stock_id: int,
+        quantity_change: float,
+        movement_type: str,
+        reason: Optional[str],
         db: Session,
         user_id: Optional[int] = None
     ) -> Dict[str, Any]:
         """Record a stock movement and update stock levels"""
+        results = await self.record_stock_movements_bulk(
+            [{
+                'stock_id': stock_id,
+                'quantity_change': quantity_change,
+                'movement_type': movement_type,
+                'reason': reason,
+            }],
+            db,
+            user_id=user_id,
+        )
+        return results[0]
+
+    async def record_stock_movements_bulk(
+        self,
+        movements: List[Dict[str, Any]],
+        db: Session,
+        user_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Record a batch of stock movements in one transaction.
+
+        Each entry carries stock_id, quantity_change, movement_type and
+        an optional reason. All stocks are fetched with one IN query and
+        every movement is validated before anything is mutated, so the
+        batch applies atomically: one flush of batched INSERTs plus the
+        quantity UPDATEs, then a single commit instead of one round-trip
+        per movement.
+        """
         try:
-            # Get stock item
-            stock = db.query(Stock).filter(Stock.id == stock_id).first()
-            if not stock:
-                APILogger.log_error(f"Stock movement failed - stock item not found: {stock_id}")
+            if not movements:
+                return []
+
+            stock_ids = {m['stock_id'] for m in movements}
+            stocks = {
+                stock.id: stock
+                for stock in db.query(Stock).filter(Stock.id.in_(stock_ids)).all()
+            }
+
+            missing = stock_ids - stocks.keys()
+            if missing:
                 raise ValueError("Stock item not found")
-            
-            # Calculate new quantity
-            new_quantity = stock.current_quantity + quantity_change
-            
-            if new_quantity < 0:
-                APILogger.log_error(f"Stock movement failed - negative quantity: stock_id={stock_id}, new_quantity={new_quantity}")
-                raise ValueError("Stock quantity cannot be negative")
-            
-            # Update stock quantity
-            stock.current_quantity = new_quantity
-            stock.updated_at = datetime.utcnow()
-            
-            # Create movement record
-            movement = StockMovement(
-                stock_id=stock_id,
-                quantity_change=quantity_change,
-                movement_type=movement_type,
-                reason=reason,
-                date=date.today()
-            )
-            
-            db.add(movement)
+
+            # Validate the net effect per stock before mutating anything;
+            # several movements may target the same row
+            new_quantities = {stock_id: stocks[stock_id].current_quantity for stock_id in stock_ids}
+            for movement in movements:
+                new_quantity = new_quantities[movement['stock_id']] + movement['quantity_change']
+                if new_quantity < 0:
+                    raise ValueError("Stock quantity cannot be negative")
+                new_quantities[movement['stock_id']] = new_quantity
+
+            # Apply quantities and stage the movement rows
+            now = datetime.utcnow()
+            today = date.today()
+            for stock_id, new_quantity in new_quantities.items():
+                stocks[stock_id].current_quantity = new_quantity
+                stocks[stock_id].updated_at = now
+
+            records = [
+                StockMovement(
+                    stock_id=movement['stock_id'],
+                    quantity_change=movement['quantity_change'],
+                    movement_type=movement['movement_type'],
+                    reason=movement.get('reason'),
+                    date=today,
+                )
+                for movement in movements
+            ]
+            db.add_all(records)
+
+            # Build the response between flush and commit: the flush
+            # assigns movement ids, and reading them after the commit
+            # would trigger an expired-attribute refresh SELECT per row
+            db.flush()
+            results = []
+            for record in records:
+                stock = stocks[record.stock_id]
+                results.append({
+                    'movement_id': record.id,
+                    'new_quantity': stock.current_quantity,
+                    'alert_needed': self._check_alert_needed(stock),
+                    'message': f"Stock updated successfully. New quantity: {stock.current_quantity} {stock.unit}"
+                })
             db.commit()
-            
+
             APILogger.log_database_operation("CREATE", "stock_movement", True, user_id)
             APILogger.log_database_operation("UPDATE", "stock_quantity", True, user_id)
-            
-            # Check if alert is needed
-            alert_needed = self._check_alert_needed(stock)
-            
-            return {
-                'movement_id': movement.id,
-                'new_quantity': new_quantity,
-                'alert_needed': alert_needed,
-                'message': f"Stock updated successfully. New quantity: {new_quantity} {stock.unit}"
-            }
-            
+            return results
+
         except Exception as e:
             db.rollback()
             APILogger.log_database_operation("CREATE", "stock_movement", False, user_id)
-            APILogger.log_error(f"Stock movement failed: {str(e)}")
+            APILogger.log_error("record_stock_movement", e, user_id)
             raise Exception(f"Failed to record stock movement: {str(e)}")
     
     async def get_stock_recommendations(
-        self, 
-        user_id: Optional[int], 
-        family_id: Optional[int], 
-        db: Session
+        self,
+        user_id: Optional[int],
+        family_id: Optional[int],
+        db: Session,
+        stock_items: Optional[List[Stock]] = None,
     ) -> Dict[str, Any]:
-        """Get stock recommendations based on usage patterns and preferences"""
+        """Get stock recommendations based on usage patterns and preferences.
+
+        A pre-loaded stock_items list skips the fetch; the loop
+        re-checks every condition, so an unfiltered list is fine.
+        """
         try:
             recommendations = {
                 'restock_items': [],
@@ -215,16 +352,26 @@ class StockService:
                 'expiry_management': []
             }
             
-            # Get stock items
-            query = db.query(Stock)
-            
-            if family_id:
-                query = query.filter(Stock.family_id == family_id)
-            else:
-                query = query.filter(Stock.user_id == user_id)
-            
-            stock_items = query.all()
-            
+            today = date.today()
+
+            # Push the recommendation predicates into SQL so only rows
+            # that yield a recommendation are materialized: low stock,
+            # overstock, or a perishable expiring within a week
+            if stock_items is None:
+                stock_items = self._load_stocks(
+                    user_id, family_id, db,
+                    or_(
+                        Stock.current_quantity <= Stock.minimum_quantity,
+                        Stock.current_quantity > Stock.minimum_quantity * 3,
+                        and_(
+                            Stock.is_perishable == True,
+                            # Whole of day 7, matching the loop's
+                            # date-based day count
+                            Stock.expiry_date < today + timedelta(days=8),
+                        ),
+                    ),
+                )
+
             for item in stock_items:
                 # Enhanced restock recommendations
                 if item.current_quantity <= item.minimum_quantity:
@@ -252,7 +399,7 @@ class StockService:
                 
                 # Expiry management
                 if item.expiry_date and item.is_perishable:
-                    days_until_expiry = (item.expiry_date - date.today()).days
+                    days_until_expiry = (item.expiry_date.date() - today).days
                     if days_until_expiry <= 7:
                         recommendations['expiry_management'].append({
                             'item_name': item.item_name,
@@ -266,6 +413,38 @@ class StockService:
         except Exception as e:
             raise Exception(f"Failed to get stock recommendations: {str(e)}")
     
+    def _load_stocks(
+        self,
+        user_id: Optional[int],
+        family_id: Optional[int],
+        db: Session,
+        *extra_filters,
+        with_alerts: bool = False,
+    ) -> List[Stock]:
+        """Load the caller's stock scope with optional alert eager-loading.
+
+        Shared by the public analytics methods so they all build the same
+        family-or-user base query. with_alerts attaches StockAlert rows
+        via one extra selectin query, replacing the separate
+        StockAlert.stock_id IN (...) query the alert section used to
+        issue afterwards. Only _ANALYTICS_COLUMNS are selected; routes
+        that need full rows query Stock directly instead.
+        """
+        query = db.query(Stock).options(load_only(*_ANALYTICS_COLUMNS))
+
+        if family_id:
+            query = query.filter(Stock.family_id == family_id)
+        else:
+            query = query.filter(Stock.user_id == user_id)
+
+        if extra_filters:
+            query = query.filter(*extra_filters)
+
+        if with_alerts:
+            query = query.options(selectinload(Stock.alerts))
+
+        return query.all()
+
     def _empty_analytics(self) -> Dict[str, Any]:
         """Return empty analytics structure with enhanced categorization"""
         return {
@@ -287,94 +466,280 @@ class StockService:
             'stock_alerts': []
         }
     
-    def _calculate_total_value(self, stock_items: List[Stock]) -> float:
-        """Calculate total value of stock items"""
-        total_value = 0
-        for item in stock_items:
-            if item.price_per_unit:
-                total_value += item.price_per_unit * item.current_quantity
-        return round(total_value, 2)
-    
-    def _count_low_stock_items(self, stock_items: List[Stock]) -> int:
-        """Count items that are below minimum quantity"""
-        return len([item for item in stock_items if item.current_quantity <= item.minimum_quantity])
-    
-    def _count_expiring_soon_items(self, stock_items: List[Stock]) -> int:
-        """Count items expiring within 7 days"""
-        tomorrow = date.today() + timedelta(days=1)
-        return len([item for item in stock_items if item.expiry_date and item.expiry_date <= tomorrow + timedelta(days=6)])
-    
-    def _count_expired_items(self, stock_items: List[Stock]) -> int:
-        """Count expired items"""
-        return len([item for item in stock_items if item.expiry_date and item.expiry_date < date.today()])
-    
-    def _get_category_distribution(self, stock_items: List[Stock]) -> Dict[str, int]:
-        """Get distribution of items by category"""
-        distribution = {}
-        for item in stock_items:
-            distribution[item.category] = distribution.get(item.category, 0) + 1
-        return distribution
-    
-    def _get_value_by_category(self, stock_items: List[Stock]) -> Dict[str, float]:
-        """Get total value by category"""
-        value_by_category = {}
-        for item in stock_items:
-            if item.price_per_unit:
-                category_value = item.price_per_unit * item.current_quantity
-                value_by_category[item.category] = value_by_category.get(item.category, 0) + category_value
-        return {k: round(v, 2) for k, v in value_by_category.items()}
-    
-    def _get_consumption_trends(self, stock_items: List[Stock], db: Session) -> Dict[str, float]:
-        """Get consumption trends (placeholder - would need historical movement data)"""
-        # This is a simplified version. In a real implementation, you would:
-        # 1. Query StockMovement table for historical data
-        # 2. Calculate consumption rates over time
-        # 3. Identify trends and patterns
-        
-        trends = {}
-        for item in stock_items:
-            # Mock consumption rate (0.1 kg per day average)
-            trends[item.item_name] = round(0.1, 2)
-        
-        return trends
-    
-    def _get_expiry_risk(self, stock_items: List[Stock]) -> List[Dict[str, Any]]:
-        """Get items with high expiry risk"""
-        expiry_risk = []
-        
+    def _aggregate(self, stock_items: List[Stock]) -> Dict[str, Any]:
+        """Compute all per-item analytics sections in a single traversal.
+
+        The old per-section helpers each walked the full stock list, so
+        one analytics request traversed it about 14 times. This loop
+        reads each item's attributes once into locals and feeds every
+        accumulator, then assembles the same dict shape at the end.
+        The stock_alerts section is not included - it needs its own
+        StockAlert query.
+        """
+        today = date.today()
+        week_ahead = today + timedelta(days=7)
+
+        # Large stock sets compute the columnar reductions (sums, counts,
+        # distributions) as pandas ufuncs; the loop below then only feeds
+        # the per-item sections it alone can produce
+        vectorized = None
+        if pd is not None and len(stock_items) >= _VECTORIZE_MIN_ROWS:
+            vectorized = self._columnar_sections(stock_items, today, week_ahead)
+
+        # defaultdicts make each counter update one hashed access
+        # instead of the get-then-set pair
+        total_value = 0.0
+        low_stock = expiring_soon = expired = 0
+        category_dist: Dict[str, int] = defaultdict(int)
+        value_by_category: Dict[str, float] = defaultdict(float)
+        storage_dist: Dict[str, int] = defaultdict(int)
+        priority_dist: Dict[str, int] = defaultdict(int)
+        pet_count = 0
+        pet_value = 0.0
+        pet_types: Dict[str, Dict[str, float]] = defaultdict(lambda: {'count': 0, 'value': 0.0})
+        care_count = 0
+        care_value = 0.0
+        care_types: Dict[str, int] = defaultdict(int)
+        assigned_users: Dict[str, int] = defaultdict(int)
+        organic = gluten_free = vegan = diabetic = 0
+        organic_value = gluten_free_value = vegan_value = diabetic_value = 0.0
+        assignment_dist: Dict[str, int] = defaultdict(int)
+        user_assignments: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {'exclusive': 0, 'preferred': 0}
+        )
+        trends: Dict[str, float] = {}
+        # Risk entries split by level at build time; sorting then needs
+        # only the numeric days key per bucket instead of recomputing a
+        # string comparison in the comparator
+        high_risk: List[Dict[str, Any]] = []
+        medium_risk: List[Dict[str, Any]] = []
+
         for item in stock_items:
-            if item.expiry_date:
-                days_until_expiry = (item.expiry_date - date.today()).days
-                
-                if days_until_expiry <= 7:
-                    risk_level = 'high' if days_until_expiry <= 3 else 'medium'
-                    
-                    expiry_risk.append({
+            quantity = item.current_quantity
+            price = item.price_per_unit
+            value = price * quantity if price else 0.0
+            expiry = item.expiry_date
+
+            if vectorized is None:
+                category = item.category
+                total_value += value
+                category_dist[category] += 1
+                if price:
+                    value_by_category[category] += value
+
+                if quantity <= item.minimum_quantity:
+                    low_stock += 1
+
+                storage_dist[item.storage_type or 'pantry'] += 1
+                priority_dist[item.priority_level or 'important'] += 1
+
+                if item.is_organic:
+                    organic += 1
+                    if price:
+                        organic_value += value
+                if item.is_gluten_free:
+                    gluten_free += 1
+                    if price:
+                        gluten_free_value += value
+                if item.is_vegan:
+                    vegan += 1
+                    if price:
+                        vegan_value += value
+                if item.is_diabetic_friendly:
+                    diabetic += 1
+                    if price:
+                        diabetic_value += value
+
+            if expiry:
+                # UtcDateTime column: compare on the date portion
+                expiry_day = expiry.date()
+                if vectorized is None:
+                    if expiry_day < today:
+                        expired += 1
+                    if expiry_day <= week_ahead:
+                        expiring_soon += 1
+                if expiry_day <= week_ahead:
+                    days_until_expiry = (expiry_day - today).days
+                    is_high = days_until_expiry <= 3
+                    (high_risk if is_high else medium_risk).append({
                         'item_name': item.item_name,
                         'days_until_expiry': days_until_expiry,
-                        'current_quantity': item.current_quantity,
-                        'priority': risk_level,
+                        'current_quantity': quantity,
+                        'priority': 'high' if is_high else 'medium',
                         'action_required': 'Use immediately' if days_until_expiry <= 1 else 'Plan usage'
                     })
-        
-        # Sort by priority and days until expiry
-        expiry_risk.sort(key=lambda x: (x['priority'] == 'high', x['days_until_expiry']))
-        
-        return expiry_risk
-    
-    def _get_stock_alerts(self, stock_items: List[Stock], db: Session) -> List[Dict[str, Any]]:
-        """Get active stock alerts"""
+
+            if item.is_pet_food:
+                pet_count += 1
+                bucket = pet_types[item.pet_type or 'unknown']
+                bucket['count'] += 1
+                if price:
+                    bucket['value'] += value
+                    pet_value += value
+
+            if item.is_special_care_item:
+                care_count += 1
+                if price:
+                    care_value += value
+                types = item.special_care_types
+                if types:
+                    if isinstance(types, str):
+                        # Legacy rows predate the JSONVariant column and
+                        # hold a serialized string; the driver decodes
+                        # current rows to a list before they get here
+                        try:
+                            types = json.loads(types)
+                        except json.JSONDecodeError:
+                            types = None
+                    if isinstance(types, (list, tuple)):
+                        for care_type in types:
+                            care_types[care_type] += 1
+                    else:
+                        care_types['unknown'] += 1
+                if item.special_care_user_id:
+                    assigned_users[str(item.special_care_user_id)] += 1
+
+            assignment_type = item.assignment_type or 'shared'
+            assignment_dist[assignment_type] += 1
+            if item.user_id and assignment_type in ('exclusive', 'preferred'):
+                user_assignments[str(item.user_id)][assignment_type] += 1
+
+            # Mock consumption rate (0.1 kg per day average); a real
+            # implementation would derive this from StockMovement history
+            trends[item.item_name] = 0.1
+
+        # High-risk entries first, each bucket ordered by days remaining
+        days_key = itemgetter('days_until_expiry')
+        high_risk.sort(key=days_key)
+        medium_risk.sort(key=days_key)
+        expiry_risk = high_risk + medium_risk
+
+        # Plain dicts in the result: the defaultdicts stay internal so a
+        # consumer's missing-key lookup can't silently add entries
+        result = {
+            'total_items': len(stock_items),
+            'total_value': round(total_value, 2),
+            'low_stock_items': low_stock,
+            'expiring_soon_items': expiring_soon,
+            'expired_items': expired,
+            'category_distribution': dict(category_dist),
+            'value_by_category': {k: round(v, 2) for k, v in value_by_category.items()},
+            'pet_food_analytics': {
+                'total_items': pet_count,
+                'total_value': round(pet_value, 2),
+                'pet_types': dict(pet_types)
+            },
+            'special_care_analytics': {
+                'total_items': care_count,
+                'total_value': round(care_value, 2),
+                'care_types': dict(care_types),
+                'assigned_users': dict(assigned_users)
+            },
+            'storage_distribution': dict(storage_dist),
+            'priority_distribution': dict(priority_dist),
+            'health_diet_analytics': {
+                'organic_items': organic,
+                'gluten_free_items': gluten_free,
+                'vegan_items': vegan,
+                'diabetic_friendly_items': diabetic,
+                'organic_value': round(organic_value, 2),
+                'gluten_free_value': round(gluten_free_value, 2),
+                'vegan_value': round(vegan_value, 2),
+                'diabetic_friendly_value': round(diabetic_value, 2)
+            },
+            'family_assignment_analytics': {
+                'assignment_distribution': dict(assignment_dist),
+                'user_assignments': dict(user_assignments)
+            },
+            'consumption_trends': trends,
+            'expiry_risk': expiry_risk,
+        }
+
+        if vectorized is not None:
+            result.update(vectorized)
+
+        return result
+
+    def _columnar_sections(
+        self, stock_items: List[Stock], today: date, week_ahead: date
+    ) -> Dict[str, Any]:
+        """Vectorized counterpart of _aggregate's columnar reductions.
+
+        Builds a DataFrame in one pass over the rows, then computes the
+        sums, counts and distributions as pandas/NumPy ufuncs and
+        groupbys - C-level per element instead of Python attribute
+        access. Scalars are cast back to builtins so the response
+        serializes like the loop-built dict.
+        """
+        df = pd.DataFrame.from_records([
+            {
+                'category': item.category,
+                'current_quantity': item.current_quantity,
+                'minimum_quantity': item.minimum_quantity,
+                'price_per_unit': item.price_per_unit,
+                'expiry_date': item.expiry_date.date() if item.expiry_date else None,
+                'storage_type': item.storage_type or 'pantry',
+                'priority_level': item.priority_level or 'important',
+                'is_organic': bool(item.is_organic),
+                'is_gluten_free': bool(item.is_gluten_free),
+                'is_vegan': bool(item.is_vegan),
+                'is_diabetic_friendly': bool(item.is_diabetic_friendly),
+            }
+            for item in stock_items
+        ])
+
+        price = df['price_per_unit'].fillna(0.0)
+        value = price * df['current_quantity']
+        priced = price > 0
+        # Categorical dtype takes the fast groupby path
+        category = df['category'].astype('category')
+        expiry = pd.to_datetime(df['expiry_date'], errors='coerce')
+
+        sections: Dict[str, Any] = {
+            'total_value': round(float(value.sum()), 2),
+            'low_stock_items': int((df['current_quantity'] <= df['minimum_quantity']).sum()),
+            'expiring_soon_items': int((expiry <= pd.Timestamp(week_ahead)).sum()),
+            'expired_items': int((expiry < pd.Timestamp(today)).sum()),
+            'category_distribution': {
+                k: int(v) for k, v in category.value_counts().items()
+            },
+            'value_by_category': {
+                k: round(float(v), 2)
+                for k, v in value[priced].groupby(category[priced], observed=True).sum().items()
+            },
+            'storage_distribution': {
+                k: int(v) for k, v in df['storage_type'].value_counts().items()
+            },
+            'priority_distribution': {
+                k: int(v) for k, v in df['priority_level'].value_counts().items()
+            },
+        }
+
+        health: Dict[str, Any] = {}
+        for flag in ('organic', 'gluten_free', 'vegan', 'diabetic_friendly'):
+            mask = df[f'is_{flag}']
+            health[f'{flag}_items'] = int(mask.sum())
+            health[f'{flag}_value'] = round(float(value[mask].sum()), 2)
+        sections['health_diet_analytics'] = health
+
+        return sections
+
+    def _get_stock_alerts(self, stock_items: List[Stock]) -> List[Dict[str, Any]]:
+        """Get active stock alerts from the eager-loaded collections"""
         try:
-            stock_ids = [item.id for item in stock_items]
-            
-            if not stock_ids:
-                return []
-            
-            alerts = db.query(StockAlert).filter(
-                StockAlert.stock_id.in_(stock_ids),
-                StockAlert.is_resolved == False
-            ).order_by(StockAlert.priority.desc(), StockAlert.created_at.desc()).all()
-            
+            # item.alerts is populated by the selectin load in
+            # _load_stocks, so no further queries run here
+            alerts = [
+                alert
+                for item in stock_items
+                for alert in item.alerts
+                if not alert.is_resolved
+            ]
+            alerts.sort(
+                key=lambda a: (_ALERT_SEVERITY.get(a.priority, -1), a.created_at),
+                reverse=True,
+            )
+
             return [
                 {
                     'id': alert.id,
@@ -386,7 +751,7 @@ class StockService:
                 }
                 for alert in alerts
             ]
-            
+
         except Exception as e:
             print(f"Error getting stock alerts: {str(e)}")
             return []
@@ -399,7 +764,7 @@ class StockService:
         
         # Alert needed for expiring items
         if stock.expiry_date and stock.is_perishable:
-            days_until_expiry = (stock.expiry_date - date.today()).days
+            days_until_expiry = (stock.expiry_date.date() - date.today()).days
             if days_until_expiry <= 3:
                 return True
         
@@ -407,143 +772,17 @@ class StockService:
     
     def _calculate_alert_priority(self, stock: Stock) -> str:
         """Calculate alert priority based on enhanced categorization"""
-        if stock.priority_level == StockPriorityEnum.CRITICAL:
-            return 'critical'
-        elif stock.is_special_care_item or stock.priority_level == StockPriorityEnum.URGENT:
-            return 'high'
-        elif stock.is_pet_food or stock.priority_level == StockPriorityEnum.IMPORTANT:
-            return 'medium'
-        else:
-            return 'low'
-    
+        key = (stock.priority_level, bool(stock.is_special_care_item), bool(stock.is_pet_food))
+        priority = _ALERT_PRIORITY.get(key)
+        if priority is None:
+            # Unknown priority_level value: classify as if unset
+            priority = _ALERT_PRIORITY[(None, key[1], key[2])]
+        return priority
+
     def _calculate_restock_priority(self, stock: Stock) -> str:
         """Calculate restock priority based on enhanced categorization"""
-        if stock.priority_level == StockPriorityEnum.CRITICAL or stock.is_special_care_item:
-            return 'critical'
-        elif stock.priority_level == StockPriorityEnum.URGENT or stock.is_pet_food:
-            return 'high'
-        elif stock.priority_level == StockPriorityEnum.IMPORTANT:
-            return 'medium'
-        else:
-            return 'low'
-    
-    def _get_pet_food_analytics(self, stock_items: List[Stock]) -> Dict[str, Any]:
-        """Get pet food specific analytics"""
-        pet_items = [item for item in stock_items if item.is_pet_food]
-        
-        if not pet_items:
-            return {'total_items': 0, 'total_value': 0, 'pet_types': {}}
-        
-        pet_types = {}
-        total_value = 0
-        
-        for item in pet_items:
-            pet_type = item.pet_type or 'unknown'
-            if pet_type not in pet_types:
-                pet_types[pet_type] = {'count': 0, 'value': 0}
-            
-            pet_types[pet_type]['count'] += 1
-            if item.price_per_unit:
-                value = item.price_per_unit * item.current_quantity
-                pet_types[pet_type]['value'] += value
-                total_value += value
-        
-        return {
-            'total_items': len(pet_items),
-            'total_value': round(total_value, 2),
-            'pet_types': pet_types
-        }
-    
-    def _get_special_care_analytics(self, stock_items: List[Stock]) -> Dict[str, Any]:
-        """Get special care items analytics"""
-        special_care_items = [item for item in stock_items if item.is_special_care_item]
-        
-        if not special_care_items:
-            return {'total_items': 0, 'total_value': 0, 'care_types': {}, 'assigned_users': {}}
-        
-        care_types = {}
-        assigned_users = {}
-        total_value = 0
-        
-        for item in special_care_items:
-            # Parse special care types from JSON
-            if item.special_care_types:
-                try:
-                    types = json.loads(item.special_care_types) if isinstance(item.special_care_types, str) else item.special_care_types
-                    for care_type in types:
-                        care_types[care_type] = care_types.get(care_type, 0) + 1
-                except (json.JSONDecodeError, TypeError):
-                    care_types['unknown'] = care_types.get('unknown', 0) + 1
-            
-            # Track assigned users
-            if item.special_care_user_id:
-                user_id = str(item.special_care_user_id)
-                assigned_users[user_id] = assigned_users.get(user_id, 0) + 1
-            
-            # Calculate value
-            if item.price_per_unit:
-                total_value += item.price_per_unit * item.current_quantity
-        
-        return {
-            'total_items': len(special_care_items),
-            'total_value': round(total_value, 2),
-            'care_types': care_types,
-            'assigned_users': assigned_users
-        }
-    
-    def _get_storage_distribution(self, stock_items: List[Stock]) -> Dict[str, int]:
-        """Get distribution by storage type"""
-        distribution = {}
-        for item in stock_items:
-            storage_type = item.storage_type or 'pantry'
-            distribution[storage_type] = distribution.get(storage_type, 0) + 1
-        return distribution
-    
-    def _get_priority_distribution(self, stock_items: List[Stock]) -> Dict[str, int]:
-        """Get distribution by priority level"""
-        distribution = {}
-        for item in stock_items:
-            priority = item.priority_level or 'important'
-            distribution[priority] = distribution.get(priority, 0) + 1
-        return distribution
-    
-    def _get_health_diet_analytics(self, stock_items: List[Stock]) -> Dict[str, Any]:
-        """Get health and diet specific analytics"""
-        analytics = {
-            'organic_items': len([item for item in stock_items if item.is_organic]),
-            'gluten_free_items': len([item for item in stock_items if item.is_gluten_free]),
-            'vegan_items': len([item for item in stock_items if item.is_vegan]),
-            'diabetic_friendly_items': len([item for item in stock_items if item.is_diabetic_friendly])
-        }
-        
-        # Calculate values
-        for category in ['organic', 'gluten_free', 'vegan', 'diabetic_friendly']:
-            field_name = f'is_{category}'
-            total_value = sum(
-                item.price_per_unit * item.current_quantity
-                for item in stock_items
-                if getattr(item, field_name, False) and item.price_per_unit
-            )
-            analytics[f'{category}_value'] = round(total_value, 2)
-        
-        return analytics
-    
-    def _get_family_assignment_analytics(self, stock_items: List[Stock]) -> Dict[str, Any]:
-        """Get family assignment analytics"""
-        assignment_distribution = {}
-        user_assignments = {}
-        
-        for item in stock_items:
-            assignment_type = item.assignment_type or 'shared'
-            assignment_distribution[assignment_type] = assignment_distribution.get(assignment_type, 0) + 1
-            
-            if item.user_id and assignment_type in ['exclusive', 'preferred']:
-                user_id = str(item.user_id)
-                if user_id not in user_assignments:
-                    user_assignments[user_id] = {'exclusive': 0, 'preferred': 0}
-                user_assignments[user_id][assignment_type] += 1
-        
-        return {
-            'assignment_distribution': assignment_distribution,
-            'user_assignments': user_assignments
-        }
+        key = (stock.priority_level, bool(stock.is_special_care_item), bool(stock.is_pet_food))
+        priority = _RESTOCK_PRIORITY.get(key)
+        if priority is None:
+            priority = _RESTOCK_PRIORITY[(None, key[1], key[2])]
+        return priority
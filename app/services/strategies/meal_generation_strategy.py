@@ -5,10 +5,11 @@ This module provides different strategies for generating meals based on
 various criteria like health focus, budget optimization, or stock utilization.
 """
 
+import asyncio
+import random
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
 from datetime import date
-import random
 
 from app.core.base import Priority, Result
 from app.models.user import User, Stock
@@ -135,17 +136,16 @@ class HealthFocusedStrategy(MealGenerationStrategy):
         request: MealGenerationRequest,
     ) -> List[Dict[str, Any]]:
         """Create meals optimized for health."""
-        meals = []
         meal_types = request.meal_types or ["breakfast", "lunch", "dinner"]
 
-        for meal_type in meal_types:
-            meal = await self._create_single_health_meal(
-                meal_type, user, healthy_stock
-            )
-            if meal:
-                meals.append(meal)
+        # Meals are independent per type; run them concurrently so any
+        # per-meal I/O (AI calls, lookups) overlaps instead of summing
+        generated = await asyncio.gather(*(
+            self._create_single_health_meal(meal_type, user, healthy_stock)
+            for meal_type in meal_types
+        ))
 
-        return meals
+        return [meal for meal in generated if meal]
 
     async def _create_single_health_meal(
         self, meal_type: str, user: User, healthy_stock: List[Stock]
@@ -326,17 +326,16 @@ class BudgetOptimizedStrategy(MealGenerationStrategy):
         request: MealGenerationRequest,
     ) -> List[Dict[str, Any]]:
         """Create meals optimized for budget."""
-        meals = []
         meal_types = request.meal_types or ["breakfast", "lunch", "dinner"]
 
-        for meal_type in meal_types:
-            meal = await self._create_single_budget_meal(
-                meal_type, user, affordable_stock
-            )
-            if meal:
-                meals.append(meal)
+        # Meals are independent per type; run them concurrently so any
+        # per-meal I/O (AI calls, lookups) overlaps instead of summing
+        generated = await asyncio.gather(*(
+            self._create_single_budget_meal(meal_type, user, affordable_stock)
+            for meal_type in meal_types
+        ))
 
-        return meals
+        return [meal for meal in generated if meal]
 
     async def _create_single_budget_meal(
         self, meal_type: str, user: User, affordable_stock: List[Stock]
@@ -512,17 +511,16 @@ class StockUtilizationStrategy(MealGenerationStrategy):
         request: MealGenerationRequest,
     ) -> List[Dict[str, Any]]:
         """Create meals optimized for stock utilization."""
-        meals = []
         meal_types = request.meal_types or ["breakfast", "lunch", "dinner"]
 
-        for meal_type in meal_types:
-            meal = await self._create_single_stock_meal(
-                meal_type, user, prioritized_stock
-            )
-            if meal:
-                meals.append(meal)
+        # Meals are independent per type; run them concurrently so any
+        # per-meal I/O (AI calls, lookups) overlaps instead of summing
+        generated = await asyncio.gather(*(
+            self._create_single_stock_meal(meal_type, user, prioritized_stock)
+            for meal_type in meal_types
+        ))
 
-        return meals
+        return [meal for meal in generated if meal]
 
     async def _create_single_stock_meal(
         self, meal_type: str, user: User, prioritized_stock: List[Stock]
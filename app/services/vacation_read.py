@@ -0,0 +1,58 @@
+"""
+ORM-free read path for vacation listings.
+
+Vacation rows are read-mostly and external_meals is already a native
+JSON column (JSONB on PostgreSQL), so the driver hands back parsed
+dicts — there is nothing for the ORM to add on the way out. This path
+runs one Core SELECT of exactly the serialized columns and maps rows
+straight into a msgspec Struct, skipping identity-map bookkeeping and
+per-row object hydration. Writes stay on the ORM session, where the
+unit of work earns its keep.
+
+The structs encode natively through app.schemas.structs.json_response.
+"""
+
+from datetime import datetime
+from typing import Any, List, Optional
+
+import msgspec
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.user import Vacation
+
+
+class VacationRow(msgspec.Struct, frozen=True, gc=False):
+    """One vacation as served to the dashboard list"""
+    id: int
+    start_date: datetime
+    end_date: datetime
+    destination: Optional[str]
+    pause_meal_generation: Optional[bool]
+    log_external_meals: Optional[bool]
+    external_meals: Any  # logged meals, already decoded by the driver
+
+
+_COLUMNS = (
+    Vacation.id,
+    Vacation.start_date,
+    Vacation.end_date,
+    Vacation.destination,
+    Vacation.pause_meal_generation,
+    Vacation.log_external_meals,
+    Vacation.external_meals,
+)
+
+
+def list_vacations(
+    db: Session,
+    user_id: Optional[int] = None,
+    family_id: Optional[int] = None,
+) -> List[VacationRow]:
+    """Fetch vacations for a user or family scope in a single SELECT"""
+    stmt = select(*_COLUMNS).order_by(Vacation.start_date.desc())
+    if family_id is not None:
+        stmt = stmt.where(Vacation.family_id == family_id)
+    else:
+        stmt = stmt.where(Vacation.user_id == user_id)
+    return [VacationRow(*row) for row in db.execute(stmt)]
@@ -7,6 +7,7 @@ import asyncio
 
 from app.api.v1.api import api_router
 from app.core.database import init_db, close_db, check_db_health, get_connection_stats
+from app.core.responses import ORJSONResponse
 from app.utils.api_logger import APILogger, log_system_event
 from app.utils.system_monitor import system_monitor
 from app.utils.external_service_logger import external_service_logger
@@ -29,7 +30,14 @@ async def lifespan(app: FastAPI):
         
         # Start system monitoring
         asyncio.create_task(system_monitor.start_monitoring())
-        
+
+        # Build the OpenAPI document now rather than on the first
+        # /openapi.json hit; walking model_json_schema() for every
+        # response model is the slow part and FastAPI caches the result
+        # on the app, so traffic never pays it.
+        app.openapi()
+        log_system_event("OpenAPI Ready", "Schema document pre-built")
+
         # Log startup completion
         log_system_event("Application Ready", "All services initialized")
         logger.info("All services initialized successfully!")
@@ -61,6 +69,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
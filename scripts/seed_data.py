@@ -0,0 +1,176 @@
+"""
+Seed data loader for normalized lookup tables.
+
+Populates the lookup tables (cuisines, meat types, health conditions, ...)
+using batched Core inserts instead of row-at-a-time ``session.add()``.
+One ``INSERT ... VALUES (...)`` per table avoids per-row unit-of-work
+overhead and network round-trips during initial seeding.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import engine
+from app.models.user import (
+    Cuisine,
+    MeatType,
+    HealthCondition,
+    VitaminDeficiency,
+    MealStyle,
+    SpecialNeed,
+    Festival,
+    MealGenerationCriteria,
+)
+
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Default number of rows buffered per executemany flush
+DEFAULT_BATCH_SIZE = 500
+
+
+# Seed rows per lookup model, ordered parent-first so that tables referenced
+# by junction rows are always populated before their children.
+LOOKUP_SEED_DATA = {
+    Cuisine: [
+        {"name": "north_indian", "region": "India"},
+        {"name": "south_indian", "region": "India"},
+        {"name": "chinese", "region": "China"},
+        {"name": "italian", "region": "Italy"},
+        {"name": "mediterranean", "region": "Mediterranean"},
+        {"name": "mexican", "region": "Mexico"},
+        {"name": "thai", "region": "Thailand"},
+        {"name": "continental", "region": "Europe"},
+        {"name": "international", "region": None},
+    ],
+    MeatType: [
+        {"name": "chicken", "category": "poultry"},
+        {"name": "turkey", "category": "poultry"},
+        {"name": "beef", "category": "red_meat"},
+        {"name": "lamb", "category": "red_meat"},
+        {"name": "pork", "category": "red_meat"},
+        {"name": "fish", "category": "seafood"},
+        {"name": "prawns", "category": "seafood"},
+        {"name": "crab", "category": "seafood"},
+    ],
+    HealthCondition: [
+        {"name": "diabetes", "category": "chronic"},
+        {"name": "hypertension", "category": "chronic"},
+        {"name": "heart_disease", "category": "chronic"},
+        {"name": "kidney_disease", "category": "chronic"},
+        {"name": "obesity", "category": "dietary"},
+        {"name": "lactose_intolerance", "category": "dietary"},
+        {"name": "gluten_intolerance", "category": "dietary"},
+        {"name": "food_allergy", "category": "dietary"},
+    ],
+    VitaminDeficiency: [
+        {"name": "B12"},
+        {"name": "D3"},
+        {"name": "Iron"},
+        {"name": "Calcium"},
+        {"name": "Folate"},
+        {"name": "Zinc"},
+    ],
+    MealStyle: [
+        {"name": "healthy"},
+        {"name": "junk"},
+        {"name": "spicy"},
+        {"name": "tasty"},
+        {"name": "traditional"},
+    ],
+    SpecialNeed: [
+        {"name": "pregnancy", "category": "medical"},
+        {"name": "lactation", "category": "medical"},
+        {"name": "elderly_care", "category": "medical"},
+        {"name": "child_nutrition", "category": "dietary"},
+        {"name": "weight_management", "category": "dietary"},
+        {"name": "soft_food_only", "category": "physical"},
+    ],
+    Festival: [
+        {"name": "diwali", "religion": "hindu", "region": "India"},
+        {"name": "holi", "religion": "hindu", "region": "India"},
+        {"name": "eid", "religion": "muslim", "region": None},
+        {"name": "christmas", "religion": "christian", "region": None},
+        {"name": "thanksgiving", "religion": None, "region": "North America"},
+    ],
+    MealGenerationCriteria: [
+        {"name": "stock_based", "description": "Generate meals from available stock"},
+        {"name": "region_based", "description": "Generate meals from current region cuisine"},
+        {"name": "native_based", "description": "Generate meals from native region cuisine"},
+    ],
+}
+
+
+def seed_lookups(engine, data=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Bulk-load lookup tables with batched Core inserts.
+
+    Tables are loaded in the order given by ``data`` (parent tables first),
+    and rows are buffered into per-table batches of ``batch_size`` so each
+    flush becomes a single multi-row INSERT instead of N round-trips.
+
+    Args:
+        engine: SQLAlchemy engine to load into
+        data: mapping of model class -> list of row dicts (defaults to
+              LOOKUP_SEED_DATA)
+        batch_size: number of rows per executemany flush
+
+    Returns:
+        Total number of rows inserted
+    """
+    if data is None:
+        data = LOOKUP_SEED_DATA
+
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    session = session_factory()
+    total_rows = 0
+
+    try:
+        for model, rows in data.items():
+            if not rows:
+                continue
+
+            # Skip tables that already have data (idempotent re-runs).
+            # Core select keeps this on the same batched path as the inserts.
+            existing = session.execute(
+                select(func.count()).select_from(model.__table__)
+            ).scalar()
+            if existing:
+                logger.info(f"⏭️  {model.__tablename__} already seeded ({existing} rows)")
+                continue
+
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start:start + batch_size]
+                session.execute(model.__table__.insert(), batch)
+
+            total_rows += len(rows)
+            logger.info(f"✅ Seeded {len(rows)} rows into {model.__tablename__}")
+
+        session.commit()
+        logger.info(f"✅ Lookup seeding completed: {total_rows} rows")
+        return total_rows
+
+    except Exception as e:
+        session.rollback()
+        logger.error(f"❌ Lookup seeding failed: {e}")
+        raise
+    finally:
+        session.close()
+
+
+def main():
+    """Seed all lookup tables against the configured database."""
+    seed_lookups(engine)
+
+
+if __name__ == "__main__":
+    main()
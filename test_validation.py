@@ -155,12 +155,7 @@ def validate_stock_service_methods():
         enhanced_methods = [
             'get_stock_analytics',
             'get_categorized_stock_summary',
-            '_get_pet_food_analytics',
-            '_get_special_care_analytics',
-            '_get_storage_distribution',
-            '_get_priority_distribution',
-            '_get_health_diet_analytics',
-            '_get_family_assignment_analytics',
+            '_aggregate',
             '_calculate_alert_priority',
             '_calculate_restock_priority'
         ]
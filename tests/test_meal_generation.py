@@ -0,0 +1,85 @@
+"""
+Regression test for the meal generation service path.
+
+The /meals/generate route decodes its body into the msgspec
+structs.MealGenerationRequest; the service must fingerprint and generate
+from that struct directly. A Pydantic-only assumption in the cache-key
+helper once failed every generation request, so this pins the
+struct-in/meals-out contract.
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.factory import get_service_factory
+from app.models.user import Stock, User
+from app.schemas import structs
+
+# Test database setup
+SQLALCHEMY_DATABASE_URL = "sqlite://"
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+TABLES = [
+    Base.metadata.tables[name]
+    for name in ("families", "users", "stocks", "meals")
+]
+
+
+@pytest.fixture(scope="module")
+def session():
+    """Session over an in-memory database with one user and some stock"""
+    Base.metadata.create_all(bind=engine, tables=TABLES)
+    db = TestingSessionLocal()
+
+    user = User(
+        email="generate@example.com",
+        hashed_password="x",
+        first_name="Gen",
+        last_name="Erate",
+        current_address="123 Test Street",
+    )
+    db.add(user)
+    db.flush()
+    db.add(Stock(
+        user_id=user.id,
+        item_name="Spinach",
+        category="vegetables",
+        weight=1.0,
+        calories_per_100g=23.0,
+        protein_per_100g=2.9,
+        fat_per_100g=0.4,
+        fiber_per_100g=2.2,
+        current_quantity=5.0,
+        minimum_quantity=1.0,
+        expiry_date=datetime.now(timezone.utc) + timedelta(days=14),
+    ))
+    db.commit()
+
+    yield db, user.id
+    db.close()
+
+
+def test_generate_meals_accepts_request_struct(session):
+    db, user_id = session
+    service = get_service_factory().get_service("meal")
+    request = structs.MealGenerationRequest(
+        generation_date=date.today(),
+        meal_types=["breakfast", "lunch"],
+        user_id=user_id,
+    )
+
+    result = asyncio.run(service.generate_meals(request, db))
+
+    assert result.success, result.message
+    assert result.data
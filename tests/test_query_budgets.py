@@ -0,0 +1,164 @@
+"""
+Query-budget regression tests for relationship loading strategies.
+
+These pin the SELECT counts of the hot relationship paths so a future
+change back to per-row lazy loading fails loudly instead of shipping as
+an invisible N+1.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.user import Family, Meal, MealFeedback, Stock, User, Vacation
+
+from tests.util.count_queries import count_queries
+
+# Test database setup
+SQLALCHEMY_DATABASE_URL = "sqlite://"
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+TABLES = [
+    Base.metadata.tables[name]
+    for name in ("families", "users", "addresses", "stocks", "meals",
+                 "meal_feedbacks", "vacations")
+]
+
+
+@pytest.fixture(scope="module")
+def session():
+    """Session over a seeded in-memory database"""
+    Base.metadata.create_all(bind=engine, tables=TABLES)
+    db = TestingSessionLocal()
+
+    for i in range(3):
+        family = Family(name=f"Family {i}")
+        db.add(family)
+        db.flush()
+        for j in range(2):
+            user = User(
+                email=f"user{i}{j}@example.com",
+                hashed_password="x",
+                first_name=f"User{j}",
+                last_name=f"Family{i}",
+                current_address="123 Test Street",
+                family_id=family.id,
+            )
+            db.add(user)
+            db.flush()
+            db.add(Stock(
+                user_id=user.id,
+                family_id=family.id,
+                item_name=f"item-{i}-{j}",
+                category="grains",
+                unit="kg",
+                weight=1.0,
+                current_quantity=2.0,
+                minimum_quantity=0.5,
+            ))
+    meal = Meal(
+        user_id=1,
+        name="Test Meal",
+        meal_type="lunch",
+        planned_date=datetime(2025, 9, 1),
+        planned_time="12:30",
+        ingredients=[{"name": "rice", "quantity": 1, "unit": "cup"}],
+    )
+    db.add(meal)
+    db.flush()
+    for user_id in (1, 2):
+        db.add(MealFeedback(meal_id=meal.id, user_id=user_id, rating=4,
+                            feedback_type="like"))
+    db.add(Vacation(
+        user_id=1,
+        start_date=datetime(2025, 10, 1),
+        end_date=datetime(2025, 10, 7),
+        destination="Goa",
+        log_external_meals=True,
+        external_meals=[{"name": "beach shack thali", "meal_type": "lunch"}],
+    ))
+    db.commit()
+    db.expunge_all()
+
+    yield db
+
+    db.close()
+    Base.metadata.drop_all(bind=engine, tables=TABLES)
+
+
+def test_family_members_budget(session):
+    """Listing families loads all members in 2 queries, not 1 per family"""
+    session.expunge_all()
+    with count_queries(engine) as queries:
+        families = session.query(Family).all()
+        members = [user.email for family in families for user in family.members]
+
+    assert len(members) == 6
+    assert len(queries) <= 2, queries
+
+
+def test_stock_owner_budget(session):
+    """Listing stocks pulls owner and family in the same SELECT.
+
+    Budget is 2: the list query itself (user/family joined in), plus the
+    one selectin batch Family fires for its members collection.
+    """
+    session.expunge_all()
+    with count_queries(engine) as queries:
+        stocks = session.query(Stock).all()
+        owners = [(stock.user.email, stock.family.name) for stock in stocks]
+
+    assert len(owners) == 6
+    assert len(queries) <= 2, queries
+
+
+def test_bulk_feedback_insert_budget(session):
+    """Creating a batch of feedback rows is one INSERT, not one per row"""
+    from app.services.bulk_create import bulk_create_feedback
+
+    rows = [
+        {"meal_id": 1, "user_id": 1, "rating": rating, "feedback_type": "like"}
+        for rating in (3, 4, 5)
+    ]
+    with count_queries(engine) as queries:
+        bulk_create_feedback(session, rows)
+    session.rollback()
+
+    inserts = [q for q in queries if q.lstrip().upper().startswith("INSERT")]
+    assert len(inserts) == 1, queries
+
+
+def test_vacation_list_read_path(session):
+    """Vacation listing is one Core SELECT with JSON already decoded"""
+    from app.services.vacation_read import list_vacations
+
+    session.expunge_all()
+    with count_queries(engine) as queries:
+        rows = list_vacations(session, user_id=1)
+
+    assert len(queries) == 1, queries
+    assert len(rows) == 1
+    assert rows[0].destination == "Goa"
+    # The driver hands back a parsed structure, not a JSON string
+    assert rows[0].external_meals[0]["meal_type"] == "lunch"
+
+
+def test_meal_feedback_budget(session):
+    """Feedback listing loads meal and author via selectin batches"""
+    session.expunge_all()
+    with count_queries(engine) as queries:
+        feedback = session.query(MealFeedback).all()
+        details = [(fb.meal.name, fb.user.email, fb.rating) for fb in feedback]
+
+    assert len(details) == 2
+    # 1 list query + 1 selectin batch each for meal and user
+    assert len(queries) <= 3, queries
@@ -0,0 +1,36 @@
+"""
+Query-counting helper for enforcing per-request SQL budgets in tests.
+
+The heavily-related models (User alone carries 13+ relationships) are
+exactly the shape that silently regresses into N+1 lazy-load loops as
+endpoints evolve. Wrapping a block in ``count_queries`` records every
+statement the engine executes, so tests can assert a hard ceiling:
+
+    with count_queries(engine) as queries:
+        response = client.get("/api/v1/users")
+    assert len(queries) <= 5, queries
+"""
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+
+@contextmanager
+def count_queries(target):
+    """
+    Collect SQL statements executed against ``target`` (Engine or Connection).
+
+    Yields a list that accumulates each statement string as it executes;
+    inspect ``len()`` for the budget and the contents for diagnostics.
+    """
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(target, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(target, "before_cursor_execute", _record)